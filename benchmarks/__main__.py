@@ -0,0 +1,73 @@
+"""
+Benchmark CLI: python -m benchmarks {generate,run,compare}.
+"""
+import argparse
+import sys
+from benchmarks.runner import DEFAULT_SIZES, DEFAULT_RESULTS_PATH, DEFAULT_BASELINE_PATH
+
+
+def build_parser():
+    """Build the benchmark argument parser."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    corpus = argparse.ArgumentParser(add_help=False)
+    corpus.add_argument("--vocab-size", type=int, default=10_000)
+    corpus.add_argument("--sentence-length", type=int, default=12)
+    corpus.add_argument("--categories", type=int, default=3)
+    corpus.add_argument("--seed", type=int, default=42)
+
+    generate = commands.add_parser("generate", parents=[corpus], help="Write a synthetic CSV")
+    generate.add_argument("rows", type=int)
+    generate.add_argument("output", help="CSV path to write")
+
+    run = commands.add_parser("run", parents=[corpus], help="Benchmark every stage")
+    run.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    run.add_argument("--output", default=DEFAULT_RESULTS_PATH)
+    run.add_argument("--vectorizer", choices=["word2vec", "hashing"], default="word2vec")
+    run.add_argument("--epochs", type=int, default=5, help="Word2Vec epochs (0 keeps config)")
+    run.add_argument("--tsne-max-rows", type=int, default=5_000)
+    run.add_argument("--plot-max-rows", type=int, default=1_000_000)
+
+    compare = commands.add_parser("compare", help="Flag regressions against a baseline")
+    compare.add_argument("--baseline", default=DEFAULT_BASELINE_PATH)
+    compare.add_argument("--current", default=DEFAULT_RESULTS_PATH)
+    compare.add_argument("--threshold", type=float, default=0.2,
+                         help="Allowed relative increase (0.2 = +20%%)")
+    return parser
+
+
+def main():
+    """Benchmark CLI entry point; compare exits with status 1 on regressions."""
+    args = build_parser().parse_args()
+    if args.command == "generate":
+        from benchmarks.corpus import generate_corpus
+        generate_corpus(args.output, args.rows, args.vocab_size, args.sentence_length,
+                        args.categories, args.seed)
+        print(f"Synthetic corpus ({args.rows} rows) saved to: {args.output}")
+    elif args.command == "run":
+        from benchmarks.runner import run_benchmarks
+        run_benchmarks(
+            args.sizes, args.output, epochs=args.epochs, vocab_size=args.vocab_size,
+            sentence_length=args.sentence_length, categories=args.categories,
+            seed=args.seed, vectorizer=args.vectorizer,
+            tsne_max_rows=args.tsne_max_rows, plot_max_rows=args.plot_max_rows,
+        )
+    else:
+        from benchmarks.compare import compare_results, format_comparison
+        from src.utils.json_io import read_json
+        from src.utils.validators import validate_file_exists
+        validate_file_exists(args.baseline)
+        validate_file_exists(args.current)
+        rows = compare_results(
+            read_json(args.baseline, None), read_json(args.current, None), args.threshold
+        )
+        print(format_comparison(rows))
+        regressions = sum(row["regression"] for row in rows)
+        print(f"\n{regressions} regression(s) beyond +{args.threshold:.0%}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Compare benchmark results against a stored baseline.
+"""
+
+# Metrics compared, with the absolute change below which noise is ignored
+COMPARED_METRICS = {"seconds": 0.05, "peak_rss_delta_mb": 5.0}
+
+
+def compare_results(baseline, current, threshold=0.2):
+    """
+    Compare every stage and size present in both reports.
+
+    A metric regresses when it grows by more than threshold (relative)
+    and by more than its noise floor in COMPARED_METRICS (absolute).
+
+    Args:
+        baseline: Baseline report dict
+        current: Current report dict
+        threshold: Allowed relative increase, e.g. 0.2 for +20%
+
+    Returns:
+        list: One dict per compared metric with size, stage, metric,
+            baseline, current, change and regression flag
+    """
+    rows = []
+    for size, stages in current["results"].items():
+        for stage, metrics in stages.items():
+            base = baseline["results"].get(size, {}).get(stage)
+            if not base or "skipped" in base or "skipped" in metrics:
+                continue
+            for metric, noise_floor in COMPARED_METRICS.items():
+                old, new = base[metric], metrics[metric]
+                change = (new - old) / old if old > 0 else 0.0
+                rows.append({
+                    "size": size, "stage": stage, "metric": metric,
+                    "baseline": old, "current": new, "change": change,
+                    "regression": new - old > max(threshold * abs(old), noise_floor),
+                })
+    return rows
+
+
+def format_comparison(rows):
+    """
+    Format compared metrics as a text table.
+
+    Args:
+        rows: Output of compare_results
+
+    Returns:
+        str: Table with one line per metric, regressions marked
+    """
+    lines = [f"{'rows':>9} {'stage':<22} {'metric':<18} {'baseline':>10} "
+             f"{'current':>10} {'change':>8}"]
+    for row in rows:
+        lines.append(
+            f"{row['size']:>9} {row['stage']:<22} {row['metric']:<18} "
+            f"{row['baseline']:10.4f} {row['current']:10.4f} {row['change']:+8.1%}"
+            + ("  REGRESSION" if row["regression"] else "")
+        )
+    return "\n".join(lines)
@@ -0,0 +1,77 @@
+"""
+Benchmark runner: one fresh process per corpus size, results saved as JSON.
+"""
+import multiprocessing
+import os
+import platform
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+import numpy as np
+from src.utils import config
+from src.utils.json_io import write_json
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+DEFAULT_RESULTS_PATH = os.path.join(config.OUTPUT_DIR, "benchmarks", "latest.json")
+DEFAULT_BASELINE_PATH = os.path.join(config.BASE_DIR, "benchmarks", "baseline.json")
+
+
+def _run_size(rows, work_dir, options):
+    """Generate a corpus and measure every stage on it (runs in a worker)."""
+    from benchmarks.corpus import generate_corpus
+    from benchmarks.stages import run_stages
+
+    if options["epochs"]:
+        config.WORD2VEC_EPOCHS = options["epochs"]
+    csv_path = generate_corpus(
+        os.path.join(work_dir, "corpus.csv"), rows, options["vocab_size"],
+        options["sentence_length"], options["categories"], options["seed"]
+    )
+    return run_stages(
+        csv_path, rows, work_dir, options["vectorizer"],
+        options["tsne_max_rows"], options["plot_max_rows"]
+    )
+
+
+def run_benchmarks(sizes, output_path=DEFAULT_RESULTS_PATH, **options):
+    """
+    Benchmark every stage at each corpus size and save the results.
+
+    Each size runs in a fresh spawned process, so peak RSS and warm caches
+    from one size never leak into the next. Corpus generation is not timed.
+
+    Args:
+        sizes: Corpus sizes in rows
+        output_path: JSON file for the results
+        **options: epochs, vocab_size, sentence_length, categories, seed,
+            vectorizer, tsne_max_rows and plot_max_rows
+
+    Returns:
+        dict: The saved report
+    """
+    results = {}
+    context = multiprocessing.get_context("spawn")
+    for rows in sizes:
+        print(f"\nBenchmarking {rows} rows...")
+        with tempfile.TemporaryDirectory() as work_dir, \
+                ProcessPoolExecutor(1, mp_context=context) as pool:
+            results[str(rows)] = pool.submit(_run_size, rows, work_dir, options).result()
+        for stage, metrics in results[str(rows)].items():
+            if "skipped" in metrics:
+                print(f"  {stage:<22} skipped ({metrics['skipped']})")
+            else:
+                print(f"  {stage:<22} {metrics['seconds']:10.4f} s "
+                      f"{metrics['peak_rss_delta_mb']:+10.1f} MB peak RSS")
+
+    report = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "machine": {
+            "platform": platform.platform(), "python": platform.python_version(),
+            "numpy": np.__version__, "cpus": os.cpu_count(),
+        },
+        "options": options,
+        "results": results,
+    }
+    write_json(output_path, report)
+    print(f"\nBenchmark results saved to: {output_path}")
+    return report
@@ -0,0 +1,93 @@
+"""
+Per-stage timing and peak-memory measurements on one corpus.
+"""
+import os
+from src.data.csv_reader import read_csv_data
+from src.data.vector_io import save_vectors, load_vectors
+from src.preprocessing.vectorizer import vectorize_sentences
+from src.reduction.pca_numpy import compute_pca_numpy
+from src.reduction.pca_sklearn import compute_pca_sklearn
+from src.reduction.tsne import compute_tsne
+from src.utils import config
+from src.utils.memory import RssMonitor, current_rss_mb
+from src.utils.timing import Timer
+
+STAGE_NAMES = [
+    "read_csv_data", "vectorize_sentences", "save_vectors", "load_vectors",
+    "compute_pca_numpy", "compute_pca_sklearn", "compute_tsne", "plot_3d_scatter",
+]
+
+
+def measure(func, *args, rows):
+    """
+    Run a stage once, measuring wall time and process RSS.
+
+    Args:
+        func: Stage function
+        *args: Stage arguments
+        rows: Rows processed, for throughput
+
+    Returns:
+        tuple: (stage result, metrics dict)
+    """
+    start_rss = current_rss_mb()
+    with RssMonitor(interval=0.01) as monitor, Timer() as timer:
+        result = func(*args)
+    seconds = timer.elapsed()
+    return result, {
+        "seconds": seconds,
+        "rows_per_sec": rows / seconds if seconds else None,
+        "peak_rss_mb": monitor.peak_mb,
+        "peak_rss_delta_mb": monitor.peak_mb - start_rss,
+    }
+
+
+def run_stages(csv_path, rows, work_dir, vectorizer="word2vec", tsne_max_rows=5_000,
+               plot_max_rows=1_000_000):
+    """
+    Measure every benchmarked stage on one corpus.
+
+    Stage outputs (vector store, Word2Vec cache, plot, runtime log) go to
+    work_dir, so benchmarks never touch the project's output/ directory.
+
+    Args:
+        csv_path: Corpus CSV
+        rows: Rows in the corpus
+        work_dir: Scratch directory for stage outputs
+        vectorizer: Vectorizer backend name
+        tsne_max_rows: Skip t-SNE above this many rows
+        plot_max_rows: Skip plotting above this many rows
+
+    Returns:
+        dict: Stage name -> metrics dict, or {"skipped": reason}
+    """
+    from src.visualization.plotter import plot_3d_scatter
+
+    config.OUTPUT_WORD2VEC_DIR = os.path.join(work_dir, "word2vec")
+    config.OUTPUT_RUNTIME_PATH = os.path.join(work_dir, "runtime.txt")
+    store_path = os.path.join(work_dir, "vectors.npy")
+    results = {}
+
+    (sentences, categories), results["read_csv_data"] = measure(
+        read_csv_data, csv_path, rows=rows)
+    vectors, results["vectorize_sentences"] = measure(
+        vectorize_sentences, sentences, None, vectorizer, rows=rows)
+    del sentences
+    _, results["save_vectors"] = measure(
+        save_vectors, vectors, categories, store_path, rows=rows)
+    (vectors, categories), results["load_vectors"] = measure(
+        load_vectors, store_path, rows=rows)
+    pca, results["compute_pca_numpy"] = measure(compute_pca_numpy, vectors, rows=rows)
+    _, results["compute_pca_sklearn"] = measure(compute_pca_sklearn, vectors, rows=rows)
+
+    if rows <= tsne_max_rows:
+        _, results["compute_tsne"] = measure(compute_tsne, vectors, rows=rows)
+    else:
+        results["compute_tsne"] = {"skipped": f"{rows} rows > {tsne_max_rows}"}
+    if rows <= plot_max_rows:
+        plot_path = os.path.join(work_dir, f"pca.{config.PLOT_FORMAT}")
+        _, results["plot_3d_scatter"] = measure(
+            plot_3d_scatter, pca, categories, "Benchmark", plot_path, rows=rows)
+    else:
+        results["plot_3d_scatter"] = {"skipped": f"{rows} rows > {plot_max_rows}"}
+    return results
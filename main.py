@@ -1,38 +1,69 @@
 """
 CLI entry point for Dimension Reduction Visualizer.
+
+Workflows are imported inside the dispatch so that heavy libraries
+(gensim, scikit-learn, pandas, matplotlib) load only for the steps that run.
 """
-import argparse
-from src.workflows.prepare import prepare_data
-from src.workflows.pca_workflow import run_pca
-from src.workflows.tsne_workflow import run_tsne_visualization
+import sys
+from src.cli import build_parser
+from src.cli_kwargs import (
+    prepare_kwargs, pca_kwargs, tsne_kwargs, sweep_kwargs, serve_kwargs, batch_kwargs
+)
 
 
 def main():
     """Main CLI function."""
-    parser = argparse.ArgumentParser(
-        description="Dimension Reduction Visualizer"
-    )
-    parser.add_argument("--prepare", action="store_true", help="Prepare data")
-    parser.add_argument("--pca", action="store_true", help="Run PCA")
-    parser.add_argument("--tsne", action="store_true", help="Run t-SNE")
-    parser.add_argument("--all", action="store_true", help="Run all steps")
-
+    parser = build_parser()
     args = parser.parse_args()
 
+    if args.profile_startup:
+        from src.workflows.startup_profile import run_startup_profile
+        run_startup_profile()
+        return
+
+    if args.batch:
+        if args.serve or args.project:
+            parser.error("--batch runs the pipeline steps; it cannot --serve or --project")
+        from src.workflows.batch_workflow import run_batch
+        run_batch(**batch_kwargs(args, sys.argv[1:]))
+        return
+
+    if args.trace_memory:
+        import tracemalloc
+        tracemalloc.start()
+
     if args.all:
-        prepare_data()
-        run_pca()
-        run_tsne_visualization()
+        from src.workflows.pipeline import run_pipeline
+        run_pipeline(prepare_kwargs(args), pca_kwargs(args), tsne_kwargs(args))
     else:
         if args.prepare:
-            prepare_data()
+            from src.workflows.prepare import prepare_data
+            prepare_data(**prepare_kwargs(args))
         if args.pca:
-            run_pca()
+            from src.workflows.pca_workflow import run_pca
+            run_pca(**pca_kwargs(args))
         if args.tsne:
-            run_tsne_visualization()
+            from src.workflows.tsne_workflow import run_tsne_visualization
+            run_tsne_visualization(**tsne_kwargs(args))
+    if args.tsne_sweep:
+        from src.workflows.sweep_workflow import run_tsne_sweep
+        run_tsne_sweep(**sweep_kwargs(args))
+    if args.project:
+        from src.workflows.project_workflow import run_projection
+        run_projection(args.project, force=args.force)
 
-    if not any([args.prepare, args.pca, args.tsne, args.all]):
+    if not any([args.prepare, args.pca, args.tsne, args.all, args.tsne_sweep, args.project,
+                args.serve]):
         parser.print_help()
+        return
+
+    # Plots render in the background; wait for them before exiting or serving
+    from src.visualization.render_service import wait_for_renders
+    wait_for_renders()
+
+    if args.serve:
+        from src.workflows.serve_workflow import run_server
+        run_server(**serve_kwargs(args))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,89 @@
+"""
+Command-line argument definitions.
+"""
+import argparse
+from src.utils import config
+from src.cli_options import add_prepare_options, add_pca_options, add_tsne_options
+
+
+def build_parser():
+    """
+    Build the CLI argument parser.
+
+    Returns:
+        argparse.ArgumentParser: Parser with step and per-stage options
+    """
+    parser = argparse.ArgumentParser(description="Dimension Reduction Visualizer")
+    parser.add_argument("--prepare", action="store_true", help="Prepare data")
+    parser.add_argument("--pca", action="store_true", help="Run PCA")
+    parser.add_argument("--tsne", action="store_true", help="Run t-SNE")
+    parser.add_argument("--all", action="store_true", help="Run all steps")
+    parser.add_argument(
+        "--tsne-sweep", action="store_true",
+        help="Run t-SNE for every --perplexities/--seeds pair in parallel"
+    )
+    parser.add_argument(
+        "--project", metavar="CSV",
+        help="Project new sentences with the saved Word2Vec model and PCA fits"
+    )
+
+    parser.add_argument(
+        "--batch", metavar="GLOB",
+        help="Run the selected steps (default --all) for every matching CSV"
+    )
+    parser.add_argument(
+        "--batch-workers", type=int, default=config.BATCH_WORKERS,
+        help="Datasets processed at once by --batch"
+    )
+    parser.add_argument(
+        "--serve", action="store_true",
+        help="Run a local HTTP server placing new sentences in the saved maps"
+    )
+
+    parser.add_argument(
+        "--profile-startup", action="store_true",
+        help="Report per-module import cost of each CLI path and exit"
+    )
+    parser.add_argument(
+        "--trace-memory", action="store_true",
+        help="Record tracemalloc allocation deltas per profiling span (slower)"
+    )
+    parser.add_argument(
+        "--force", action="store_true",
+        help="Rerun stages even when their inputs and parameters are unchanged"
+    )
+
+    add_prepare_options(parser)
+    add_pca_options(parser)
+    add_tsne_options(parser)
+    add_plot_options(parser)
+    add_serve_options(parser)
+    return parser
+
+
+def add_plot_options(parser):
+    """Add plotting options to the parser."""
+    plot = parser.add_argument_group("plotting")
+    plot.add_argument(
+        "--plot-budget", type=int, default=config.PLOT_POINT_BUDGET,
+        help="Plot at most this many points (stratified by category); vectors files keep all rows"
+    )
+    plot.add_argument(
+        "--plot-density-bins", type=int, default=config.PLOT_DENSITY_BINS,
+        help="Summarize points beyond the budget as a density grid with this many voxels per axis"
+    )
+
+
+def add_serve_options(parser):
+    """Add embedding server options to the parser."""
+    serve = parser.add_argument_group("server")
+    serve.add_argument("--host", default=config.SERVE_HOST, help="Interface for --serve")
+    serve.add_argument("--port", type=int, default=config.SERVE_PORT, help="Port for --serve")
+    serve.add_argument(
+        "--max-batch", type=int, default=config.SERVE_MAX_BATCH,
+        help="Sentences that close a micro-batch early"
+    )
+    serve.add_argument(
+        "--max-wait-ms", type=float, default=config.SERVE_MAX_WAIT_MS,
+        help="Longest time a micro-batch waits for more requests"
+    )
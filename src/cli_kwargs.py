@@ -0,0 +1,75 @@
+"""
+Mapping of parsed CLI arguments to workflow keyword arguments.
+"""
+
+
+def prepare_kwargs(args):
+    """Map parsed arguments to prepare_data keyword arguments."""
+    return {
+        "export_text": args.export_text,
+        "chunk_size": args.chunk_size if args.stream else None,
+        "train_mode": args.w2v_mode,
+        "vectorizer": args.vectorizer,
+        "incremental": args.incremental,
+        "force": args.force,
+    }
+
+
+def pca_kwargs(args):
+    """Map parsed arguments to run_pca keyword arguments."""
+    return {
+        "numpy_mode": args.pca_numpy,
+        "sklearn_mode": args.pca_sklearn,
+        "batch_size": args.pca_batch_size,
+        "plot_budget": args.plot_budget,
+        "density_bins": args.plot_density_bins,
+        "force": args.force,
+    }
+
+
+def tsne_kwargs(args):
+    """Map parsed arguments to run_tsne_visualization keyword arguments."""
+    return {
+        "mode": args.tsne_mode,
+        "n_landmarks": args.landmarks,
+        "k": args.landmark_k,
+        "pre_reduce": args.pre_reduce,
+        "pre_reduce_dim": args.pre_reduce_dim,
+        "dedup": args.dedup,
+        "plot_budget": args.plot_budget,
+        "density_bins": args.plot_density_bins,
+        "force": args.force,
+    }
+
+
+def sweep_kwargs(args):
+    """Map parsed arguments to run_tsne_sweep keyword arguments."""
+    return {
+        "perplexities": args.perplexities,
+        "seeds": args.seeds,
+        "workers": args.sweep_workers,
+        "force": args.force,
+    }
+
+
+def serve_kwargs(args):
+    """Map parsed arguments to run_server keyword arguments."""
+    return {
+        "host": args.host,
+        "port": args.port,
+        "max_batch": args.max_batch,
+        "max_wait_ms": args.max_wait_ms,
+    }
+
+
+def batch_kwargs(args, argv):
+    """Map parsed arguments to run_batch keyword arguments, forwarding the step options."""
+    step_args, skip = [], False
+    for arg in argv:
+        if skip or arg.split("=")[0] in ("--batch", "--batch-workers"):
+            skip = not skip and "=" not in arg
+            continue
+        step_args.append(arg)
+    if not any([args.prepare, args.pca, args.tsne, args.all, args.tsne_sweep]):
+        step_args.insert(0, "--all")
+    return {"pattern": args.batch, "step_args": step_args, "workers": args.batch_workers}
@@ -0,0 +1,94 @@
+"""
+Per-stage CLI option groups.
+"""
+from src.utils import config
+
+
+def add_prepare_options(parser):
+    """Add data preparation options to the parser."""
+    prepare = parser.add_argument_group("data preparation")
+    prepare.add_argument(
+        "--export-text", action="store_true",
+        help="Also export prepared vectors as text (vectors.txt)"
+    )
+    prepare.add_argument(
+        "--stream", action="store_true",
+        help="Prepare data by streaming the CSV in chunks"
+    )
+    prepare.add_argument(
+        "--chunk-size", type=int, default=config.CSV_CHUNK_SIZE,
+        help="Rows per chunk in streaming mode"
+    )
+    prepare.add_argument(
+        "--w2v-mode", choices=["memory", "corpus_file"],
+        default=config.WORD2VEC_TRAIN_MODE,
+        help="Word2Vec training input: in-memory iterator or on-disk corpus file"
+    )
+    prepare.add_argument(
+        "--incremental", action="store_true",
+        help="Vectorize only sentences missing from the existing vector store"
+    )
+    prepare.add_argument(
+        "--vectorizer", choices=["word2vec", "hashing"], default=config.VECTORIZER,
+        help="Sentence vectorizer backend"
+    )
+
+
+def add_pca_options(parser):
+    """Add PCA options to the parser."""
+    pca = parser.add_argument_group("PCA")
+    pca.add_argument(
+        "--pca-numpy", choices=["memory", "streaming"], default=config.PCA_NUMPY_MODE,
+        help="NumPy PCA mode: in-memory or out-of-core chunked"
+    )
+    pca.add_argument(
+        "--pca-sklearn", choices=["auto", "randomized", "incremental"],
+        default=config.PCA_SKLEARN_MODE,
+        help="Scikit-learn PCA mode: SVD solver or IncrementalPCA"
+    )
+    pca.add_argument(
+        "--pca-batch-size", type=int, default=config.PCA_BATCH_SIZE,
+        help="Rows per batch for incremental scikit-learn PCA"
+    )
+
+
+def add_tsne_options(parser):
+    """Add t-SNE options to the parser."""
+    tsne = parser.add_argument_group("t-SNE")
+    tsne.add_argument(
+        "--tsne-mode", choices=["full", "landmark"], default=config.TSNE_MODE,
+        help="Embed every row, or landmarks plus kNN interpolation"
+    )
+    tsne.add_argument(
+        "--landmarks", type=int, default=config.TSNE_LANDMARKS,
+        help="Number of stratified landmarks in landmark mode"
+    )
+    tsne.add_argument(
+        "--landmark-k", type=int, default=config.TSNE_LANDMARK_K,
+        help="Nearest landmarks used to place each remaining point"
+    )
+    tsne.add_argument(
+        "--pre-reduce", choices=["gaussian", "sparse", "pca"],
+        default=config.PRE_REDUCE_METHOD,
+        help="Reduce vectors before t-SNE with a random projection or randomized PCA"
+    )
+    tsne.add_argument(
+        "--pre-reduce-dim", type=int, default=config.PRE_REDUCE_DIM,
+        help="Target dimensionality of the pre-reduction"
+    )
+    tsne.add_argument(
+        "--dedup", action="store_true", default=config.TSNE_DEDUP,
+        help="Embed each distinct vector once; duplicate rows share its point"
+    )
+    tsne.add_argument(
+        "--perplexities", type=float, nargs="+", default=[config.TSNE_PERPLEXITY],
+        help="Perplexities tried by --tsne-sweep"
+    )
+    tsne.add_argument(
+        "--seeds", type=int, nargs="+", default=[42],
+        help="Random seeds tried by --tsne-sweep"
+    )
+    tsne.add_argument(
+        "--sweep-workers", type=int, default=config.TSNE_SWEEP_WORKERS,
+        help="Worker processes for --tsne-sweep"
+    )
@@ -4,6 +4,8 @@ CSV file reading utilities.
 import pandas as pd
 from src.utils.validators import validate_file_exists
 
+REQUIRED_COLUMNS = ("category", "sentence")
+
 
 def read_csv_data(file_path):
     """
@@ -19,17 +21,69 @@ def read_csv_data(file_path):
         FileNotFoundError: If CSV file doesn't exist
         ValueError: If CSV format is invalid
     """
+    columns = read_columns(file_path)
+    df = pd.read_csv(file_path, usecols=list(columns.values()))
+    sentences = df[columns["sentence"]].tolist()
+    categories = df[columns["category"]].tolist()
+    return sentences, categories
+
+
+def iter_csv_chunks(file_path, chunk_size):
+    """
+    Stream sentences and categories from CSV file in chunks.
+
+    Only the two required columns are parsed, so peak memory depends on
+    chunk_size rather than on the size of the file or its other columns.
+
+    Args:
+        file_path: Path to CSV file
+        chunk_size: Number of rows per chunk
+
+    Yields:
+        tuple: (sentences, categories) as lists for each chunk
+
+    Raises:
+        FileNotFoundError: If CSV file doesn't exist
+        ValueError: If CSV format is invalid
+    """
+    columns = read_columns(file_path)
+    reader = pd.read_csv(file_path, usecols=list(columns.values()), chunksize=chunk_size)
+    for chunk in reader:
+        yield chunk[columns["sentence"]].tolist(), chunk[columns["category"]].tolist()
+
+
+def read_columns(file_path):
+    """
+    Read a CSV header and resolve the required columns (see validate_columns).
+
+    Args:
+        file_path: Path to CSV file
+
+    Raises:
+        FileNotFoundError: If CSV file doesn't exist
+        ValueError: If a required column is missing
+    """
     validate_file_exists(file_path)
+    return validate_columns(pd.read_csv(file_path, nrows=0).columns)
 
-    df = pd.read_csv(file_path)
 
-    if "category" not in df.columns or "sentence" not in df.columns:
-        raise ValueError("CSV must have 'category' and 'sentence' columns")
+def validate_columns(columns):
+    """
+    Resolve the required columns by name, in any order and letter case.
 
-    sentences = df["sentence"].tolist()
-    categories = df["category"].tolist()
+    Args:
+        columns: Column names read from the CSV header
 
-    return sentences, categories
+    Returns:
+        dict: Required column name -> column name in the header
+
+    Raises:
+        ValueError: If a required column is missing
+    """
+    by_name = {str(column).strip().lower(): column for column in columns}
+    if any(name not in by_name for name in REQUIRED_COLUMNS):
+        raise ValueError("CSV must have 'category' and 'sentence' columns")
+    return {name: by_name[name] for name in REQUIRED_COLUMNS}
 
 
 def get_unique_categories(categories):
@@ -0,0 +1,81 @@
+"""
+Row fingerprint index stored alongside the vector store.
+"""
+import hashlib
+import os
+import numpy as np
+from src.utils.json_io import read_json, write_json
+
+
+def rows_path_for(file_path):
+    """Return the fingerprint file that accompanies a binary store."""
+    return os.path.splitext(file_path)[0] + "_rows.npy"
+
+
+def params_path_for(file_path):
+    """Return the vectorizer-parameter record that accompanies a binary store."""
+    return os.path.splitext(file_path)[0] + "_params.json"
+
+
+def sentence_fingerprints(sentences):
+    """
+    Hash every sentence to a 64-bit fingerprint.
+
+    Args:
+        sentences: Iterable of sentence strings
+
+    Returns:
+        NumPy array: uint64 fingerprint per sentence
+    """
+    return np.fromiter(
+        (int.from_bytes(hashlib.blake2b(sentence.encode(), digest_size=8).digest(), "little")
+         for sentence in sentences),
+        dtype=np.uint64
+    )
+
+
+def save_row_index(file_path, fingerprints, params):
+    """
+    Save the per-row fingerprints and the parameters the vectors were built with.
+
+    Args:
+        file_path: Vector store path
+        fingerprints: uint64 fingerprint per stored row
+        params: JSON-serializable dict (vectorizer, parameter digest, model key)
+    """
+    np.save(rows_path_for(file_path), np.asarray(fingerprints, dtype=np.uint64))
+    write_json(params_path_for(file_path), params)
+
+
+def load_row_index(file_path):
+    """
+    Load a store's row index.
+
+    Args:
+        file_path: Vector store path
+
+    Returns:
+        tuple: (fingerprints, params), or (None, None) if there is no index
+    """
+    if not (os.path.exists(rows_path_for(file_path)) and os.path.exists(file_path)):
+        return None, None
+    return np.load(rows_path_for(file_path)), read_json(params_path_for(file_path), None)
+
+
+def match_rows(stored, fingerprints):
+    """
+    Find each fingerprint's row in the stored fingerprints.
+
+    Args:
+        stored: Fingerprints of the stored rows
+        fingerprints: Fingerprints to look up
+
+    Returns:
+        NumPy array: Stored row index per fingerprint, -1 where unseen
+    """
+    if len(stored) == 0:
+        return np.full(len(fingerprints), -1)
+    order = np.argsort(stored, kind="stable")
+    positions = np.minimum(np.searchsorted(stored[order], fingerprints), len(stored) - 1)
+    rows = order[positions]
+    return np.where(stored[rows] == fingerprints, rows, -1)
@@ -2,11 +2,31 @@
 Vector save and load operations.
 """
 import numpy as np
+from src.data.vector_store import (
+    is_binary_store, load_vector_store, save_vector_store
+)
 from src.utils.validators import validate_file_exists, validate_directory_exists
 import os
 
 
 def save_vectors(vectors, categories, file_path):
+    """
+    Save vectors with category labels.
+
+    A ``.npy`` path writes the binary store; any other path writes text.
+
+    Args:
+        vectors: NumPy array of vectors
+        categories: List of category labels
+        file_path: Output file path
+    """
+    if file_path.endswith(".npy"):
+        save_vector_store(vectors, categories, file_path)
+    else:
+        export_vectors_text(vectors, categories, file_path)
+
+
+def export_vectors_text(vectors, categories, file_path):
     """
     Save vectors to text file with category labels.
 
@@ -25,7 +45,9 @@ def save_vectors(vectors, categories, file_path):
 
 def load_vectors(file_path):
     """
-    Load vectors from text file.
+    Load vectors from a binary store or text file.
+
+    Binary stores are memory-mapped read-only, so no copy is made.
 
     Args:
         file_path: Input file path
@@ -38,6 +60,9 @@ def load_vectors(file_path):
     """
     validate_file_exists(file_path)
 
+    if is_binary_store(file_path):
+        return load_vector_store(file_path)
+
     vectors = []
     categories = []
 
@@ -0,0 +1,99 @@
+"""
+Binary vector store: float32 .npy matrix plus a label file.
+"""
+import os
+import numpy as np
+from numpy.lib import format as npy_format
+from src.utils.validators import validate_file_exists, validate_directory_exists
+
+STORE_DTYPE = np.float32
+
+
+def labels_path_for(file_path):
+    """Return the label file path that accompanies a binary store."""
+    return os.path.splitext(file_path)[0] + "_labels.txt"
+
+
+def is_binary_store(file_path):
+    """Check whether a file starts with the .npy magic string."""
+    with open(file_path, "rb") as f:
+        return f.read(len(npy_format.MAGIC_PREFIX)) == npy_format.MAGIC_PREFIX
+
+
+class VectorStoreWriter:
+    """
+    Append rows to a binary store without holding them all in memory.
+
+    The .npy header reserves room for the row count to grow, so it is
+    rewritten in place on close once the final shape is known.
+    """
+
+    def __init__(self, file_path, append=False):
+        validate_directory_exists(os.path.dirname(file_path))
+        self.file_path = file_path
+        self.n_rows = 0
+        self.n_features = None
+        if append:
+            with open(file_path, "rb") as f:
+                npy_format.read_magic(f)
+                shape, _, _ = npy_format.read_array_header_1_0(f)
+            self.n_rows, self.n_features = shape
+            self._data = open(file_path, "r+b")
+            self._data.seek(0, os.SEEK_END)
+        else:
+            self._data = open(file_path, "wb")
+            self._write_header()
+        self._labels = open(labels_path_for(file_path), "a" if append else "w")
+
+    def _write_header(self):
+        self._data.seek(0)
+        npy_format.write_array_header_1_0(self._data, {
+            "descr": npy_format.dtype_to_descr(np.dtype(STORE_DTYPE)),
+            "fortran_order": False,
+            "shape": (self.n_rows, self.n_features or 0),
+        })
+
+    def append(self, vectors, categories):
+        """Write a batch of vectors and their category labels."""
+        vectors = np.ascontiguousarray(vectors, dtype=STORE_DTYPE)
+        if self.n_features is None:
+            self.n_features = vectors.shape[1]
+        elif vectors.shape[1] != self.n_features:
+            raise ValueError(
+                f"Expected {self.n_features} features, got {vectors.shape[1]}"
+            )
+        self._data.write(vectors.tobytes())
+        self._labels.writelines(f"{category}\n" for category in categories)
+        self.n_rows += len(vectors)
+
+    def close(self):
+        """Finalize the header and close both files."""
+        self._write_header()
+        self._data.close()
+        self._labels.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def save_vector_store(vectors, categories, file_path):
+    """Save vectors and labels as a binary store."""
+    with VectorStoreWriter(file_path) as writer:
+        writer.append(vectors, categories)
+
+
+def load_vector_store(file_path):
+    """
+    Open a binary store as a read-only memory map.
+
+    Returns:
+        tuple: (memory-mapped float32 array, categories as list)
+    """
+    validate_file_exists(file_path)
+    vectors = np.load(file_path, mmap_mode="r")
+    with open(labels_path_for(file_path), "r") as f:
+        categories = f.read().splitlines()
+    return vectors, categories
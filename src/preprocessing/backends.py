@@ -0,0 +1,63 @@
+"""
+Pluggable sentence vectorizer backends.
+"""
+from collections import namedtuple
+from functools import partial
+from src.preprocessing.sparse_average import average_word_vectors
+
+# fit(tokenized_corpus, train_mode) -> model
+# transform(tokenized_sentences, model) -> NumPy array of sentence vectors
+# Backend dependencies (gensim, scikit-learn) load only when a backend is used
+VectorizerBackend = namedtuple("VectorizerBackend", ["label", "fit", "transform"])
+
+
+def _fit_word2vec(tokenized_sentences, train_mode=None):
+    """Load or train a cached Word2Vec model."""
+    from src.preprocessing.model_cache import load_or_train_word2vec
+    from src.preprocessing.word2vec_trainer import train_word2vec
+
+    return load_or_train_word2vec(
+        tokenized_sentences, partial(train_word2vec, mode=train_mode)
+    )
+
+
+def _fit_hashing(tokenized_sentences, train_mode=None):
+    """Fit the hashing TF-IDF + SVD model."""
+    from src.preprocessing.hashing_svd import fit_hashing_svd
+
+    return fit_hashing_svd(tokenized_sentences, train_mode)
+
+
+def _transform_hashing(tokenized_sentences, model):
+    """Vectorize sentences with a fitted hashing TF-IDF + SVD model."""
+    from src.preprocessing.hashing_svd import transform_hashing_svd
+
+    return transform_hashing_svd(tokenized_sentences, model)
+
+
+VECTORIZERS = {
+    "word2vec": VectorizerBackend("Word2Vec", _fit_word2vec, average_word_vectors),
+    "hashing": VectorizerBackend(
+        "Hashing TF-IDF + SVD", _fit_hashing, _transform_hashing
+    ),
+}
+
+
+def get_vectorizer(name):
+    """
+    Look up a vectorizer backend by name.
+
+    Args:
+        name: Backend name (a key of VECTORIZERS)
+
+    Returns:
+        VectorizerBackend: The backend
+
+    Raises:
+        ValueError: If the backend is unknown
+    """
+    if name not in VECTORIZERS:
+        raise ValueError(
+            f"Unknown vectorizer '{name}', choose from {sorted(VECTORIZERS)}"
+        )
+    return VECTORIZERS[name]
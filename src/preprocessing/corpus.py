@@ -0,0 +1,65 @@
+"""
+Tokenization and restartable corpus iterables.
+"""
+import itertools
+import os
+from src.data.csv_reader import iter_csv_chunks
+from src.utils.validators import validate_directory_exists
+
+
+def tokenize_sentences(sentences):
+    """
+    Tokenize sentences into words.
+
+    Args:
+        sentences: List of sentence strings
+
+    Returns:
+        list: List of tokenized sentences
+    """
+    return [sentence.lower().split() for sentence in sentences]
+
+
+class CsvTokenCorpus:
+    """
+    Iterable of tokenized sentences read chunk by chunk from a CSV file.
+
+    Word2Vec iterates its corpus once per epoch, so each iteration
+    re-reads the file instead of keeping the sentences in memory.
+    """
+
+    def __init__(self, file_path, chunk_size):
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+
+    def __iter__(self):
+        for sentences, _ in iter_csv_chunks(self.file_path, self.chunk_size):
+            yield from tokenize_sentences(sentences)
+
+
+class CorpusTail:
+    """Restartable view of a corpus that skips its first rows."""
+
+    def __init__(self, corpus, start):
+        self.corpus = corpus
+        self.start = start
+
+    def __iter__(self):
+        return itertools.islice(iter(self.corpus), self.start, None)
+
+
+def write_corpus_file(corpus, file_path):
+    """
+    Write a tokenized corpus in LineSentence format (one sentence per line).
+
+    Args:
+        corpus: Iterable of tokenized sentences
+        file_path: Output file path
+
+    Returns:
+        str: The written file path
+    """
+    validate_directory_exists(os.path.dirname(file_path))
+    with open(file_path, "w") as f:
+        f.writelines(" ".join(tokens) + "\n" for tokens in corpus)
+    return file_path
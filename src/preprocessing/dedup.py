@@ -0,0 +1,79 @@
+"""
+Exact-duplicate detection so repeated sentences are processed once.
+"""
+import numpy as np
+from src.utils import config
+from src.utils.timing import log_runtime_note
+
+
+def normalize_sentence(sentence):
+    """
+    Normalize a sentence the way tokenization sees it.
+
+    Sentences with equal normalized forms tokenize identically, so they
+    get identical vectors.
+
+    Args:
+        sentence: Sentence string
+
+    Returns:
+        str: Lower-cased sentence with whitespace collapsed
+    """
+    return " ".join(sentence.lower().split())
+
+
+def dedup_sentences(sentences):
+    """
+    Find the distinct sentences and map every row back to one of them.
+
+    Args:
+        sentences: List of sentence strings
+
+    Returns:
+        tuple: (row of each distinct sentence's first occurrence,
+            index into those rows for every sentence)
+    """
+    unique_index, rows = {}, []
+    inverse = np.empty(len(sentences), dtype=np.int64)
+    for row, sentence in enumerate(sentences):
+        key = normalize_sentence(sentence)
+        index = unique_index.get(key)
+        if index is None:
+            index = unique_index[key] = len(rows)
+            rows.append(row)
+        inverse[row] = index
+    return np.asarray(rows, dtype=np.int64), inverse
+
+
+def dedup_rows(vectors):
+    """
+    Find the distinct rows of a matrix, in order of first occurrence.
+
+    Args:
+        vectors: 2D NumPy array
+
+    Returns:
+        tuple: (row of each distinct vector's first occurrence,
+            index into those rows for every row)
+    """
+    vectors = np.ascontiguousarray(vectors)
+    keys = vectors.view(np.dtype((np.void, vectors.dtype.itemsize * vectors.shape[1])))
+    _, first, inverse = np.unique(keys.ravel(), return_index=True, return_inverse=True)
+    order = np.argsort(first)
+    remap = np.empty_like(order)
+    remap[order] = np.arange(len(order))
+    return first[order], remap[inverse.ravel()]
+
+
+def report_dedup(label, n_rows, n_unique):
+    """
+    Log how many rows were duplicates.
+
+    Args:
+        label: Stage that deduplicated its input
+        n_rows: Rows before deduplication
+        n_unique: Distinct rows processed
+    """
+    ratio = 1 - n_unique / n_rows if n_rows else 0.0
+    note = f"Dedup ({label}): {n_rows} rows -> {n_unique} unique ({ratio:.1%} duplicates)"
+    log_runtime_note(note, config.OUTPUT_RUNTIME_PATH)
@@ -0,0 +1,75 @@
+"""
+Training-free sentence vectors: hashed TF-IDF reduced by randomized SVD.
+"""
+import itertools
+import numpy as np
+from sklearn.decomposition import TruncatedSVD
+from sklearn.feature_extraction.text import HashingVectorizer, TfidfTransformer
+from src.utils import config
+
+
+def _identity(tokens):
+    """Analyzer for input that is already tokenized."""
+    return tokens
+
+
+def _hasher():
+    return HashingVectorizer(
+        analyzer=_identity,
+        n_features=config.HASHING_N_FEATURES,
+        alternate_sign=False,
+        norm=None
+    )
+
+
+def fit_hashing_svd(tokenized_sentences, train_mode=None):
+    """
+    Fit IDF weights and a randomized truncated SVD on a corpus sample.
+
+    Only the first HASHING_SVD_FIT_ROWS sentences are used, so fitting
+    cost is bounded no matter how large the corpus is. Hash buckets that
+    never occur in the sample are dropped before the SVD, which would
+    otherwise draw a dense random matrix over every bucket.
+
+    Args:
+        tokenized_sentences: Re-iterable of tokenized sentences
+        train_mode: Ignored; accepted for backend interface compatibility
+
+    Returns:
+        tuple: (used hash columns, fitted TfidfTransformer, fitted TruncatedSVD)
+    """
+    sample = list(itertools.islice(tokenized_sentences, config.HASHING_SVD_FIT_ROWS))
+    hashed = _hasher().transform(sample)
+    columns = np.unique(hashed.indices)
+    tfidf = TfidfTransformer(sublinear_tf=True)
+    weighted = tfidf.fit_transform(hashed[:, columns])
+
+    n_components = min(config.WORD2VEC_VECTOR_SIZE, len(sample), len(columns))
+    svd = TruncatedSVD(
+        n_components=n_components, algorithm="randomized", random_state=42
+    )
+    svd.fit(weighted)
+    return columns, tfidf, svd
+
+
+def transform_hashing_svd(tokenized_sentences, model):
+    """
+    Project sentences onto the fitted SVD components.
+
+    Args:
+        tokenized_sentences: List of tokenized sentences
+        model: Tuple returned by fit_hashing_svd
+
+    Returns:
+        NumPy array: Matrix of sentence vectors (n, WORD2VEC_VECTOR_SIZE)
+    """
+    columns, tfidf, svd = model
+    hashed = _hasher().transform(tokenized_sentences)[:, columns]
+    reduced = svd.transform(tfidf.transform(hashed))
+
+    # Pad when the fit sample was too small for the full vector size
+    vectors = np.zeros(
+        (len(tokenized_sentences), config.WORD2VEC_VECTOR_SIZE), dtype=np.float32
+    )
+    vectors[:, :reduced.shape[1]] = reduced
+    return vectors
@@ -0,0 +1,87 @@
+"""
+Content-addressed Word2Vec model cache with incremental updates.
+"""
+import hashlib
+import os
+from gensim.models import Word2Vec
+from src.preprocessing.model_index import latest_word2vec_key, model_path, read_index, save_index
+from src.preprocessing.store_params import store_model_key
+from src.preprocessing.word2vec_trainer import update_word2vec
+from src.utils import config
+from src.utils.hashing import hash_params, hash_token_corpus
+from src.utils.timing import log_runtime_note
+from src.utils.validators import validate_directory_exists
+
+
+def _params_digest():
+    """Hash the WORD2VEC_* settings that define the model (not how it trains)."""
+    return hash_params({
+        name: getattr(config, name) for name in dir(config)
+        if name.startswith("WORD2VEC_")
+        and name not in ("WORD2VEC_WORKERS", "WORD2VEC_TRAIN_MODE")
+    })
+
+
+def load_or_train_word2vec(corpus, train):
+    """
+    Return a Word2Vec model for the corpus, reusing cached models.
+
+    An identical corpus loads the cached model with memory-mapped vectors.
+    A corpus that extends a cached one updates that model's vocabulary and
+    trains on the new rows only. Anything else is trained from scratch.
+
+    Args:
+        corpus: Re-iterable of tokenized sentences
+        train: Function that trains a new model from a corpus
+
+    Returns:
+        Word2Vec: Trained model
+    """
+    validate_directory_exists(config.OUTPUT_WORD2VEC_DIR)
+    params = _params_digest()
+    index, pinned = read_index(), {store_model_key()}
+    # Candidate base models keyed by (rows, prefix digest), so equal lengths don't collide
+    cached = {(e["n_sentences"], e["corpus"]): key for key, e in index["models"].items()
+              if e["params"] == params and os.path.exists(model_path(key))}
+    digest, n_rows, prefixes = hash_token_corpus(corpus, {n for n, _ in cached})
+    key = hashlib.sha256((params + digest).encode()).hexdigest()[:16]
+
+    if key in index["models"] and os.path.exists(model_path(key)):
+        log_runtime_note(f"Word2Vec cache: hit ({key})", config.OUTPUT_RUNTIME_PATH)
+        save_index(index, key, pinned)
+        return Word2Vec.load(model_path(key), mmap="r")
+
+    base = max((n for n, digest_at in prefixes.items()
+                if n < n_rows and (n, digest_at) in cached), default=None)
+    if base:
+        model = Word2Vec.load(model_path(cached[(base, prefixes[base])]))
+        update_word2vec(model, corpus, base, n_rows)
+        note = f"incremental update (+{n_rows - base} sentences)"
+    else:
+        model = train(corpus)
+        note = "miss, trained from scratch"
+    log_runtime_note(f"Word2Vec cache: {note} ({key})", config.OUTPUT_RUNTIME_PATH)
+
+    model.save(model_path(key), sep_limit=0)
+    index["models"][key] = {"params": params, "corpus": digest, "n_sentences": n_rows}
+    save_index(index, key, pinned)
+    return model
+
+
+def load_latest_word2vec(key=None):
+    """
+    Load a cached model (the most recently used by default), memory-mapped.
+
+    Args:
+        key: Optional cache key of a specific model
+
+    Returns:
+        Word2Vec: Cached model
+
+    Raises:
+        FileNotFoundError: If the model isn't cached
+    """
+    key = key or latest_word2vec_key()
+    if key is None or not os.path.exists(model_path(key)):
+        raise FileNotFoundError("No cached Word2Vec model found, run --prepare first")
+    return Word2Vec.load(model_path(key), mmap="r")
@@ -0,0 +1,52 @@
+"""
+Index of cached Word2Vec models: file paths, recency and eviction.
+"""
+import glob
+import os
+import time
+from src.utils import config
+from src.utils.json_io import read_json, write_json
+
+
+def index_path():
+    """Return the path of the model cache index."""
+    return os.path.join(config.OUTPUT_WORD2VEC_DIR, "index.json")
+
+
+def model_path(key):
+    """Return the path of a cached model."""
+    return os.path.join(config.OUTPUT_WORD2VEC_DIR, f"{key}.model")
+
+
+def read_index():
+    """Read the model cache index (empty if there is none yet)."""
+    return read_json(index_path(), {"models": {}})
+
+
+def save_index(index, key, pinned=(), max_entries=config.MODEL_CACHE_MAX_ENTRIES):
+    """
+    Mark a model as the latest used, evict the oldest models and save the index.
+
+    Every incremental update saves a full model copy, so without eviction
+    the cache grows with each appended corpus.
+
+    Args:
+        index: Index dict ({"models": {key: entry}, "latest": key})
+        key: Cache key of the model just loaded or saved
+        pinned: Keys never evicted, such as the model the vector store was built with
+        max_entries: Models kept; the least recently used are deleted
+    """
+    index["latest"] = key
+    index["models"][key]["used"] = time.time()
+    stale = sorted((other for other in index["models"] if other != key and other not in pinned),
+                   key=lambda other: index["models"][other].get("used", 0))
+    for old in stale[:max(0, len(index["models"]) - max_entries)]:
+        for path in glob.glob(model_path(old) + "*"):  # the model and its .npy arrays
+            os.remove(path)
+        del index["models"][old]
+    write_json(index_path(), index)
+
+
+def latest_word2vec_key():
+    """Return the cache key of the most recently used model, or None."""
+    return read_json(index_path(), {}).get("latest")
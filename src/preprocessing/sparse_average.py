@@ -0,0 +1,56 @@
+"""
+Batched sentence averaging through a sparse token-count matrix.
+"""
+import numpy as np
+from scipy import sparse
+
+
+def build_count_matrix(tokenized, key_to_index):
+    """
+    Build a CSR sentence-by-vocabulary token count matrix.
+
+    Out-of-vocabulary tokens are dropped, matching the per-sentence path.
+
+    Args:
+        tokenized: List of tokenized sentences
+        key_to_index: Mapping from word to vocabulary row
+
+    Returns:
+        scipy.sparse.csr_matrix: Counts of shape (n_sentences, vocab_size)
+    """
+    lookup = key_to_index.get
+    token_ids = np.fromiter(
+        (lookup(word, -1) for sentence in tokenized for word in sentence),
+        dtype=np.int64
+    )
+    lengths = np.fromiter((len(sentence) for sentence in tokenized), dtype=np.int64)
+    rows = np.repeat(np.arange(len(tokenized)), lengths)
+
+    known = token_ids >= 0
+    counts = np.ones(known.sum(), dtype=np.float32)
+    return sparse.csr_matrix(
+        (counts, (rows[known], token_ids[known])),
+        shape=(len(tokenized), len(key_to_index))
+    )
+
+
+def average_word_vectors(tokenized, model):
+    """
+    Average word vectors of every sentence with one sparse matmul.
+
+    Sentences without any in-vocabulary word get a zero vector.
+
+    Args:
+        tokenized: List of tokenized sentences
+        model: Trained Word2Vec model
+
+    Returns:
+        NumPy array: Matrix of sentence vectors (n_sentences, vector_size)
+    """
+    counts = build_count_matrix(tokenized, model.wv.key_to_index)
+    sums = np.asarray(counts @ model.wv.vectors, dtype=np.float32)
+
+    n_words = np.asarray(counts.sum(axis=1)).ravel()
+    nonempty = n_words > 0
+    sums[nonempty] /= n_words[nonempty, None]
+    return sums
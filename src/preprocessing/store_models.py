@@ -0,0 +1,33 @@
+"""
+Models and artifacts that place new sentences in the vector store's space.
+"""
+from src.preprocessing.store_params import load_store_word2vec, store_identity
+
+
+def load_store_models(artifacts):
+    """
+    Load the store's Word2Vec model and the artifacts fitted on the store.
+
+    Every artifact is checked before the model is loaded, so a stale one
+    fails fast instead of silently placing sentences in the wrong space.
+
+    Args:
+        artifacts: Dict of name -> (loader, file path, step that refits it)
+
+    Returns:
+        tuple: (Word2Vec model, dict of name -> loaded artifact)
+
+    Raises:
+        FileNotFoundError: If the store's model or an artifact is missing
+        ValueError: If the store or an artifact comes from another vectorizer
+            or model
+    """
+    source = store_identity()
+    loaded = {}
+    for name, (load, file_path, step) in artifacts.items():
+        loaded[name] = load(file_path)
+        fitted = str(loaded[name]["source"]) if "source" in loaded[name] else ""
+        if fitted != source:
+            raise ValueError(f"{file_path} was fitted on vectors from '{fitted or 'unknown'}', "
+                             f"but the vector store now comes from '{source}'; rerun {step}")
+    return load_store_word2vec(), loaded
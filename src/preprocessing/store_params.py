@@ -0,0 +1,82 @@
+"""
+Parameters a vector store depends on, recorded next to its row index.
+"""
+from src.data.row_index import params_path_for, save_row_index
+from src.preprocessing.model_index import latest_word2vec_key
+from src.utils import config
+from src.utils.hashing import hash_params
+from src.utils.json_io import read_json
+
+
+def vectorizer_params(vectorizer):
+    """Describe what the stored vectors depend on: backend, parameters and model."""
+    settings = {
+        name: getattr(config, name) for name in dir(config)
+        if name.startswith(("WORD2VEC_", "HASHING_"))
+        and name not in ("WORD2VEC_WORKERS", "WORD2VEC_TRAIN_MODE")
+    }
+    return {
+        "vectorizer": vectorizer,
+        "params": hash_params({"vectorizer": vectorizer, **settings}),
+        "model": latest_word2vec_key() if vectorizer == "word2vec" else None,
+    }
+
+
+def record_row_index(fingerprints, vectorizer):
+    """Save the row index after a full build of the vector store."""
+    save_row_index(config.OUTPUT_VECTORS_PATH, fingerprints, vectorizer_params(vectorizer))
+
+
+def store_identity():
+    """
+    Identify the vectorizer behind the current vector store.
+
+    Artifacts fitted on the store (PCA projections, t-SNE landmarks) save
+    this, so they can be rejected once the store is rebuilt differently.
+
+    Returns:
+        str: "backend:parameter digest:model key", or None if unrecorded
+    """
+    params = read_json(params_path_for(config.OUTPUT_VECTORS_PATH), None)
+    if params is None:
+        return None
+    return f"{params['vectorizer']}:{params['params'][:16]}:{params['model']}"
+
+
+def store_model_key():
+    """Return the cache key of the Word2Vec model the vector store was built with, or None."""
+    return read_json(params_path_for(config.OUTPUT_VECTORS_PATH), {}).get("model")
+
+
+def load_store_word2vec():
+    """
+    Load exactly the Word2Vec model the current vector store was built with.
+
+    New sentences must be vectorized with that model to land in the same
+    space as the stored vectors and everything fitted on them.
+
+    Returns:
+        Word2Vec: The store's model, memory-mapped
+
+    Raises:
+        FileNotFoundError: If the store has no recorded parameters, or its
+            model is no longer in the cache
+        ValueError: If the store was built with another vectorizer backend
+    """
+    from src.preprocessing.model_cache import load_latest_word2vec
+
+    params = read_json(params_path_for(config.OUTPUT_VECTORS_PATH), None)
+    if params is None:
+        raise FileNotFoundError("No vector store parameters found, run --prepare first")
+    if params["vectorizer"] != "word2vec" or not params["model"]:
+        raise ValueError(
+            f"The vector store was built with the {params['vectorizer']} vectorizer; "
+            "placing new sentences needs a store prepared with --vectorizer word2vec"
+        )
+    try:
+        return load_latest_word2vec(params["model"])
+    except FileNotFoundError:
+        raise FileNotFoundError(
+            f"Word2Vec model {params['model']} that built the vector store is no longer "
+            "cached, run --prepare again"
+        ) from None
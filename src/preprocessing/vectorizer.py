@@ -1,79 +1,59 @@
 """
-Sentence to vector conversion using Word2Vec.
+Sentence to vector conversion with the selected vectorizer backend.
 """
-import numpy as np
-from gensim.models import Word2Vec
+from src.preprocessing.backends import get_vectorizer
+from src.preprocessing.corpus import tokenize_sentences
+from src.preprocessing.dedup import dedup_sentences, report_dedup
 from src.utils import config
+from src.utils.spans import Span
 
 
-def tokenize_sentences(sentences):
+def transform_distinct(backend, sentences, model, dedup=config.VECTORIZER_DEDUP):
     """
-    Tokenize sentences into words.
+    Vectorize sentences with a fitted model, each distinct sentence once.
 
     Args:
+        backend: VectorizerBackend
         sentences: List of sentence strings
+        model: Model fitted by the backend
+        dedup: If False, vectorize every row
 
     Returns:
-        list: List of tokenized sentences
+        tuple: (matrix of sentence vectors, number of sentences vectorized)
     """
-    return [sentence.lower().split() for sentence in sentences]
+    if not dedup:
+        return backend.transform(tokenize_sentences(sentences), model), len(sentences)
+    rows, inverse = dedup_sentences(sentences)
+    tokenized = tokenize_sentences([sentences[row] for row in rows])
+    return backend.transform(tokenized, model)[inverse], len(rows)
 
 
-def train_word2vec(tokenized_sentences):
+def vectorize_sentences(sentences, train_mode=None, vectorizer="word2vec",
+                        dedup=config.VECTORIZER_DEDUP):
     """
-    Train Word2Vec model on tokenized sentences.
-
-    Args:
-        tokenized_sentences: List of tokenized sentences
-
-    Returns:
-        Word2Vec: Trained model
-    """
-    model = Word2Vec(
-        sentences=tokenized_sentences,
-        vector_size=config.WORD2VEC_VECTOR_SIZE,
-        window=config.WORD2VEC_WINDOW,
-        min_count=config.WORD2VEC_MIN_COUNT,
-        workers=config.WORD2VEC_WORKERS,
-        epochs=config.WORD2VEC_EPOCHS
-    )
-    return model
-
-
-def sentence_to_vector(sentence, model):
-    """
-    Convert sentence to vector by averaging word vectors.
-
-    Args:
-        sentence: Tokenized sentence (list of words)
-        model: Trained Word2Vec model
-
-    Returns:
-        NumPy array: Sentence vector
-    """
-    vectors = [
-        model.wv[word] for word in sentence
-        if word in model.wv
-    ]
-
-    if len(vectors) == 0:
-        return np.zeros(config.WORD2VEC_VECTOR_SIZE)
-
-    return np.mean(vectors, axis=0)
-
-
-def vectorize_sentences(sentences):
-    """
-    Convert all sentences to vectors using Word2Vec.
+    Convert all sentences to vectors with the selected backend.
 
     Args:
         sentences: List of sentence strings
+        train_mode: Word2Vec training mode ("memory" or "corpus_file")
+        vectorizer: Backend name ("word2vec" or "hashing")
+        dedup: If True, tokenize and vectorize each distinct sentence once;
+            the model still fits on every row, so vectors are unchanged
 
     Returns:
         NumPy array: Matrix of sentence vectors
     """
-    tokenized = tokenize_sentences(sentences)
-    model = train_word2vec(tokenized)
-
-    vectors = [sentence_to_vector(sent, model) for sent in tokenized]
-    return np.array(vectors)
+    backend = get_vectorizer(vectorizer)
+    with Span("tokenize", rows=len(sentences)):
+        if dedup:
+            rows, inverse = dedup_sentences(sentences)
+            report_dedup("vectorization", len(sentences), len(rows))
+            unique_tokens = tokenize_sentences([sentences[row] for row in rows])
+            tokenized = [unique_tokens[index] for index in inverse]
+        else:
+            unique_tokens = tokenized = tokenize_sentences(sentences)
+    with Span("fit", rows=len(tokenized)):
+        model = backend.fit(tokenized, train_mode)
+    with Span("transform", rows=len(unique_tokens)):
+        vectors = backend.transform(unique_tokens, model)
+    return vectors[inverse] if dedup else vectors
@@ -0,0 +1,88 @@
+"""
+Word2Vec training from memory or from an on-disk corpus file.
+"""
+import os
+import tempfile
+from gensim.models import Word2Vec
+from src.preprocessing.corpus import CorpusTail, write_corpus_file
+from src.utils import config
+from src.utils.timing import Timer, log_runtime_note
+from src.utils.validators import validate_directory_exists
+
+TRAIN_MODES = ("memory", "corpus_file")
+
+
+def train_word2vec(tokenized_sentences, mode=None):
+    """
+    Train Word2Vec model on tokenized sentences.
+
+    The "corpus_file" mode writes the corpus to a temporary file once and
+    lets gensim read it from every worker thread, which scales with the
+    core count far better than the Python iterator used by the "memory"
+    mode. The file is removed after training.
+
+    Args:
+        tokenized_sentences: Re-iterable of tokenized sentences
+        mode: "memory" or "corpus_file" (default: config.WORD2VEC_TRAIN_MODE)
+
+    Returns:
+        Word2Vec: Trained model
+
+    Raises:
+        ValueError: If mode is unknown
+    """
+    mode = mode or config.WORD2VEC_TRAIN_MODE
+    if mode not in TRAIN_MODES:
+        raise ValueError(f"Unknown Word2Vec training mode: {mode}")
+
+    model = Word2Vec(
+        vector_size=config.WORD2VEC_VECTOR_SIZE,
+        window=config.WORD2VEC_WINDOW,
+        min_count=config.WORD2VEC_MIN_COUNT,
+        workers=config.WORD2VEC_WORKERS,
+        epochs=config.WORD2VEC_EPOCHS
+    )
+    corpus_path = None
+    try:
+        if mode == "corpus_file":
+            # A temporary file, so repeated runs don't leave corpus copies in the cache
+            validate_directory_exists(config.OUTPUT_WORD2VEC_DIR)
+            with tempfile.NamedTemporaryFile(dir=config.OUTPUT_WORD2VEC_DIR, prefix="corpus-",
+                                             suffix=".txt", delete=False) as corpus_file:
+                corpus_path = corpus_file.name
+            source = {"corpus_file": write_corpus_file(tokenized_sentences, corpus_path)}
+        else:
+            source = {"corpus_iterable": tokenized_sentences}
+
+        model.build_vocab(**source)
+        with Timer() as timer:
+            trained_words, _ = model.train(
+                **source,
+                total_examples=model.corpus_count,
+                total_words=model.corpus_total_words,
+                epochs=model.epochs
+            )
+    finally:
+        if corpus_path:
+            os.remove(corpus_path)
+    log_runtime_note(
+        f"Word2Vec training ({mode}, {config.WORD2VEC_WORKERS} workers): "
+        f"{trained_words / max(timer.elapsed(), 1e-9):,.0f} words/sec",
+        config.OUTPUT_RUNTIME_PATH
+    )
+    return model
+
+
+def update_word2vec(model, corpus, start, n_rows):
+    """
+    Extend a trained model with the rows of a corpus after start.
+
+    Args:
+        model: Trained Word2Vec model (loaded writable)
+        corpus: Re-iterable of tokenized sentences
+        start: Number of leading rows the model was already trained on
+        n_rows: Total number of rows in the corpus
+    """
+    tail = CorpusTail(corpus, start)
+    model.build_vocab(tail, update=True)
+    model.train(tail, total_examples=n_rows - start, epochs=model.epochs)
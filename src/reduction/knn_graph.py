@@ -0,0 +1,81 @@
+"""
+Shared k-nearest-neighbor graph, computed once per vector set and cached.
+"""
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from sklearn.neighbors import NearestNeighbors
+from src.utils import config
+from src.utils.batching import iter_row_slices
+from src.utils.hashing import hash_array
+from src.utils.timing import log_runtime_note
+
+# Serializes cache lookups so concurrent stages compute a shared graph only once
+_GRAPH_LOCK = threading.Lock()
+
+
+def _drop_self(distances, neighbors, rows):
+    """Remove each row's own index (or its farthest neighbor if absent)."""
+    is_self = neighbors == np.arange(rows.start, rows.stop)[:, None]
+    is_self[~is_self.any(axis=1), -1] = True
+    keep = ~is_self
+    k = neighbors.shape[1] - 1
+    return distances[keep].reshape(-1, k), neighbors[keep].reshape(-1, k)
+
+
+def compute_knn_graph(data, k, chunk_size=config.KNN_CHUNK_SIZE,
+                      workers=config.KNN_WORKERS):
+    """
+    Compute each row's k nearest neighbors in chunked, threaded batches.
+
+    Args:
+        data: Array-like of shape (n_samples, n_features)
+        k: Neighbors per row, excluding the row itself
+        chunk_size: Rows queried per batch
+        workers: Number of query threads
+
+    Returns:
+        tuple: (distances (n_samples, k), neighbor indices (n_samples, k))
+    """
+    data = np.asarray(data)
+    index = NearestNeighbors(n_neighbors=k + 1).fit(data)
+
+    def query(rows):
+        distances, neighbors = index.kneighbors(data[rows])
+        return _drop_self(distances, neighbors, rows)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        parts = list(pool.map(query, iter_row_slices(len(data), chunk_size)))
+    distances, neighbors = zip(*parts)
+    return np.vstack(distances), np.vstack(neighbors)
+
+
+def load_or_compute_knn_graph(data, k=config.KNN_NEIGHBORS):
+    """
+    Return a cached kNN graph for the data, computing it on a miss.
+
+    The cache is keyed by a hash of the vectors; a cached graph with at
+    least k neighbors is reused by slicing its leading columns.
+
+    Args:
+        data: Array-like of shape (n_samples, n_features)
+        k: Neighbors per row (capped at n_samples - 1)
+
+    Returns:
+        tuple: (distances (n_samples, k), neighbor indices (n_samples, k))
+    """
+    with _GRAPH_LOCK:
+        k = min(k, len(data) - 1)
+        path = os.path.join(config.OUTPUT_KNN_DIR, f"{hash_array(data)}.npz")
+        if os.path.exists(path):
+            with np.load(path) as cached:
+                if cached["neighbors"].shape[1] >= k:
+                    log_runtime_note(f"kNN graph cache hit: {path}", config.OUTPUT_RUNTIME_PATH)
+                    return cached["distances"][:, :k], cached["neighbors"][:, :k]
+
+        distances, neighbors = compute_knn_graph(data, k)
+        os.makedirs(config.OUTPUT_KNN_DIR, exist_ok=True)
+        np.savez(path, distances=distances, neighbors=neighbors)
+        log_runtime_note(f"kNN graph cache miss, saved: {path}", config.OUTPUT_RUNTIME_PATH)
+        return distances, neighbors
@@ -0,0 +1,74 @@
+"""
+Persisted t-SNE landmark index for placing new points in an existing embedding.
+"""
+import os
+import numpy as np
+from src.utils import config
+from src.utils.sampling import stratified_sample
+from src.utils.validators import validate_file_exists, validate_directory_exists
+
+
+def save_landmark_index(vectors, embedding, categories, file_path,
+                        n_landmarks=config.TSNE_LANDMARKS, source=None):
+    """
+    Save a stratified sample of vectors with their t-SNE coordinates.
+
+    Args:
+        vectors: Vectors the embedding was computed from (n_samples, n_features)
+        embedding: t-SNE embedding (n_samples, n_components)
+        categories: Category labels used to stratify the sample
+        file_path: Output .npz path
+        n_landmarks: Approximate number of landmarks kept
+        source: Identity of the vectorizer whose vectors were embedded
+    """
+    validate_directory_exists(os.path.dirname(file_path))
+    landmarks = stratified_sample(categories, n_landmarks)
+    np.savez(
+        file_path,
+        vectors=np.asarray(vectors[landmarks], dtype=np.float32),
+        embedding=np.asarray(embedding[landmarks]),
+        categories=np.asarray(categories)[landmarks],
+        source=np.array(source or ""),
+    )
+
+
+def load_landmark_index(file_path):
+    """
+    Load landmarks and fit a nearest-neighbor index over them.
+
+    Args:
+        file_path: Path written by save_landmark_index
+
+    Returns:
+        dict: vectors, embedding, categories and a fitted NearestNeighbors "index"
+
+    Raises:
+        FileNotFoundError: If the artifact doesn't exist
+    """
+    from sklearn.neighbors import NearestNeighbors
+
+    validate_file_exists(file_path)
+    with np.load(file_path) as artifact:
+        landmark_index = {name: artifact[name] for name in artifact.files}
+    landmark_index["index"] = NearestNeighbors().fit(landmark_index["vectors"])
+    return landmark_index
+
+
+def place_points(landmark_index, vectors, k=config.TSNE_LANDMARK_K):
+    """
+    Place new vectors in the embedding by kNN interpolation over landmarks.
+
+    Args:
+        landmark_index: Result of load_landmark_index
+        vectors: Vectors to place (n_points, n_features)
+        k: Nearest landmarks averaged per point
+
+    Returns:
+        NumPy array: Coordinates (n_points, n_components)
+    """
+    from src.reduction.tsne_landmark import interpolate_embedding
+
+    return interpolate_embedding(
+        landmark_index["index"], landmark_index["embedding"], vectors,
+        min(k, len(landmark_index["embedding"]))
+    )
@@ -2,6 +2,7 @@
 PCA implementation using NumPy.
 """
 import numpy as np
+from src.reduction.projection import make_projection
 from src.utils import config
 from src.utils.validators import validate_data_shape
 
@@ -17,6 +18,23 @@ def compute_pca_numpy(data, n_components=config.N_COMPONENTS):
     Returns:
         NumPy array: Transformed data (n_samples, n_components)
 
+    Raises:
+        ValueError: If data shape is invalid
+    """
+    return fit_transform_pca_numpy(data, n_components)[0]
+
+
+def fit_transform_pca_numpy(data, n_components=config.N_COMPONENTS):
+    """
+    Compute PCA using NumPy and keep the fitted projection.
+
+    Args:
+        data: NumPy array of shape (n_samples, n_features)
+        n_components: Number of components to keep
+
+    Returns:
+        tuple: (transformed data, projection state)
+
     Raises:
         ValueError: If data shape is invalid
     """
@@ -29,8 +47,8 @@ def compute_pca_numpy(data, n_components=config.N_COMPONENTS):
     # Compute covariance matrix
     cov_matrix = np.cov(centered_data.T)
 
-    # Compute eigenvalues and eigenvectors
-    eigenvalues, eigenvectors = np.linalg.eig(cov_matrix)
+    # Compute eigenvalues and eigenvectors (covariance is symmetric)
+    eigenvalues, eigenvectors = np.linalg.eigh(cov_matrix)
 
     # Sort by eigenvalues (descending)
     idx = eigenvalues.argsort()[::-1]
@@ -43,7 +61,7 @@ def compute_pca_numpy(data, n_components=config.N_COMPONENTS):
     # Transform data
     transformed = centered_data @ components
 
-    return transformed.real
+    return transformed, make_projection(mean, components, eigenvalues[:n_components])
 
 
 def run_pca_numpy(vectors, categories):
@@ -55,6 +73,6 @@ def run_pca_numpy(vectors, categories):
         categories: List of category labels
 
     Returns:
-        NumPy array: 3D PCA result
+        tuple: (3D PCA result, projection state)
     """
-    return compute_pca_numpy(vectors, n_components=config.N_COMPONENTS)
+    return fit_transform_pca_numpy(vectors, n_components=config.N_COMPONENTS)
@@ -1,18 +1,25 @@
 """
 PCA implementation using scikit-learn.
 """
-from sklearn.decomposition import PCA
+import numpy as np
+from sklearn.decomposition import PCA, IncrementalPCA
+from sklearn.utils import gen_batches
+from src.reduction.projection import make_projection
 from src.utils import config
+from src.utils.timing import log_runtime_note
 from src.utils.validators import validate_data_shape
 
+SKLEARN_MODES = ("auto", "randomized", "incremental")
 
-def compute_pca_sklearn(data, n_components=config.N_COMPONENTS):
+
+def compute_pca_sklearn(data, n_components=config.N_COMPONENTS, svd_solver="auto"):
     """
     Compute PCA using scikit-learn.
 
     Args:
         data: NumPy array of shape (n_samples, n_features)
         n_components: Number of components to keep
+        svd_solver: PCA solver, e.g. "auto", "full" or "randomized"
 
     Returns:
         NumPy array: Transformed data (n_samples, n_components)
@@ -21,22 +28,73 @@ def compute_pca_sklearn(data, n_components=config.N_COMPONENTS):
         ValueError: If data shape is invalid
     """
     validate_data_shape(data, n_components)
+    return _fit_pca(data, n_components, svd_solver)[0]
 
-    pca = PCA(n_components=n_components)
-    transformed = pca.fit_transform(data)
 
-    return transformed
+def _fit_pca(data, n_components, svd_solver):
+    pca = PCA(n_components=n_components, svd_solver=svd_solver, random_state=42)
+    return pca.fit_transform(data), pca
 
 
-def run_pca_sklearn(vectors, categories):
+def compute_pca_incremental(data, n_components=config.N_COMPONENTS,
+                            batch_size=config.PCA_BATCH_SIZE):
+    """
+    Compute PCA with IncrementalPCA, reading the data batch by batch.
+
+    Only one batch is in memory at a time, so a memory-mapped vector
+    store larger than RAM can be reduced.
+
+    Args:
+        data: Array-like of shape (n_samples, n_features), e.g. a memmap
+        n_components: Number of components to keep
+        batch_size: Rows per partial_fit / transform batch
+
+    Returns:
+        NumPy array: Transformed data (n_samples, n_components)
+
+    Raises:
+        ValueError: If data shape is invalid
+    """
+    validate_data_shape(data, n_components)
+    return _fit_incremental(data, n_components, batch_size)[0]
+
+
+def _fit_incremental(data, n_components, batch_size):
+    pca = IncrementalPCA(n_components=n_components)
+    batches = list(gen_batches(len(data), batch_size, min_batch_size=n_components))
+    for batch in batches:
+        pca.partial_fit(data[batch])
+
+    transformed = np.empty((len(data), n_components))
+    for batch in batches:
+        transformed[batch] = pca.transform(data[batch])
+    return transformed, pca
+
+
+def run_pca_sklearn(vectors, categories, mode="auto", batch_size=config.PCA_BATCH_SIZE):
     """
     Run PCA using scikit-learn and return 3D result.
 
     Args:
         vectors: NumPy array of vectors
         categories: List of category labels
+        mode: "auto" or "randomized" SVD solver, or "incremental"
+        batch_size: Rows per batch in incremental mode
 
     Returns:
-        NumPy array: 3D PCA result
+        tuple: (3D PCA result, projection state)
+
+    Raises:
+        ValueError: If mode is unknown or data shape is invalid
     """
-    return compute_pca_sklearn(vectors, n_components=config.N_COMPONENTS)
+    if mode not in SKLEARN_MODES:
+        raise ValueError(f"Unknown scikit-learn PCA mode: {mode}")
+    validate_data_shape(vectors, config.N_COMPONENTS)
+    if mode == "incremental":
+        transformed, pca = _fit_incremental(vectors, config.N_COMPONENTS, batch_size)
+    else:
+        transformed, pca = _fit_pca(vectors, config.N_COMPONENTS, mode)
+        log_runtime_note(f"Scikit-learn PCA ({mode}): svd_solver={pca._fit_svd_solver}",
+                         config.OUTPUT_RUNTIME_PATH)
+    projection = make_projection(pca.mean_, pca.components_.T, pca.explained_variance_)
+    return transformed, projection
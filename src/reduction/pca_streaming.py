@@ -0,0 +1,90 @@
+"""
+Out-of-core PCA using NumPy with chunked covariance accumulation.
+"""
+import numpy as np
+from src.data.vector_store import VectorStoreWriter
+from src.reduction.projection import make_projection
+from src.utils import config
+from src.utils.batching import iter_row_slices
+from src.utils.validators import validate_data_shape
+
+
+def fit_pca_streaming(data, n_components=config.N_COMPONENTS,
+                      chunk_size=config.PCA_CHUNK_SIZE):
+    """
+    Fit PCA in one pass over row chunks of a (memory-mapped) matrix.
+
+    The mean and X^T X are accumulated in float64 around the first
+    chunk's mean, which keeps the covariance numerically stable.
+
+    Args:
+        data: Array-like of shape (n_samples, n_features), e.g. a memmap
+        n_components: Number of components to keep
+        chunk_size: Rows read per chunk
+
+    Returns:
+        tuple: (mean, components (n_features, n_components), eigenvalues)
+
+    Raises:
+        ValueError: If data shape is invalid
+    """
+    validate_data_shape(data, n_components)
+    n_rows, n_features = data.shape
+
+    shift = None
+    total = np.zeros(n_features)
+    gram = np.zeros((n_features, n_features))
+    for rows in iter_row_slices(n_rows, chunk_size):
+        chunk = np.asarray(data[rows], dtype=np.float64)
+        if shift is None:
+            shift = chunk.mean(axis=0)
+        chunk -= shift
+        total += chunk.sum(axis=0)
+        gram += chunk.T @ chunk
+
+    offset = total / n_rows
+    cov_matrix = (gram - n_rows * np.outer(offset, offset)) / max(n_rows - 1, 1)
+
+    # Symmetric eigensolver: real output, ascending eigenvalues
+    eigenvalues, eigenvectors = np.linalg.eigh(cov_matrix)
+    idx = eigenvalues.argsort()[::-1][:n_components]
+
+    return shift + offset, eigenvectors[:, idx], eigenvalues[idx]
+
+
+def project_pca_streaming(data, categories, mean, components, output_path,
+                          chunk_size=config.PCA_CHUNK_SIZE):
+    """
+    Project row chunks and write them straight to a binary vector store.
+
+    Args:
+        data: Array-like of shape (n_samples, n_features)
+        categories: List of category labels
+        mean: Feature means from fit_pca_streaming
+        components: Projection matrix (n_features, n_components)
+        output_path: Path of the .npy store to write
+        chunk_size: Rows projected per chunk
+    """
+    with VectorStoreWriter(output_path) as writer:
+        for rows in iter_row_slices(len(data), chunk_size):
+            chunk = np.asarray(data[rows], dtype=np.float64) - mean
+            writer.append(chunk @ components, categories[rows])
+
+
+def run_pca_numpy_streaming(vectors, categories, output_path):
+    """
+    Run out-of-core NumPy PCA and store the 3D result.
+
+    Memory stays at O(n_features^2) plus one chunk regardless of rows.
+
+    Args:
+        vectors: Array-like of vectors (memory-mapped store works best)
+        categories: List of category labels
+        output_path: Path of the .npy store for the 3D result
+
+    Returns:
+        dict: Projection state
+    """
+    mean, components, eigenvalues = fit_pca_streaming(vectors)
+    project_pca_streaming(vectors, categories, mean, components, output_path)
+    return make_projection(mean, components, eigenvalues)
@@ -0,0 +1,78 @@
+"""
+Fast pre-reduction (random projection or PCA) ahead of t-SNE.
+"""
+from functools import partial
+import numpy as np
+from sklearn.decomposition import PCA
+from sklearn.neighbors import NearestNeighbors
+from sklearn.random_projection import GaussianRandomProjection, SparseRandomProjection
+from src.utils import config
+from src.utils.timing import Timer
+
+PRE_REDUCTION_METHODS = {
+    "gaussian": GaussianRandomProjection,
+    "sparse": SparseRandomProjection,
+    "pca": partial(PCA, svd_solver="randomized"),
+}
+
+
+def pre_reduce(data, method, n_components=config.PRE_REDUCE_DIM):
+    """
+    Reduce dimensionality before neighbor search.
+
+    Args:
+        data: Array-like of shape (n_samples, n_features)
+        method: "gaussian" or "sparse" random projection, or "pca"
+        n_components: Target dimensionality (capped at n_features)
+
+    Returns:
+        NumPy array: Reduced data (n_samples, n_components)
+
+    Raises:
+        ValueError: If method is unknown
+    """
+    if method not in PRE_REDUCTION_METHODS:
+        raise ValueError(f"Unknown pre-reduction method: {method}")
+    n_components = min(n_components, data.shape[1])
+    reducer = PRE_REDUCTION_METHODS[method](n_components, random_state=42)
+    return np.asarray(reducer.fit_transform(data), dtype=np.float32)
+
+
+def _query_neighbors(space, queries, k):
+    """Return the query rows' k nearest neighbors (excluding self) and query time."""
+    index = NearestNeighbors(n_neighbors=k + 1).fit(space)
+    with Timer() as timer:
+        neighbors = index.kneighbors(space[queries], return_distance=False)
+    # Remove self by index: a duplicate row at distance 0 may come first
+    is_self = neighbors == queries[:, None]
+    is_self[~is_self.any(axis=1), -1] = True
+    return neighbors[~is_self].reshape(-1, k), timer.elapsed()
+
+
+def neighbor_preservation(original, reduced, k=config.PRE_REDUCE_EVAL_K,
+                          n_queries=config.PRE_REDUCE_EVAL_QUERIES):
+    """
+    Compare kNN sets before and after reduction on sampled query rows.
+
+    Args:
+        original: Original data (n_samples, n_features)
+        reduced: Reduced data (n_samples, n_components)
+        k: Neighbors compared per query
+        n_queries: Number of sampled query rows
+
+    Returns:
+        tuple: (mean fraction of preserved neighbors,
+                estimated neighbor-search seconds saved on all rows)
+    """
+    original = np.asarray(original)
+    k = min(k, len(original) - 1)
+    rng = np.random.default_rng(42)
+    queries = rng.choice(len(original), min(n_queries, len(original)), replace=False)
+
+    original_neighbors, original_time = _query_neighbors(original, queries, k)
+    reduced_neighbors, reduced_time = _query_neighbors(reduced, queries, k)
+
+    matches = original_neighbors[:, :, None] == reduced_neighbors[:, None, :]
+    score = matches.any(axis=2).sum(axis=1).mean() / k
+    saved = (original_time - reduced_time) * len(original) / len(queries)
+    return score, saved
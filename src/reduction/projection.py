@@ -0,0 +1,81 @@
+"""
+Persisted linear projections for transform-only PCA.
+"""
+import os
+import numpy as np
+from src.utils.validators import validate_file_exists, validate_directory_exists
+
+
+def make_projection(mean, components, explained_variance, signs=None):
+    """
+    Bundle the fitted state of a PCA.
+
+    Args:
+        mean: Feature means (n_features,)
+        components: Projection matrix (n_features, n_components)
+        explained_variance: Variance per component (n_components,)
+        signs: Optional +1/-1 per component from sign alignment
+
+    Returns:
+        dict: Projection state
+    """
+    return {
+        "mean": np.asarray(mean, dtype=np.float64),
+        "components": np.asarray(components, dtype=np.float64),
+        "explained_variance": np.asarray(explained_variance, dtype=np.float64),
+        "signs": np.ones(components.shape[1]) if signs is None else np.asarray(signs),
+    }
+
+
+def apply_projection(projection, vectors):
+    """
+    Project vectors with a fitted projection, without refitting.
+
+    Args:
+        projection: Projection state from make_projection/load_projection
+        vectors: NumPy array of vectors (n_samples, n_features)
+
+    Returns:
+        NumPy array: Projected vectors (n_samples, n_components)
+
+    Raises:
+        ValueError: If the feature count doesn't match the projection
+    """
+    n_features = projection["components"].shape[0]
+    if vectors.shape[1] != n_features:
+        raise ValueError(
+            f"Projection expects {n_features} features, got {vectors.shape[1]}"
+        )
+    centered = np.asarray(vectors, dtype=np.float64) - projection["mean"]
+    return (centered @ projection["components"]) * projection["signs"]
+
+
+def save_projection(projection, file_path, source=None):
+    """
+    Save a projection as an .npz artifact.
+
+    Args:
+        projection: Projection state
+        file_path: Output file path
+        source: Identity of the vectorizer whose vectors it was fitted on
+    """
+    validate_directory_exists(os.path.dirname(file_path))
+    np.savez(file_path, **projection, source=np.array(source or ""))
+
+
+def load_projection(file_path):
+    """
+    Load a projection artifact.
+
+    Args:
+        file_path: Input file path
+
+    Returns:
+        dict: Projection state
+
+    Raises:
+        FileNotFoundError: If file doesn't exist
+    """
+    validate_file_exists(file_path)
+    with np.load(file_path) as artifact:
+        return {name: artifact[name] for name in artifact.files}
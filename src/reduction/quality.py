@@ -0,0 +1,70 @@
+"""
+Embedding-quality metrics (trustworthiness and continuity).
+"""
+import numpy as np
+from src.utils import config
+from src.utils.batching import iter_row_slices
+
+
+def _ranks(space, queries):
+    """Rank every row by distance from each query row (self has rank 0)."""
+    squared_norms = (space ** 2).sum(axis=1)
+    distances = squared_norms[None, :] - 2 * space[queries] @ space.T
+    distances += squared_norms[queries][:, None]
+    distances[np.arange(len(queries)), queries] = -1.0
+    order = np.argsort(distances, axis=1, kind="stable")
+    ranks = np.empty_like(order)
+    ranks[np.arange(len(queries))[:, None], order] = np.arange(space.shape[0])
+    return ranks, order
+
+
+def _rank_penalty(ranks, own, other, k):
+    """Sum rank - k over rows in other's neighbor sets missing from own's."""
+    missing = ~(other[:, :, None] == own[:, None, :]).any(axis=2)
+    penalty = np.take_along_axis(ranks, other, axis=1) - k
+    return (penalty * missing).sum()
+
+
+def trustworthiness_continuity(data, embedding, neighbors, k=config.QUALITY_K,
+                               n_queries=config.QUALITY_SAMPLE,
+                               batch_size=config.QUALITY_BATCH_SIZE):
+    """
+    Estimate trustworthiness and continuity on sampled query rows.
+
+    Original-space neighbor sets come from the shared kNN graph; full
+    ranks are computed in batches of query rows against all rows.
+
+    Args:
+        data: Original vectors (n_samples, n_features)
+        embedding: Embedded vectors (n_samples, n_components)
+        neighbors: kNN graph indices of the original vectors (n_samples, >= k)
+        k: Neighborhood size
+        n_queries: Number of sampled query rows
+        batch_size: Query rows ranked per batch
+
+    Returns:
+        tuple: (trustworthiness, continuity), each in [0, 1]
+    """
+    data = np.asarray(data, dtype=np.float64)
+    embedding = np.asarray(embedding, dtype=np.float64)
+    n_rows = len(data)
+    k = min(k, neighbors.shape[1], (2 * n_rows - 1) // 3 - 1)
+    rng = np.random.default_rng(42)
+    queries = np.sort(rng.choice(n_rows, min(n_queries, n_rows), replace=False))
+
+    trust_penalty = continuity_penalty = 0
+    for rows in iter_row_slices(len(queries), batch_size):
+        batch = queries[rows]
+        original_ranks, _ = _ranks(data, batch)
+        embedded_ranks, embedded_order = _ranks(embedding, batch)
+        original_neighbors = neighbors[batch, :k]
+        embedded_neighbors = embedded_order[:, 1:k + 1]
+        trust_penalty += _rank_penalty(
+            original_ranks, original_neighbors, embedded_neighbors, k
+        )
+        continuity_penalty += _rank_penalty(
+            embedded_ranks, embedded_neighbors, original_neighbors, k
+        )
+
+    scale = 2.0 / (len(queries) * k * (2 * n_rows - 3 * k - 1))
+    return 1 - scale * trust_penalty, 1 - scale * continuity_penalty
@@ -1,47 +1,97 @@
 """
 t-SNE implementation using scikit-learn.
 """
+import numpy as np
+from sklearn.decomposition import PCA
 from sklearn.manifold import TSNE
 from src.utils import config
 from src.utils.validators import validate_data_shape
 
 
-def compute_tsne(data, n_components=config.N_COMPONENTS):
+def pca_init(data, n_components, random_state):
     """
-    Compute t-SNE using scikit-learn.
+    Compute the PCA initialization scikit-learn uses for feature input.
 
     Args:
         data: NumPy array of shape (n_samples, n_features)
         n_components: Number of components to keep
+        random_state: Random seed
 
     Returns:
-        NumPy array: Transformed data (n_samples, n_components)
+        NumPy array: Initial embedding, rescaled so the first component has
+            standard deviation 1e-4 like scikit-learn's init="pca"
+    """
+    pca = PCA(n_components=n_components, random_state=random_state)
+    embedded = pca.fit_transform(np.asarray(data)).astype(np.float32, copy=False)
+    return embedded / np.std(embedded[:, 0]) * 1e-4
+
+
+def fit_tsne(data, n_components=config.N_COMPONENTS, distances=None,
+             perplexity=config.TSNE_PERPLEXITY, random_state=42):
+    """
+    Fit t-SNE and report its final KL divergence.
+
+    Args:
+        data: NumPy array of shape (n_samples, n_features)
+        n_components: Number of components to keep
+        distances: Optional sparse squared-distance kNN graph of the data;
+            when given, t-SNE uses it instead of searching neighbors itself
+        perplexity: t-SNE perplexity
+        random_state: Random seed
+
+    Returns:
+        tuple: (transformed data (n_samples, n_components), KL divergence)
 
     Raises:
         ValueError: If data shape is invalid
     """
     validate_data_shape(data, n_components)
 
+    if distances is None:
+        tsne = TSNE(
+            n_components=n_components,
+            perplexity=perplexity,
+            max_iter=config.TSNE_ITERATIONS,
+            random_state=random_state
+        )
+        return tsne.fit_transform(data), tsne.kl_divergence_
+
     tsne = TSNE(
         n_components=n_components,
-        perplexity=config.TSNE_PERPLEXITY,
+        perplexity=perplexity,
         max_iter=config.TSNE_ITERATIONS,
-        random_state=42
+        metric="precomputed",
+        init=pca_init(data, n_components, random_state),
+        random_state=random_state
     )
-    transformed = tsne.fit_transform(data)
+    return tsne.fit_transform(distances), tsne.kl_divergence_
+
+
+def compute_tsne(data, n_components=config.N_COMPONENTS, distances=None):
+    """
+    Compute t-SNE using scikit-learn.
+
+    Args:
+        data: NumPy array of shape (n_samples, n_features)
+        n_components: Number of components to keep
+        distances: Optional sparse squared-distance kNN graph of the data
 
-    return transformed
+    Returns:
+        NumPy array: Transformed data (n_samples, n_components)
+    """
+    return fit_tsne(data, n_components, distances)[0]
 
 
-def run_tsne(vectors, categories):
+def run_tsne(vectors, categories, distances=None):
     """
     Run t-SNE and return 3D result.
 
     Args:
         vectors: NumPy array of vectors
         categories: List of category labels
+        distances: Optional sparse squared-distance kNN graph of the vectors
 
     Returns:
         NumPy array: 3D t-SNE result
     """
-    return compute_tsne(vectors, n_components=config.N_COMPONENTS)
+    return compute_tsne(vectors, n_components=config.N_COMPONENTS, distances=distances)
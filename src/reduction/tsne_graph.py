@@ -0,0 +1,48 @@
+"""
+Adapters from the shared kNN graph to t-SNE's precomputed input.
+"""
+import numpy as np
+from scipy.sparse import csr_matrix
+from src.utils import config
+
+
+def tsne_graph_neighbors(perplexity, n_samples):
+    """
+    Return the graph width t-SNE needs for a perplexity.
+
+    scikit-learn uses min(n_samples - 1, 3 * perplexity + 1) neighbors,
+    excluding the row itself; to_sparse_distances adds the self entry.
+
+    Args:
+        perplexity: t-SNE perplexity
+        n_samples: Rows in the graph
+
+    Returns:
+        int: Neighbors per row, at most n_samples - 1
+    """
+    return min(n_samples - 1, max(config.KNN_NEIGHBORS, int(3 * perplexity + 1)))
+
+
+def to_sparse_distances(distances, neighbors):
+    """
+    Convert a kNN graph to a sparse squared-distance matrix for t-SNE.
+
+    Each row also stores its zero self-distance: scikit-learn asks a
+    precomputed graph for one neighbor more than it uses and drops the row
+    itself, which a graph of at most n_samples - 1 neighbors can't supply.
+
+    Args:
+        distances: Neighbor distances (n_samples, k)
+        neighbors: Neighbor indices (n_samples, k)
+
+    Returns:
+        scipy.sparse.csr_matrix: (n_samples, n_samples) squared distances
+    """
+    n_rows = len(neighbors)
+    neighbors = np.hstack([np.arange(n_rows)[:, None], neighbors])
+    distances = np.hstack([np.zeros((n_rows, 1), dtype=distances.dtype), distances])
+    k = neighbors.shape[1]
+    indptr = np.arange(0, n_rows * k + 1, k)
+    return csr_matrix(
+        (distances.ravel() ** 2, neighbors.ravel(), indptr), shape=(n_rows, n_rows)
+    )
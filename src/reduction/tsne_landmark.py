@@ -0,0 +1,77 @@
+"""
+Landmark t-SNE: embed a subsample, then place the rest by kNN interpolation.
+"""
+import numpy as np
+from sklearn.neighbors import NearestNeighbors
+from src.reduction.tsne import compute_tsne
+from src.utils import config
+from src.utils.batching import iter_row_slices
+from src.utils.sampling import stratified_sample
+from src.utils.timing import Timer
+
+
+def interpolate_embedding(index, landmark_embedding, points, k,
+                          batch_size=config.TSNE_BATCH_SIZE):
+    """
+    Place points at the distance-weighted mean of their nearest landmarks.
+
+    Args:
+        index: NearestNeighbors fitted on the landmark vectors
+        landmark_embedding: Embedding of the landmarks (n_landmarks, dim)
+        points: Array-like of vectors to place (n_points, n_features)
+        k: Number of nearest landmarks to average
+        batch_size: Points queried per batch
+
+    Returns:
+        NumPy array: Embedding of the points (n_points, dim)
+    """
+    placed = np.empty((len(points), landmark_embedding.shape[1]))
+    for rows in iter_row_slices(len(points), batch_size):
+        distances, neighbors = index.kneighbors(np.asarray(points[rows]), n_neighbors=k)
+        weights = 1.0 / (distances + 1e-12)
+        weights /= weights.sum(axis=1, keepdims=True)
+        placed[rows] = np.einsum("nk,nkd->nd", weights, landmark_embedding[neighbors])
+    return placed
+
+
+def compute_tsne_landmark(data, categories, n_landmarks=config.TSNE_LANDMARKS,
+                          k=config.TSNE_LANDMARK_K, n_components=config.N_COMPONENTS):
+    """
+    Run t-SNE on stratified landmarks and interpolate the remaining points.
+
+    Args:
+        data: Array-like of shape (n_samples, n_features)
+        categories: List of category labels used to stratify landmarks
+        n_landmarks: Approximate number of landmarks
+        k: Nearest landmarks used to place each remaining point
+        n_components: Number of embedding dimensions
+
+    Returns:
+        tuple: (embedding (n_samples, n_components), dict of phase timings)
+    """
+    timings = {}
+    with Timer() as timer:
+        landmarks = stratified_sample(categories, n_landmarks)
+        landmark_vectors = np.asarray(data[landmarks])
+    timings["landmark sampling"] = timer.elapsed()
+
+    with Timer() as timer:
+        landmark_embedding = compute_tsne(landmark_vectors, n_components)
+    timings["landmark t-SNE"] = timer.elapsed()
+
+    with Timer() as timer:
+        index = NearestNeighbors().fit(landmark_vectors)
+    timings["kNN index"] = timer.elapsed()
+
+    with Timer() as timer:
+        embedding = np.empty((len(data), n_components))
+        embedding[landmarks] = landmark_embedding
+        others = np.setdiff1d(np.arange(len(data)), landmarks)
+        for rows in iter_row_slices(len(others), config.TSNE_BATCH_SIZE):
+            embedding[others[rows]] = interpolate_embedding(
+                index, landmark_embedding, data[others[rows]],
+                min(k, len(landmarks))
+            )
+    timings["interpolation"] = timer.elapsed()
+
+    return embedding, timings
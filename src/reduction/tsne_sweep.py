@@ -0,0 +1,70 @@
+"""
+Single t-SNE sweep configuration, run inside a worker process.
+"""
+import os
+from scipy.sparse import load_npz
+from src.data.vector_io import load_vectors, save_vectors
+from src.reduction.tsne import fit_tsne
+from src.visualization.plotter import plot_3d_scatter
+from src.utils import config
+from src.utils.timing import Timer
+
+
+def sweep_output_stem(perplexity, seed):
+    """Return the output path stem for one sweep configuration."""
+    return os.path.join(config.OUTPUT_SWEEP_DIR, f"Tsne_p{perplexity:g}_s{seed}")
+
+
+def run_sweep_config(vectors_path, graph_path, perplexity, seed):
+    """
+    Fit, save and plot t-SNE for one perplexity/seed pair.
+
+    The vectors are memory-mapped from the binary store and the kNN graph
+    is read from disk, so nothing large is pickled to the worker.
+
+    Args:
+        vectors_path: Path to the binary vector store
+        graph_path: Path to the sparse squared-distance kNN graph (.npz)
+        perplexity: t-SNE perplexity
+        seed: Random seed
+
+    Returns:
+        dict: perplexity, seed, runtime (seconds) and KL divergence
+    """
+    vectors, categories = load_vectors(vectors_path)
+    distances = load_npz(graph_path)
+    with Timer() as timer:
+        embedding, kl_divergence = fit_tsne(
+            vectors, distances=distances, perplexity=perplexity, random_state=seed
+        )
+
+    stem = sweep_output_stem(perplexity, seed)
+    save_vectors(embedding, categories, f"{stem}_vectors.txt")
+    plot_3d_scatter(
+        embedding, categories,
+        f"t-SNE (perplexity={perplexity:g}, seed={seed})", f"{stem}.{config.PLOT_FORMAT}"
+    )
+    return {
+        "perplexity": perplexity,
+        "seed": seed,
+        "runtime": timer.elapsed(),
+        "kl_divergence": float(kl_divergence),
+    }
+
+
+def write_sweep_summary(results, output_path):
+    """
+    Write a runtime / KL divergence table for the sweep.
+
+    Args:
+        results: List of dicts returned by run_sweep_config
+        output_path: Path to the summary text file
+    """
+    with open(output_path, "w") as f:
+        f.write(f"{'Perplexity':>10}  {'Seed':>6}  {'Runtime (s)':>11}  {'KL divergence':>13}\n")
+        f.write("-" * 46 + "\n")
+        for result in results:
+            f.write(
+                f"{result['perplexity']:>10g}  {result['seed']:>6}  "
+                f"{result['runtime']:>11.4f}  {result['kl_divergence']:>13.4f}\n"
+            )
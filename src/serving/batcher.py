@@ -0,0 +1,87 @@
+"""
+Micro-batcher: coalesce concurrent requests into one vectorize/project call.
+"""
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from src.utils import config
+
+_STOP = object()
+
+
+class MicroBatcher:
+    """
+    Run a batch function over requests collected from many threads.
+
+    A single worker thread takes the first queued request, then keeps
+    collecting requests until max_batch items are gathered or max_wait_ms
+    has passed. Each request is a list of items; the batch function gets
+    every item at once and returns one result per item.
+
+    Args:
+        process: Callable mapping a list of items to a list-like of results
+        metrics: ServerMetrics receiving per-batch statistics
+        max_batch: Item count that closes a batch early
+        max_wait_ms: Longest time a batch waits for more requests
+    """
+
+    def __init__(self, process, metrics, max_batch=config.SERVE_MAX_BATCH,
+                 max_wait_ms=config.SERVE_MAX_WAIT_MS):
+        self.process = process
+        self.metrics = metrics
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._queue = queue.Queue()
+        self._worker = threading.Thread(target=self._run, daemon=True)
+        self._worker.start()
+
+    def submit(self, items):
+        """Queue a request; the returned Future resolves to its results."""
+        future = Future()
+        self._queue.put((list(items), future))
+        return future
+
+    def close(self):
+        """Stop the worker after the queued requests are served."""
+        self._queue.put(_STOP)
+        self._worker.join()
+
+    def _collect(self):
+        """Block for one request, then gather more until the batch closes."""
+        first = self._queue.get()
+        if first is _STOP:
+            return None
+        batch, size = [first], len(first[0])
+        deadline = time.perf_counter() + self.max_wait
+        while size < self.max_batch:
+            remaining = deadline - time.perf_counter()
+            try:
+                request = self._queue.get(timeout=remaining) if remaining > 0 else \
+                    self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if request is _STOP:
+                self._queue.put(_STOP)
+                break
+            batch.append(request)
+            size += len(request[0])
+        return batch
+
+    def _run(self):
+        while (batch := self._collect()) is not None:
+            items = [item for request, _ in batch for item in request]
+            start = time.perf_counter()
+            try:
+                results = self.process(items)
+            except Exception as error:  # report to every waiting request
+                for _, future in batch:
+                    future.set_exception(error)
+                continue
+            self.metrics.record_batch(
+                len(batch), len(items), (time.perf_counter() - start) * 1000
+            )
+            offset = 0
+            for request, future in batch:
+                future.set_result(results[offset:offset + len(request)])
+                offset += len(request)
@@ -0,0 +1,77 @@
+"""
+Stdlib HTTP front end for the embedding server.
+"""
+import json
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def make_handler(batcher, metrics, maps):
+    """
+    Build a request handler bound to a batcher and its metrics.
+
+    Endpoints:
+        POST /embed    {"sentences": [...]} -> {"coordinates": [{map: [x, y, z]}]}
+        GET  /metrics  latency percentiles and batch-size statistics
+        GET  /health   {"status": "ok", "maps": [...]}
+
+    Args:
+        batcher: MicroBatcher embedding lists of sentences
+        metrics: ServerMetrics to record request latency
+        maps: Names of the available maps
+
+    Returns:
+        type: BaseHTTPRequestHandler subclass
+    """
+    class EmbeddingHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _send_json(self, status, payload):
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path == "/metrics":
+                self._send_json(200, metrics.snapshot())
+            elif self.path == "/health":
+                self._send_json(200, {"status": "ok", "maps": maps})
+            else:
+                self._send_json(404, {"error": f"unknown path {self.path}"})
+
+        def do_POST(self):
+            if self.path != "/embed":
+                self._send_json(404, {"error": f"unknown path {self.path}"})
+                return
+            start = time.perf_counter()
+            try:
+                length = int(self.headers.get("Content-Length", 0))
+                sentences = json.loads(self.rfile.read(length))["sentences"]
+                if not isinstance(sentences, list) or \
+                        not all(isinstance(s, str) for s in sentences):
+                    raise ValueError("'sentences' must be a list of strings")
+            except (ValueError, KeyError, TypeError) as error:
+                metrics.record_request((time.perf_counter() - start) * 1000, failed=True)
+                self._send_json(400, {"error": str(error)})
+                return
+            try:
+                coordinates = batcher.submit(sentences).result()
+            except Exception as error:
+                metrics.record_request((time.perf_counter() - start) * 1000, failed=True)
+                self._send_json(500, {"error": str(error)})
+                return
+            metrics.record_request((time.perf_counter() - start) * 1000)
+            self._send_json(200, {"coordinates": coordinates})
+
+        def log_message(self, format, *args):
+            """Silence per-request logging; /metrics reports traffic instead."""
+
+    return EmbeddingHandler
+
+
+def make_server(host, port, handler):
+    """Create a threaded HTTP server (one daemon thread per connection)."""
+    return ThreadingHTTPServer((host, port), handler)
@@ -0,0 +1,65 @@
+"""
+Request latency and micro-batch statistics for the embedding server.
+"""
+import threading
+import time
+from collections import deque
+import numpy as np
+from src.utils import config
+
+
+def _summary(values, percentiles):
+    """Summarize a window of values as mean, max and named percentiles."""
+    if not values:
+        return {}
+    array = np.fromiter(values, dtype=np.float64)
+    summary = {f"p{p}": float(np.percentile(array, p)) for p in percentiles}
+    summary.update(mean=float(array.mean()), max=float(array.max()))
+    return summary
+
+
+class ServerMetrics:
+    """Thread-safe counters plus sliding windows of latencies and batch sizes."""
+
+    def __init__(self, window=config.SERVE_METRICS_WINDOW):
+        self._lock = threading.Lock()
+        self.started = time.time()
+        self.latencies_ms = deque(maxlen=window)
+        self.batch_sentences = deque(maxlen=window)
+        self.batch_requests = deque(maxlen=window)
+        self.batch_ms = deque(maxlen=window)
+        self.requests = 0
+        self.errors = 0
+
+    def record_request(self, latency_ms, failed=False):
+        """Record one request's end-to-end latency."""
+        with self._lock:
+            self.requests += 1
+            self.errors += failed
+            self.latencies_ms.append(latency_ms)
+
+    def record_batch(self, n_requests, n_sentences, batch_ms):
+        """Record one micro-batch: requests coalesced, sentences, compute time."""
+        with self._lock:
+            self.batch_requests.append(n_requests)
+            self.batch_sentences.append(n_sentences)
+            self.batch_ms.append(batch_ms)
+
+    def snapshot(self):
+        """
+        Summarize the metrics for the /metrics endpoint.
+
+        Returns:
+            dict: Counters, latency percentiles (ms) and batch-size stats
+        """
+        with self._lock:
+            return {
+                "uptime_seconds": time.time() - self.started,
+                "requests": self.requests,
+                "errors": self.errors,
+                "batches": len(self.batch_ms),
+                "latency_ms": _summary(self.latencies_ms, (50, 90, 95, 99)),
+                "batch_compute_ms": _summary(self.batch_ms, (50, 99)),
+                "batch_sentences": _summary(self.batch_sentences, (50, 99)),
+                "batch_requests": _summary(self.batch_requests, (50, 99)),
+            }
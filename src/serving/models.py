@@ -0,0 +1,63 @@
+"""
+Models kept warm by the embedding server.
+"""
+import os
+from src.preprocessing.corpus import tokenize_sentences
+from src.preprocessing.store_models import load_store_models
+from src.preprocessing.sparse_average import average_word_vectors
+from src.reduction.landmark_index import load_landmark_index, place_points
+from src.reduction.projection import load_projection, apply_projection
+from src.utils import config
+
+
+class WarmModels:
+    """
+    Word2Vec model, saved PCA projections and the t-SNE landmark index.
+
+    Artifacts are loaded once. Missing PCA or t-SNE artifacts are
+    skipped, so the server answers with whichever maps exist; the server
+    refuses to start if the model or an artifact doesn't match the store.
+    """
+
+    def __init__(self):
+        artifacts = {
+            "pca_numpy": (load_projection, config.OUTPUT_PCA_NUMPY_PROJECTION_PATH, "--pca"),
+            "pca_sklearn": (load_projection, config.OUTPUT_PCA_SKLEARN_PROJECTION_PATH, "--pca"),
+            "tsne": (load_landmark_index, config.OUTPUT_TSNE_LANDMARKS_PATH, "--tsne"),
+        }
+        self.word2vec, loaded = load_store_models({
+            name: artifact for name, artifact in artifacts.items() if os.path.exists(artifact[1])
+        })
+        # Touch the memory-mapped vectors so the first request doesn't page them in
+        self.word2vec.wv.vectors.sum()
+        self.landmarks = loaded.pop("tsne", None)
+        self.projections = loaded
+
+    @property
+    def maps(self):
+        """Names of the maps new sentences are placed in."""
+        return list(self.projections) + (["tsne"] if self.landmarks else [])
+
+    def embed(self, sentences):
+        """
+        Vectorize sentences and place them in every available map.
+
+        Args:
+            sentences: List of sentence strings
+
+        Returns:
+            list: One {map name: [x, y, z]} dict per sentence
+        """
+        if not sentences:
+            return []
+        vectors = average_word_vectors(tokenize_sentences(sentences), self.word2vec)
+        coordinates = {
+            name: apply_projection(projection, vectors).tolist()
+            for name, projection in self.projections.items()
+        }
+        if self.landmarks:
+            coordinates["tsne"] = place_points(self.landmarks, vectors).tolist()
+        return [
+            {name: points[row] for name, points in coordinates.items()}
+            for row in range(len(sentences))
+        ]
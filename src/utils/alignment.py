@@ -4,18 +4,18 @@ Alignment utilities for PCA results.
 import numpy as np
 
 
-def align_pca_signs(reference, target):
+def compute_alignment_signs(reference, target):
     """
-    Align signs of PCA components to match reference.
+    Compute per-component sign flips that align target with reference.
 
     Args:
         reference: Reference PCA result (n_samples, n_components)
         target: Target PCA result to align (n_samples, n_components)
 
     Returns:
-        NumPy array: Aligned target with flipped signs where needed
+        NumPy array: +1 or -1 per component
     """
-    aligned = target.copy()
+    signs = np.ones(target.shape[1])
 
     for i in range(target.shape[1]):
         # Compute correlation between components
@@ -23,6 +23,20 @@ def align_pca_signs(reference, target):
 
         # If negative correlation, flip the sign
         if correlation < 0:
-            aligned[:, i] = -aligned[:, i]
+            signs[i] = -1
+
+    return signs
+
+
+def align_pca_signs(reference, target):
+    """
+    Align signs of PCA components to match reference.
+
+    Args:
+        reference: Reference PCA result (n_samples, n_components)
+        target: Target PCA result to align (n_samples, n_components)
 
-    return aligned
+    Returns:
+        NumPy array: Aligned target with flipped signs where needed
+    """
+    return target * compute_alignment_signs(reference, target)
@@ -0,0 +1,21 @@
+"""
+Row batching utilities for chunked processing.
+"""
+
+
+def iter_row_slices(n_rows, chunk_size):
+    """
+    Split a row range into consecutive slices.
+
+    Args:
+        n_rows: Total number of rows
+        chunk_size: Maximum rows per slice
+
+    Yields:
+        slice: Row slice covering at most chunk_size rows
+    """
+    if chunk_size < 1:
+        raise ValueError(f"Chunk size must be positive, got {chunk_size}")
+
+    for start in range(0, n_rows, chunk_size):
+        yield slice(start, min(start + chunk_size, n_rows))
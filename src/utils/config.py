@@ -3,37 +3,65 @@ Configuration constants for the Dimension Reduction Visualizer.
 """
 import os
 
-# Base paths
+# Performance tuning parameters (src/utils/tuning.py), re-exported here as config.*
+from src.utils.tuning import (
+    CPU_COUNT, CSV_CHUNK_SIZE, VECTORIZER, HASHING_N_FEATURES, HASHING_SVD_FIT_ROWS,
+    MODEL_CACHE_MAX_ENTRIES, VECTORIZER_DEDUP, PCA_NUMPY_MODE, PCA_CHUNK_SIZE, PCA_SKLEARN_MODE,
+    PCA_BATCH_SIZE, TSNE_MODE, TSNE_LANDMARKS, TSNE_LANDMARK_K, TSNE_BATCH_SIZE, TSNE_DEDUP,
+    PRE_REDUCE_METHOD, PRE_REDUCE_DIM, PRE_REDUCE_EVAL_K, PRE_REDUCE_EVAL_QUERIES,
+    TSNE_SWEEP_WORKERS, PIPELINE_WORKERS, BATCH_WORKERS, RENDER_WORKERS, KNN_NEIGHBORS,
+    KNN_CHUNK_SIZE, KNN_WORKERS, QUALITY_K, QUALITY_SAMPLE, QUALITY_BATCH_SIZE,
+    SPAN_TRACEMALLOC, SERVE_HOST, SERVE_PORT, SERVE_MAX_BATCH, SERVE_MAX_WAIT_MS,
+    SERVE_METRICS_WINDOW, STARTUP_PROFILE_TOP, STARTUP_CLI_BUDGET_MS,
+)
+
+# Base paths (DRV_OUTPUT_DIR and DRV_INPUT_CSV redirect one run, e.g. under --batch)
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 INPUT_DIR = os.path.join(BASE_DIR, "input")
-OUTPUT_DIR = os.path.join(BASE_DIR, "output")
+OUTPUT_DIR = os.environ.get("DRV_OUTPUT_DIR", os.path.join(BASE_DIR, "output"))
 
 # File names
+PLOT_FORMAT = "png"  # any matplotlib savefig format, e.g. "svg" or "pdf"
 INPUT_CSV = "sentences.csv"
-OUTPUT_VECTORS = "vectors.txt"
-OUTPUT_PCA_NUMPY = "PCA_numpy.png"
-OUTPUT_PCA_SKLEARN = "PCA_sklearn.png"
-OUTPUT_TSNE = "Tsne.png"
+OUTPUT_VECTORS = "vectors.npy"
+OUTPUT_VECTORS_TEXT = "vectors.txt"
+OUTPUT_PCA_NUMPY = f"PCA_numpy.{PLOT_FORMAT}"
+OUTPUT_PCA_SKLEARN = f"PCA_sklearn.{PLOT_FORMAT}"
+OUTPUT_TSNE = f"Tsne.{PLOT_FORMAT}"
 OUTPUT_PCA_NUMPY_VECTORS = "PCA_numpy_vectors.txt"
 OUTPUT_PCA_SKLEARN_VECTORS = "PCA_sklearn_vectors.txt"
 OUTPUT_RUNTIME = "runtime.txt"
 
 # Full paths
-INPUT_CSV_PATH = os.path.join(INPUT_DIR, INPUT_CSV)
+INPUT_CSV_PATH = os.environ.get("DRV_INPUT_CSV", os.path.join(INPUT_DIR, INPUT_CSV))
 OUTPUT_VECTORS_PATH = os.path.join(OUTPUT_DIR, OUTPUT_VECTORS)
+OUTPUT_VECTORS_TEXT_PATH = os.path.join(OUTPUT_DIR, OUTPUT_VECTORS_TEXT)
 OUTPUT_PCA_NUMPY_PATH = os.path.join(OUTPUT_DIR, OUTPUT_PCA_NUMPY)
 OUTPUT_PCA_SKLEARN_PATH = os.path.join(OUTPUT_DIR, OUTPUT_PCA_SKLEARN)
 OUTPUT_TSNE_PATH = os.path.join(OUTPUT_DIR, OUTPUT_TSNE)
 OUTPUT_PCA_NUMPY_VECTORS_PATH = os.path.join(OUTPUT_DIR, OUTPUT_PCA_NUMPY_VECTORS)
 OUTPUT_PCA_SKLEARN_VECTORS_PATH = os.path.join(OUTPUT_DIR, OUTPUT_PCA_SKLEARN_VECTORS)
+OUTPUT_PCA_NUMPY_STORE_PATH = os.path.join(OUTPUT_DIR, "PCA_numpy_vectors.npy")
+OUTPUT_PCA_NUMPY_PROJECTION_PATH = os.path.join(OUTPUT_DIR, "PCA_numpy_projection.npz")
+OUTPUT_PCA_SKLEARN_PROJECTION_PATH = os.path.join(OUTPUT_DIR, "PCA_sklearn_projection.npz")
+OUTPUT_PROJECTED_NUMPY_VECTORS_PATH = os.path.join(OUTPUT_DIR, "Projected_numpy_vectors.txt")
+OUTPUT_PROJECTED_SKLEARN_VECTORS_PATH = os.path.join(OUTPUT_DIR, "Projected_sklearn_vectors.txt")
 OUTPUT_RUNTIME_PATH = os.path.join(OUTPUT_DIR, OUTPUT_RUNTIME)
+OUTPUT_WORD2VEC_DIR = os.path.join(OUTPUT_DIR, "word2vec")
+OUTPUT_TSNE_LANDMARKS_PATH = os.path.join(OUTPUT_DIR, "tsne_landmarks.npz")
+OUTPUT_KNN_DIR = os.path.join(OUTPUT_DIR, "knn")
+OUTPUT_SWEEP_DIR = os.path.join(OUTPUT_DIR, "sweep")
+OUTPUT_MANIFEST_PATH = os.path.join(OUTPUT_DIR, "manifest.json")
+OUTPUT_STARTUP_PROFILE_PATH = os.path.join(OUTPUT_DIR, "startup_profile.txt")
+OUTPUT_BATCH_DIR = os.path.join(OUTPUT_DIR, "batch")
 
 # Word2Vec parameters
 WORD2VEC_VECTOR_SIZE = 100
 WORD2VEC_WINDOW = 5
 WORD2VEC_MIN_COUNT = 1
-WORD2VEC_WORKERS = 4
+WORD2VEC_WORKERS = CPU_COUNT
 WORD2VEC_EPOCHS = 100
+WORD2VEC_TRAIN_MODE = "memory"  # or "corpus_file"
 
 # Dimension reduction parameters
 N_COMPONENTS = 3
@@ -44,6 +72,10 @@ TSNE_ITERATIONS = 1000
 FIGURE_SIZE = (10, 8)
 POINT_SIZE = 50
 ALPHA = 0.7
+PLOT_DPI = 300
+PLOT_POINT_BUDGET = None  # e.g. 50_000 to plot a stratified sample
+PLOT_DENSITY_BINS = None  # e.g. 32 to aggregate points beyond the budget
+PLOT_BACKEND = "Agg"  # non-interactive; plots are only ever saved to files
 
 # Color palette for categories (consistent across all visualizations)
 COLOR_PALETTE = [
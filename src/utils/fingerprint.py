@@ -0,0 +1,37 @@
+"""
+File and parameter fingerprinting utilities.
+"""
+import os
+from src.utils.hashing import hash_file, hash_params
+
+
+def file_entry(path, previous):
+    """Describe a file by size, mtime and digest, reusing a matching previous digest."""
+    stat = os.stat(path)
+    entry = {"size": stat.st_size, "mtime": stat.st_mtime}
+    if previous and all(previous.get(key) == value for key, value in entry.items()):
+        entry["digest"] = previous["digest"]
+    else:
+        entry["digest"] = hash_file(path)
+    return entry
+
+
+def fingerprint_inputs(inputs, params, previous_inputs):
+    """
+    Fingerprint input files together with a parameter mapping.
+
+    Args:
+        inputs: Input file paths (missing files are ignored)
+        params: JSON-serializable parameters
+        previous_inputs: Entries from an earlier fingerprint, used to skip
+            re-hashing files whose size and mtime are unchanged
+
+    Returns:
+        tuple: (fingerprint digest, dict of path -> size/mtime/digest entry)
+    """
+    entries = {
+        path: file_entry(path, previous_inputs.get(path))
+        for path in inputs if os.path.exists(path)
+    }
+    digests = {path: entry["digest"] for path, entry in entries.items()}
+    return hash_params({"inputs": digests, "params": params}), entries
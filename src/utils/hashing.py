@@ -0,0 +1,75 @@
+"""
+Content hashing utilities for cache keys.
+"""
+import hashlib
+import json
+import numpy as np
+
+
+def hash_params(params):
+    """
+    Hash a JSON-serializable parameter mapping.
+
+    Args:
+        params: Dict of parameter names to values
+
+    Returns:
+        str: Hex digest independent of key order
+    """
+    return hashlib.sha256(json.dumps(params, sort_keys=True).encode()).hexdigest()
+
+
+def hash_token_corpus(corpus, checkpoints=()):
+    """
+    Hash a tokenized corpus in a single streaming pass.
+
+    Args:
+        corpus: Iterable of tokenized sentences
+        checkpoints: Row counts at which to record prefix digests
+
+    Returns:
+        tuple: (digest, number of rows, dict of row count -> prefix digest)
+    """
+    hasher = hashlib.sha256()
+    prefixes = {0: hasher.hexdigest()} if 0 in checkpoints else {}
+    n_rows = 0
+    for n_rows, tokens in enumerate(corpus, start=1):
+        hasher.update(" ".join(tokens).encode() + b"\n")
+        if n_rows in checkpoints:
+            prefixes[n_rows] = hasher.hexdigest()
+    return hasher.hexdigest(), n_rows, prefixes
+
+
+def hash_array(data, chunk_size=100_000):
+    """
+    Hash an array's shape, dtype and contents chunk by chunk.
+
+    Args:
+        data: NumPy array or memory-mapped store (n_rows, n_features)
+        chunk_size: Rows hashed per chunk
+
+    Returns:
+        str: Hex digest of the array
+    """
+    hasher = hashlib.sha256(f"{data.shape}|{data.dtype}".encode())
+    for start in range(0, len(data), chunk_size):
+        hasher.update(np.ascontiguousarray(data[start:start + chunk_size]).tobytes())
+    return hasher.hexdigest()
+
+
+def hash_file(file_path, block_size=1 << 20):
+    """
+    Hash a file's contents in fixed-size blocks.
+
+    Args:
+        file_path: Path to the file
+        block_size: Bytes read per block
+
+    Returns:
+        str: Hex digest of the file
+    """
+    hasher = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            hasher.update(block)
+    return hasher.hexdigest()
@@ -0,0 +1,59 @@
+"""
+Import-time profiling utilities.
+"""
+import subprocess
+import sys
+from collections import defaultdict
+
+
+def parse_importtime(output):
+    """
+    Parse ``python -X importtime`` output.
+
+    Args:
+        output: stderr text produced by the interpreter
+
+    Returns:
+        list: (module name, self microseconds, cumulative microseconds) tuples
+    """
+    rows = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us), int(cumulative_us)))
+    return rows
+
+
+def profile_import(module_name, cwd):
+    """
+    Import a module in a fresh interpreter and record per-module import cost.
+
+    Args:
+        module_name: Dotted module path to import
+        cwd: Working directory (the project root, so ``src`` is importable)
+
+    Returns:
+        list: Rows as returned by parse_importtime
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+        capture_output=True, text=True, cwd=cwd, check=True
+    )
+    return parse_importtime(completed.stderr)
+
+
+def cost_by_package(rows):
+    """
+    Sum self import time per top-level package.
+
+    Args:
+        rows: Rows as returned by parse_importtime
+
+    Returns:
+        list: (package, milliseconds) sorted by descending cost
+    """
+    totals = defaultdict(int)
+    for name, self_us, _ in rows:
+        totals[name.split(".")[0]] += self_us
+    return sorted(((name, us / 1000) for name, us in totals.items()), key=lambda t: -t[1])
@@ -0,0 +1,36 @@
+"""
+JSON file helpers for caches and manifests.
+"""
+import json
+import os
+from src.utils.validators import validate_directory_exists
+
+
+def read_json(file_path, default):
+    """
+    Read a JSON file, falling back to a default if it doesn't exist.
+
+    Args:
+        file_path: Path to the JSON file
+        default: Value returned when the file is missing
+
+    Returns:
+        Parsed JSON content or default
+    """
+    if not os.path.exists(file_path):
+        return default
+    with open(file_path, "r") as f:
+        return json.load(f)
+
+
+def write_json(file_path, data):
+    """
+    Write data to a JSON file, creating its directory if needed.
+
+    Args:
+        file_path: Path to the JSON file
+        data: JSON-serializable data
+    """
+    validate_directory_exists(os.path.dirname(file_path))
+    with open(file_path, "w") as f:
+        json.dump(data, f, indent=2)
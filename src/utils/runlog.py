@@ -0,0 +1,91 @@
+"""
+JSON-lines run log; runtime.txt is rendered from its records.
+"""
+import json
+import os
+import threading
+from datetime import datetime
+from src.utils.validators import validate_directory_exists
+
+# One id per process, so records from separate CLI invocations stay apart
+RUN_ID = f"{datetime.now():%Y%m%dT%H%M%S}-{os.getpid()}"
+_WRITE_LOCK = threading.Lock()
+
+
+def runlog_path_for(runtime_path):
+    """Return the JSON-lines log that backs a rendered runtime file."""
+    return os.path.splitext(runtime_path)[0] + ".jsonl"
+
+
+def render_record(record):
+    """
+    Render one run-log record as runtime.txt text.
+
+    Args:
+        record: Run-log record dict
+
+    Returns:
+        str: Text block for the runtime file
+    """
+    if record["kind"] == "session":
+        return ("=" * 50 + "\nDIMENSION REDUCTION VISUALIZER - RUNTIME LOG\n" + "=" * 50
+                + f"\nGenerated: {record['time'][:19].replace('T', ' ')}\n")
+    if record["kind"] == "note":
+        return f"\n{record['message']}\n"
+    seconds = record["seconds"]
+    lines = [f"\n{record['path']}", "-" * 50,
+             f"Time: {seconds:.4f} seconds", f"Time: {seconds / 60:.4f} minutes"]
+    if record.get("rows_per_sec") is not None:
+        lines.append(f"Rows: {record['rows']} ({record['rows_per_sec']:.1f} rows/sec)")
+    if record.get("peak_rss_mb") is not None:
+        traced = ""
+        if record.get("tracemalloc_mb") is not None:
+            traced = (f"tracemalloc {record['tracemalloc_mb']:+.1f} MB "
+                      f"(peak {record['tracemalloc_peak_mb']:.1f} MB), ")
+        lines.append(f"Memory: {traced}RSS {record['rss_delta_mb']:+.1f} MB "
+                     f"(process peak {record['peak_rss_mb']:.1f} MB)")
+    return "\n".join(lines) + "\n"
+
+
+def write_record(runtime_path, kind, **fields):
+    """
+    Append a record to the run log and its rendering to the runtime file.
+
+    A "session" record starts a new rendered file, mirroring the old
+    behaviour of resetting runtime.txt on --prepare; the JSON log is
+    never truncated, so it accumulates across runs.
+
+    Args:
+        runtime_path: Path to the rendered runtime file
+        kind: "session", "note" or "span"
+        **fields: Record fields (name, path, seconds, rows, memory, message)
+
+    Returns:
+        dict: The written record
+    """
+    record = {"run": RUN_ID, "time": datetime.now().isoformat(), "kind": kind, **fields}
+    validate_directory_exists(os.path.dirname(runtime_path))
+    with _WRITE_LOCK:
+        with open(runlog_path_for(runtime_path), "a") as f:
+            f.write(json.dumps(record) + "\n")
+        with open(runtime_path, "w" if kind == "session" else "a") as f:
+            f.write(render_record(record))
+    return record
+
+
+def read_records(runlog_path, run=None):
+    """
+    Read run-log records, optionally only those of one run.
+
+    Args:
+        runlog_path: Path to the JSON-lines log
+        run: Optional run id to filter on
+
+    Returns:
+        list: Record dicts in write order
+    """
+    if not os.path.exists(runlog_path):
+        return []
+    with open(runlog_path) as f:
+        records = [json.loads(line) for line in f if line.strip()]
+    return [r for r in records if run is None or r["run"] == run]
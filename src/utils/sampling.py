@@ -0,0 +1,37 @@
+"""
+Stratified sampling utilities.
+"""
+import numpy as np
+
+
+def stratified_sample(categories, budget, seed=42):
+    """
+    Sample row indices proportionally per category.
+
+    Every category keeps at least one row, so rare categories survive
+    even when the budget is much smaller than the number of rows.
+
+    Args:
+        categories: Sequence of category labels, one per row
+        budget: Approximate number of rows to keep
+        seed: Random seed
+
+    Returns:
+        NumPy array: Sorted row indices of the sample
+    """
+    _, inverse, counts = np.unique(
+        np.asarray(categories), return_inverse=True, return_counts=True
+    )
+    if budget >= len(inverse):
+        return np.arange(len(inverse))
+
+    quotas = np.maximum(1, np.floor(budget * counts / len(inverse)).astype(int))
+    quotas = np.minimum(quotas, counts)
+
+    rng = np.random.default_rng(seed)
+    by_category = np.split(np.argsort(inverse, kind="stable"), np.cumsum(counts)[:-1])
+    chosen = [
+        rng.choice(rows, size=quota, replace=False)
+        for rows, quota in zip(by_category, quotas)
+    ]
+    return np.sort(np.concatenate(chosen))
@@ -0,0 +1,75 @@
+"""
+Nested profiling spans: wall time, throughput and memory per section of work.
+"""
+import contextvars
+import time
+import tracemalloc
+from src.utils import config
+from src.utils.memory import current_rss_mb, peak_rss_mb
+from src.utils.runlog import write_record
+
+_CURRENT_SPAN = contextvars.ContextVar("current_span", default=None)
+_MB = 2 ** 20
+
+
+def current_span_path():
+    """Return the path of the innermost open span, or None."""
+    current = _CURRENT_SPAN.get()
+    return current.path if current else None
+
+
+class Span:
+    """
+    Context manager timing a named section of work with perf_counter.
+
+    Spans opened inside another span are recorded under the parent's path
+    (e.g. "Word2Vec Vectorization / tokenize"). On exit the span writes
+    its time, rows/sec, RSS delta and process peak to the run log, plus
+    the tracemalloc delta and peak while tracemalloc is tracing. These
+    counts are process-wide, so concurrent spans on other threads share them.
+
+    Args:
+        name: Span name
+        rows: Rows processed; may also be set on the span before it exits
+        output_path: Rendered runtime file (defaults to OUTPUT_RUNTIME_PATH)
+    """
+
+    def __init__(self, name, rows=None, output_path=None):
+        self.name = name
+        self.rows = rows
+        self.output_path = output_path
+        self.parent = _CURRENT_SPAN.get()
+        self.path = f"{self.parent.path} / {name}" if self.parent else name
+        self.child_peak = 0
+        self.elapsed = None
+
+    def __enter__(self):
+        if config.SPAN_TRACEMALLOC and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        self._token = _CURRENT_SPAN.set(self)
+        self._traced, self._prior_peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        self._rss = current_rss_mb()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        self.elapsed = time.perf_counter() - self._start
+        traced, peak = tracemalloc.get_traced_memory()
+        peak = max(peak, self.child_peak)
+        _CURRENT_SPAN.reset(self._token)
+        if self.parent:
+            # reset_peak() on entry hid the parent's earlier peak; hand it back
+            self.parent.child_peak = max(self.parent.child_peak, self._prior_peak, peak)
+
+        tracing = tracemalloc.is_tracing()
+        record = write_record(
+            self.output_path or config.OUTPUT_RUNTIME_PATH, "span",
+            name=self.name, path=self.path, seconds=self.elapsed, rows=self.rows,
+            rows_per_sec=self.rows / self.elapsed if self.rows and self.elapsed else None,
+            tracemalloc_mb=(traced - self._traced) / _MB if tracing else None,
+            tracemalloc_peak_mb=(peak - self._traced) / _MB if tracing else None,
+            rss_delta_mb=current_rss_mb() - self._rss, peak_rss_mb=peak_rss_mb(),
+        )
+        print(f"{self.path} runtime: {self.elapsed:.4f} seconds"
+              + (f" ({record['rows_per_sec']:.1f} rows/sec)" if record["rows_per_sec"] else ""))
@@ -2,67 +2,74 @@
 Runtime tracking utilities.
 """
 import time
-import os
-from datetime import datetime
-from src.utils.validators import validate_directory_exists
+from src.utils.runlog import write_record
+from src.utils.spans import current_span_path
 
 
 def initialize_runtime_file(output_path):
     """
-    Initialize runtime file with header.
+    Start a new runtime session: the rendered file restarts with a header.
 
     Args:
         output_path: Path to runtime file
     """
-    validate_directory_exists(os.path.dirname(output_path))
+    write_record(output_path, "session")
 
-    with open(output_path, "w") as f:
-        f.write("=" * 50 + "\n")
-        f.write("DIMENSION REDUCTION VISUALIZER - RUNTIME LOG\n")
-        f.write("=" * 50 + "\n")
-        f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
 
-
-def save_runtime(runtime, operation_name, output_path, append=True):
+def save_runtime(runtime, operation_name, output_path, append=True, rows=None):
     """
-    Save runtime to file.
+    Record a runtime in the run log and the rendered runtime file.
 
     Args:
         runtime: Runtime in seconds
         operation_name: Name of the operation
         output_path: Path to save runtime file
-        append: If True, append to file; if False, overwrite
+        append: If True, append to file; if False, start a new session first
+        rows: Optional number of rows processed, for throughput
     """
-    validate_directory_exists(os.path.dirname(output_path))
-
-    mode = "a" if append else "w"
-    with open(output_path, mode) as f:
-        f.write(f"\n{operation_name}\n")
-        f.write("-" * 50 + "\n")
-        f.write(f"Time: {runtime:.4f} seconds\n")
-        f.write(f"Time: {runtime/60:.4f} minutes\n")
+    if not append:
+        initialize_runtime_file(output_path)
+    parent = current_span_path()
+    write_record(
+        output_path, "span", name=operation_name,
+        path=f"{parent} / {operation_name}" if parent else operation_name,
+        seconds=runtime, rows=rows,
+        rows_per_sec=rows / runtime if rows and runtime else None
+    )
 
     print(f"{operation_name} runtime: {runtime:.4f} seconds")
     if not append:
         print(f"Runtime saved to: {output_path}")
 
 
+def log_runtime_note(message, output_path):
+    """
+    Append a one-line note (e.g. a cache hit) to the runtime file.
+
+    Args:
+        message: Note to record
+        output_path: Path to runtime file
+    """
+    write_record(output_path, "note", message=message)
+    print(message)
+
+
 class Timer:
-    """Context manager for timing operations."""
+    """Context manager for timing operations (monotonic perf_counter clock)."""
 
     def __init__(self):
         self.start_time = None
         self.end_time = None
 
     def __enter__(self):
-        self.start_time = time.time()
+        self.start_time = time.perf_counter()
         return self
 
     def __exit__(self, *args):
-        self.end_time = time.time()
+        self.end_time = time.perf_counter()
 
     def elapsed(self):
         """Get elapsed time in seconds."""
-        if self.start_time and self.end_time:
+        if self.start_time is not None and self.end_time is not None:
             return self.end_time - self.start_time
         return 0
@@ -0,0 +1,65 @@
+"""
+Performance tuning parameters, re-exported by config.
+"""
+import os
+
+# Cores one run may use; --batch sets DRV_CPUS to split the machine between runs
+CPU_COUNT = int(os.environ.get("DRV_CPUS", "0")) or os.cpu_count() or 4
+
+# Streaming ingestion
+CSV_CHUNK_SIZE = 100_000
+
+# Vectorizer backend ("word2vec" or "hashing")
+VECTORIZER = "word2vec"
+HASHING_N_FEATURES = 2 ** 20
+HASHING_SVD_FIT_ROWS = 100_000
+MODEL_CACHE_MAX_ENTRIES = 8  # cached Word2Vec models kept (least recently used evicted)
+VECTORIZER_DEDUP = True  # vectorize each distinct sentence once (lossless)
+
+# Dimension reduction modes
+PCA_NUMPY_MODE = "memory"  # or "streaming" (out-of-core)
+PCA_CHUNK_SIZE = 100_000
+PCA_SKLEARN_MODE = "auto"  # "auto", "randomized" or "incremental"
+PCA_BATCH_SIZE = 10_000
+TSNE_MODE = "full"  # or "landmark"
+TSNE_LANDMARKS = 5000
+TSNE_LANDMARK_K = 10
+TSNE_BATCH_SIZE = 10_000
+TSNE_DEDUP = False  # embed each distinct vector once (duplicates share a point)
+PRE_REDUCE_METHOD = None  # or "gaussian", "sparse", "pca"
+PRE_REDUCE_DIM = 50
+PRE_REDUCE_EVAL_K = 10
+PRE_REDUCE_EVAL_QUERIES = 1000
+TSNE_SWEEP_WORKERS = CPU_COUNT
+
+# Concurrent --all pipeline (NumPy PCA, scikit-learn PCA and t-SNE branches)
+PIPELINE_WORKERS = 3
+
+# --batch: datasets processed at once (each in its own process)
+BATCH_WORKERS = CPU_COUNT
+
+# Background plot rendering (0 renders inline on the calling thread)
+RENDER_WORKERS = 2
+
+# Shared kNN graph and embedding-quality metrics
+KNN_NEIGHBORS = 32  # t-SNE needs at least 3 * perplexity + 1
+KNN_CHUNK_SIZE = 10_000
+KNN_WORKERS = CPU_COUNT
+QUALITY_K = 10
+QUALITY_SAMPLE = 1000
+QUALITY_BATCH_SIZE = 100
+
+# Profiling spans; tracemalloc (also enabled by --trace-memory) roughly
+# doubles the runtime of allocation-heavy stages such as t-SNE
+SPAN_TRACEMALLOC = False
+
+# --serve (local embedding server)
+SERVE_HOST = "127.0.0.1"
+SERVE_PORT = 8765
+SERVE_MAX_BATCH = 256  # sentences per micro-batch
+SERVE_MAX_WAIT_MS = 5  # how long a batch waits for more requests
+SERVE_METRICS_WINDOW = 10_000  # recent requests kept for percentiles
+
+# --profile-startup
+STARTUP_PROFILE_TOP = 8
+STARTUP_CLI_BUDGET_MS = 250
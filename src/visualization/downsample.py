@@ -0,0 +1,81 @@
+"""
+Point-budget downsampling and density aggregation for large plots.
+"""
+import numpy as np
+from src.utils.sampling import stratified_sample
+
+
+def voxel_aggregate(points, bins):
+    """
+    Aggregate points into a regular 3D voxel grid.
+
+    Args:
+        points: Array of 3D coordinates (n_points, 3)
+        bins: Number of voxels along each axis
+
+    Returns:
+        tuple: (voxel centroids (n_voxels, 3), points per voxel (n_voxels,))
+    """
+    if len(points) == 0:
+        return np.empty((0, 3)), np.empty(0, dtype=int)
+    low, high = points.min(axis=0), points.max(axis=0)
+    scale = np.where(high > low, high - low, 1.0)
+    cells = np.minimum(((points - low) / scale * bins).astype(int), bins - 1)
+    flat = np.ravel_multi_index(cells.T, (bins, bins, bins))
+    _, inverse, counts = np.unique(flat, return_inverse=True, return_counts=True)
+    inverse = inverse.ravel()
+    centroids = np.column_stack([
+        np.bincount(inverse, weights=points[:, axis]) / counts for axis in range(3)
+    ])
+    return centroids, counts
+
+
+def downsample_for_plot(data, categories, budget, density_bins=None):
+    """
+    Reduce a point set to a plotting budget.
+
+    Keeps a category-stratified sample (every category keeps at least one
+    point) and optionally summarizes the dropped points as voxel densities.
+
+    Args:
+        data: Array of 3D coordinates (n_samples, 3)
+        categories: Category label per row
+        budget: Maximum number of individually drawn points, or None
+        density_bins: Voxels per axis for aggregating dropped points, or None
+
+    Returns:
+        tuple: (sampled points, sampled categories, density) where density
+            is (centroids, counts) or None
+    """
+    if not budget or len(data) <= budget:
+        return data, categories, None
+
+    keep = stratified_sample(categories, budget)
+    labels = np.asarray(categories)
+    density = None
+    if density_bins:
+        dropped = np.ones(len(data), dtype=bool)
+        dropped[keep] = False
+        density = voxel_aggregate(np.asarray(data)[dropped], density_bins)
+    voxels = f" (+ {len(density[1])} density voxels)" if density is not None else ""
+    print(f"Plot downsampled: {len(data)} -> {len(keep)} points{voxels}")
+    return np.asarray(data[keep]), labels[keep].tolist(), density
+
+
+def draw_density(ax, density):
+    """
+    Draw aggregated voxels as grey markers sized by point count.
+
+    Args:
+        ax: 3D matplotlib axes
+        density: (centroids, counts) from voxel_aggregate
+    """
+    centroids, counts = density
+    if len(counts) == 0:
+        return
+    sizes = 4 + 40 * np.log1p(counts) / np.log1p(counts.max())
+    ax.scatter(
+        centroids[:, 0], centroids[:, 1], centroids[:, 2],
+        s=sizes, c="grey", alpha=0.25, linewidths=0,
+        label=f"density ({int(counts.sum())} points)"
+    )
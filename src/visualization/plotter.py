@@ -1,65 +1,100 @@
 """
 3D visualization utilities.
 """
-import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
+import os
+import threading
+import matplotlib
+import numpy as np
 from src.utils import config
 from src.utils.validators import validate_directory_exists
 from src.utils.colors import get_category_colors
-import os
+from src.visualization.downsample import downsample_for_plot, draw_density
+
+matplotlib.use(config.PLOT_BACKEND)
+import matplotlib.pyplot as plt  # noqa: E402
+from mpl_toolkits.mplot3d import Axes3D  # noqa: E402,F401
+
+# pyplot keeps global figure state, so concurrent stages plot one at a time
+_PLOT_LOCK = threading.Lock()
+
+
+def group_by_category(categories):
+    """
+    Group row indices by category in one vectorized pass.
+
+    Args:
+        categories: Sequence of category labels, one per row
+
+    Returns:
+        tuple: (sorted unique categories as list, list of row index arrays)
+    """
+    unique_categories, inverse, counts = np.unique(
+        np.asarray(categories), return_inverse=True, return_counts=True
+    )
+    order = np.argsort(inverse.ravel(), kind="stable")
+    return unique_categories.tolist(), np.split(order, np.cumsum(counts)[:-1])
 
 
-def plot_3d_scatter(data, categories, title, output_path):
+def plot_3d_scatter(data, categories, title, output_path,
+                    plot_budget=config.PLOT_POINT_BUDGET,
+                    density_bins=config.PLOT_DENSITY_BINS):
     """
     Create and save 3D scatter plot.
 
+    Points are grouped once with NumPy and each category is drawn as a
+    single marker-only line: Agg stamps one cached marker per point,
+    which is several times faster than per-point scatter paths.
+
     Args:
         data: NumPy array of 3D coordinates (n_samples, 3)
         categories: List of category labels
         title: Plot title
         output_path: Path to save the plot
+        plot_budget: Maximum points drawn individually (None draws all)
+        density_bins: Voxels per axis summarizing points beyond the budget
 
     Raises:
         ValueError: If data is not 3D
     """
     if data.shape[1] != 3:
         raise ValueError(f"Expected 3D data, got {data.shape[1]} dimensions")
-
     validate_directory_exists(os.path.dirname(output_path))
+    data, categories, density = downsample_for_plot(data, categories, plot_budget, density_bins)
+    unique_categories, groups = group_by_category(categories)
+    category_colors = get_category_colors(unique_categories)
+
+    with _PLOT_LOCK:
+        fig = plt.figure(figsize=config.FIGURE_SIZE)
+        ax = fig.add_subplot(111, projection='3d')
+        if density is not None:
+            draw_density(ax, density)
+
+        # Plot each category with consistent colors
+        for category, rows in zip(unique_categories, groups):
+            ax.plot(
+                data[rows, 0],
+                data[rows, 1],
+                data[rows, 2],
+                linestyle='',
+                marker='o',
+                markersize=config.POINT_SIZE ** 0.5,
+                color=category_colors[category],
+                label=category,
+                alpha=config.ALPHA,
+                markeredgecolor='black',
+                markeredgewidth=0.5
+            )
+
+        ax.set_xlabel('Component 1')
+        ax.set_ylabel('Component 2')
+        ax.set_zlabel('Component 3')
+        ax.set_title(title)
+        # A fixed location avoids the per-point overlap search of loc="best"
+        ax.legend(loc='upper right')
 
-    # Create figure
-    fig = plt.figure(figsize=config.FIGURE_SIZE)
-    ax = fig.add_subplot(111, projection='3d')
-
-    # Get unique categories and color mapping
-    unique_categories = sorted(list(set(categories)))
-    category_colors = get_category_colors(categories)
-
-    # Plot each category with consistent colors
-    for category in unique_categories:
-        mask = [cat == category for cat in categories]
-        category_data = data[mask]
-
-        ax.scatter(
-            category_data[:, 0],
-            category_data[:, 1],
-            category_data[:, 2],
-            c=category_colors[category],
-            label=category,
-            s=config.POINT_SIZE,
-            alpha=config.ALPHA,
-            edgecolors='black',
-            linewidth=0.5
-        )
-
-    ax.set_xlabel('Component 1')
-    ax.set_ylabel('Component 2')
-    ax.set_zlabel('Component 3')
-    ax.set_title(title)
-    ax.legend()
-
-    plt.tight_layout()
-    plt.savefig(output_path, dpi=300, bbox_inches='tight')
-    plt.close()
+        plt.tight_layout()
+        plt.savefig(output_path, dpi=config.PLOT_DPI, format=config.PLOT_FORMAT,
+                    bbox_inches='tight')
+        plt.close(fig)
 
     print(f"Visualization saved to: {output_path}")
@@ -0,0 +1,100 @@
+"""
+Background plot rendering on a process pool fed through shared memory.
+"""
+import atexit
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+import numpy as np
+from src.utils import config
+from src.utils.timing import Timer, save_runtime, log_runtime_note
+
+_SERVICE_LOCK = threading.Lock()
+_service = None
+
+
+def _render_job(shm_name, shape, dtype, categories, title, output_path, plot_options):
+    """Render one plot from shared-memory coordinates (runs in a worker)."""
+    from src.visualization.plotter import plot_3d_scatter
+
+    shm = SharedMemory(name=shm_name)
+    data = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    with Timer() as timer:
+        plot_3d_scatter(data, categories, title, output_path, **plot_options)
+    del data  # release the buffer before closing; the parent unlinks it
+    shm.close()
+    return timer.elapsed()
+
+
+class RenderService:
+    """Process pool that renders queued 3D scatter plots."""
+
+    def __init__(self, workers=config.RENDER_WORKERS):
+        context = multiprocessing.get_context("spawn")
+        self.pool = ProcessPoolExecutor(workers, mp_context=context)
+        self.jobs = []
+
+    def submit(self, data, categories, title, output_path, **plot_options):
+        """Copy coordinates into shared memory and queue the render."""
+        data = np.ascontiguousarray(data)
+        shm = SharedMemory(create=True, size=max(data.nbytes, 1))
+        np.ndarray(data.shape, dtype=data.dtype, buffer=shm.buf)[:] = data
+        future = self.pool.submit(
+            _render_job, shm.name, data.shape, data.dtype.str, list(categories),
+            title, output_path, plot_options
+        )
+        self.jobs.append((output_path, future, shm))
+
+    def wait(self):
+        """Block until every queued render finishes and log render times."""
+        jobs, self.jobs = self.jobs, []
+        failures = []
+        with Timer() as barrier:
+            for output_path, future, shm in jobs:
+                try:
+                    elapsed = future.result()
+                    save_runtime(elapsed, f"Render: {os.path.basename(output_path)}",
+                                 config.OUTPUT_RUNTIME_PATH)
+                except Exception as error:
+                    failures.append(f"{output_path}: {error}")
+                finally:
+                    shm.close()
+                    shm.unlink()
+        if failures:
+            raise RuntimeError("Plot rendering failed: " + "; ".join(failures))
+        log_runtime_note(
+            f"Render barrier: waited {barrier.elapsed():.4f} seconds for {len(jobs)} plots",
+            config.OUTPUT_RUNTIME_PATH
+        )
+
+
+def submit_plot(data, categories, title, output_path, **plot_options):
+    """
+    Queue a 3D scatter plot, or render it inline when RENDER_WORKERS is 0.
+
+    Args:
+        data: NumPy array of 3D coordinates (n_samples, 3)
+        categories: List of category labels
+        title: Plot title
+        output_path: Path to save the plot
+        **plot_options: Extra plot_3d_scatter keyword arguments
+    """
+    global _service
+    if not config.RENDER_WORKERS:
+        from src.visualization.plotter import plot_3d_scatter
+        plot_3d_scatter(data, categories, title, output_path, **plot_options)
+        return
+    with _SERVICE_LOCK:
+        if _service is None:
+            _service = RenderService()
+            atexit.register(wait_for_renders)
+        _service.submit(data, categories, title, output_path, **plot_options)
+
+
+def wait_for_renders():
+    """Barrier: wait for all queued plots before the process exits."""
+    with _SERVICE_LOCK:
+        if _service is not None and _service.jobs:
+            _service.wait()
@@ -0,0 +1,77 @@
+"""
+Aggregate runtime report for a --batch run.
+"""
+import os
+from collections import defaultdict
+from src.utils import config
+from src.utils.json_io import write_json
+from src.utils.runlog import read_records, runlog_path_for
+from src.utils.timing import initialize_runtime_file, save_runtime, log_runtime_note
+
+
+def summarize_run_log(output_dir):
+    """
+    Summarize the latest run recorded in a dataset's run log.
+
+    Args:
+        output_dir: Dataset output directory
+
+    Returns:
+        tuple: (rows processed, dict of top-level span name -> seconds)
+    """
+    records = read_records(runlog_path_for(os.path.join(output_dir, config.OUTPUT_RUNTIME)))
+    if not records:
+        return None, {}
+    spans = [record for record in records
+             if record["run"] == records[-1]["run"] and record["kind"] == "span"]
+    stages = defaultdict(float)
+    for span in spans:
+        if " / " not in span["path"]:
+            stages[span["name"]] += span["seconds"]
+    rows = max((span["rows"] for span in spans if span.get("rows")), default=None)
+    return rows, dict(stages)
+
+
+def write_batch_report(results, wall_seconds, workers):
+    """
+    Write the batch runtime log and JSON report under output/batch/.
+
+    runtime.txt gets one entry per dataset plus the batch wall time;
+    report.json adds each dataset's per-stage breakdown.
+
+    Args:
+        results: Per-dataset result dicts from the batch workers
+        wall_seconds: Wall time of the whole batch
+        workers: Datasets processed at once
+
+    Returns:
+        list: Names of the datasets that failed
+    """
+    runtime_path = os.path.join(config.OUTPUT_BATCH_DIR, config.OUTPUT_RUNTIME)
+    initialize_runtime_file(runtime_path)
+    datasets, failed = [], []
+    for result in sorted(results, key=lambda item: item["dataset"]):
+        rows, stages = summarize_run_log(result["output_dir"])
+        datasets.append({**result, "rows": rows, "stages": stages})
+        if result["error"]:
+            failed.append(result["dataset"])
+            log_runtime_note(f"Dataset {result['dataset']} failed: {result['error']}",
+                             runtime_path)
+        else:
+            save_runtime(result["seconds"], f"Dataset: {result['dataset']}", runtime_path,
+                         rows=rows)
+
+    total_rows = sum(dataset["rows"] or 0 for dataset in datasets if not dataset["error"])
+    dataset_seconds = sum(dataset["seconds"] for dataset in datasets)
+    save_runtime(wall_seconds, f"Batch ({len(datasets)} datasets, {workers} workers)",
+                 runtime_path, rows=total_rows or None)
+    log_runtime_note(
+        f"Batch: {wall_seconds:.2f} s wall time for {dataset_seconds:.2f} s of dataset time "
+        f"({dataset_seconds / wall_seconds if wall_seconds else 0:.2f}x concurrency), "
+        f"{len(failed)} failed", runtime_path
+    )
+    report_path = os.path.join(config.OUTPUT_BATCH_DIR, "report.json")
+    write_json(report_path, {"workers": workers, "wall_seconds": wall_seconds,
+                             "rows": total_rows, "datasets": datasets})
+    print(f"Batch report saved to: {report_path}")
+    return failed
@@ -0,0 +1,100 @@
+"""
+Batch workflow: run the pipeline for every matching CSV on a bounded process pool.
+"""
+import glob
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from src.data.csv_reader import read_columns
+from src.utils import config
+from src.workflows.batch_report import write_batch_report
+
+MAIN_SCRIPT = os.path.join(config.BASE_DIR, "main.py")
+THREAD_ENV_VARS = ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS")
+
+
+def find_datasets(pattern):
+    """
+    Find the CSV files matching a glob, relative to the working or input directory.
+
+    Args:
+        pattern: Glob pattern, e.g. "input/*.csv" or "sentences*.csv"
+
+    Returns:
+        dict: Dataset name (file stem) -> CSV path
+
+    Raises:
+        FileNotFoundError: If nothing matches
+        ValueError: If two matches share a file name
+    """
+    paths = sorted(glob.glob(pattern)) or sorted(glob.glob(os.path.join(config.INPUT_DIR, pattern)))
+    if not paths:
+        raise FileNotFoundError(f"No CSV files match '{pattern}'")
+    datasets = {os.path.splitext(os.path.basename(p))[0]: os.path.abspath(p) for p in paths}
+    if len(datasets) < len(paths):
+        raise ValueError(f"CSV files matching '{pattern}' must have distinct names")
+    return datasets
+
+
+def _run_dataset(name, csv_path, step_args, cpus):
+    """Run main.py for one dataset with its own input, output directory and core share."""
+    output_dir = os.path.join(config.OUTPUT_BATCH_DIR, name)
+    result = {"dataset": name, "csv": csv_path, "output_dir": output_dir}
+    try:
+        read_columns(csv_path)
+    except (FileNotFoundError, ValueError) as error:
+        return {**result, "returncode": None, "error": str(error), "seconds": 0.0}
+    os.makedirs(output_dir, exist_ok=True)
+    env = {**os.environ, "DRV_INPUT_CSV": csv_path, "DRV_OUTPUT_DIR": output_dir,
+           "DRV_CPUS": str(cpus)}
+    for var in THREAD_ENV_VARS:
+        env.setdefault(var, str(cpus))
+    start = time.perf_counter()
+    with open(os.path.join(output_dir, "batch.log"), "w") as log:
+        process = subprocess.run([sys.executable, MAIN_SCRIPT, *step_args], env=env,
+                                 stdout=log, stderr=subprocess.STDOUT, cwd=config.BASE_DIR)
+    error = None if process.returncode == 0 else f"exit code {process.returncode}, see batch.log"
+    return {**result, "returncode": process.returncode, "error": error,
+            "seconds": time.perf_counter() - start}
+
+
+def run_batch(pattern, step_args, workers=config.BATCH_WORKERS):
+    """
+    Run the selected steps for every CSV matching a glob.
+
+    Each dataset runs in its own process with its output in
+    output/batch/<name>/; at most `workers` datasets run at once and the
+    cores are split evenly between them.
+
+    Args:
+        pattern: Glob pattern selecting the CSV files
+        step_args: main.py arguments run for each dataset (e.g. ["--all"])
+        workers: Maximum datasets processed at once
+
+    Raises:
+        RuntimeError: If any dataset failed (after the report is written)
+    """
+    print("=" * 50)
+    print("RUNNING BATCH")
+    print("=" * 50)
+
+    datasets = find_datasets(pattern)
+    workers = max(1, min(workers, len(datasets)))
+    cpus = max(1, config.CPU_COUNT // workers)
+    print(f"main.py {' '.join(step_args)} on {len(datasets)} datasets, {workers} at a time")
+    start, results = time.perf_counter(), []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_run_dataset, name, path, step_args, cpus)
+                   for name, path in datasets.items()]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            status = result["error"] or f"done in {result['seconds']:.1f} s"
+            print(f"  {result['dataset']}: {status}")
+
+    failed = write_batch_report(results, time.perf_counter() - start, workers)
+    print("Batch complete!\n")
+    if failed:
+        raise RuntimeError(f"Batch datasets failed: {', '.join(failed)}")
@@ -0,0 +1,57 @@
+"""
+Minimal DAG runner executing stages on a thread pool.
+"""
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from src.utils.memory import RssMonitor
+from src.utils.timing import Timer
+
+# func receives the results of deps positionally, in order
+DagNode = namedtuple("DagNode", ["name", "func", "deps"])
+NodeStats = namedtuple("NodeStats", ["elapsed", "peak_rss_mb"])
+
+
+def _run_node(node, dep_results):
+    """Run one node, measuring wall time and peak process RSS."""
+    with Timer() as timer, RssMonitor() as monitor:
+        result = node.func(*dep_results)
+    return result, NodeStats(timer.elapsed(), monitor.peak_mb)
+
+
+def run_dag(nodes, workers):
+    """
+    Run nodes concurrently, each as soon as all of its dependencies finish.
+
+    Results stay in memory and are handed directly to dependent nodes.
+
+    Args:
+        nodes: Iterable of DagNode
+        workers: Maximum number of concurrently running nodes
+
+    Returns:
+        tuple: (dict of name -> result, dict of name -> NodeStats)
+
+    Raises:
+        ValueError: If a dependency is unknown or the graph has a cycle
+    """
+    pending = {node.name: node for node in nodes}
+    for node in pending.values():
+        unknown = set(node.deps) - set(pending)
+        if unknown:
+            raise ValueError(f"Node {node.name} depends on unknown nodes: {unknown}")
+
+    results, stats, running = {}, {}, {}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        while pending or running:
+            for name, node in list(pending.items()):
+                if all(dep in results for dep in node.deps):
+                    dep_results = [results[dep] for dep in node.deps]
+                    running[pool.submit(_run_node, node, dep_results)] = name
+                    del pending[name]
+            if not running:
+                raise ValueError(f"Dependency cycle among nodes: {list(pending)}")
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                results[name], stats[name] = future.result()
+    return results, stats
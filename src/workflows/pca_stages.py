@@ -0,0 +1,97 @@
+"""
+PCA stages shared by the sequential workflow and the pipeline runner.
+"""
+from src.data.vector_io import load_vectors, save_vectors
+from src.reduction.pca_numpy import run_pca_numpy
+from src.reduction.pca_streaming import run_pca_numpy_streaming
+from src.reduction.pca_sklearn import run_pca_sklearn
+from src.preprocessing.store_params import store_identity
+from src.reduction.projection import save_projection
+from src.visualization.render_service import submit_plot
+from src.workflows.quality_report import report_quality
+from src.utils import config
+from src.utils.alignment import compute_alignment_signs
+from src.utils.spans import Span
+
+
+def pca_numpy_stage(vectors, categories, numpy_mode=config.PCA_NUMPY_MODE, plot_options=None):
+    """
+    Run NumPy PCA, then save, plot and score its result.
+
+    Args:
+        vectors: Vectors to reduce
+        categories: Category labels
+        numpy_mode: "memory" or "streaming"
+        plot_options: Extra plot_3d_scatter keyword arguments
+
+    Returns:
+        NumPy array: NumPy PCA result (n_samples, N_COMPONENTS)
+    """
+    print(f"\nRunning PCA with NumPy ({numpy_mode})...")
+    label = "PCA (NumPy, streaming)" if numpy_mode == "streaming" else "PCA (NumPy)"
+    with Span(label, rows=len(vectors)):
+        if numpy_mode == "streaming":
+            numpy_projection = run_pca_numpy_streaming(
+                vectors, categories, config.OUTPUT_PCA_NUMPY_STORE_PATH
+            )
+            pca_numpy_result, _ = load_vectors(config.OUTPUT_PCA_NUMPY_STORE_PATH)
+        else:
+            pca_numpy_result, numpy_projection = run_pca_numpy(vectors, categories)
+    save_projection(numpy_projection, config.OUTPUT_PCA_NUMPY_PROJECTION_PATH, store_identity())
+    save_vectors(pca_numpy_result, categories, config.OUTPUT_PCA_NUMPY_VECTORS_PATH)
+    print(f"NumPy PCA vectors saved to: {config.OUTPUT_PCA_NUMPY_VECTORS_PATH}")
+    submit_plot(
+        pca_numpy_result, categories, "PCA (NumPy Implementation)",
+        config.OUTPUT_PCA_NUMPY_PATH, **(plot_options or {})
+    )
+    report_quality(vectors, pca_numpy_result, "PCA (NumPy)")
+    return pca_numpy_result
+
+
+def pca_sklearn_stage(vectors, categories, sklearn_mode=config.PCA_SKLEARN_MODE,
+                      batch_size=config.PCA_BATCH_SIZE):
+    """
+    Fit scikit-learn PCA (alignment happens in align_pca_stage).
+
+    Args:
+        vectors: Vectors to reduce
+        categories: Category labels
+        sklearn_mode: "auto" or "randomized" solver, or "incremental"
+        batch_size: Rows per batch for incremental PCA
+
+    Returns:
+        tuple: (unaligned result, projection dict)
+    """
+    print(f"\nRunning PCA with scikit-learn ({sklearn_mode})...")
+    with Span(f"PCA (Scikit-learn, mode={sklearn_mode})", rows=len(vectors)):
+        return run_pca_sklearn(vectors, categories, mode=sklearn_mode, batch_size=batch_size)
+
+
+def align_pca_stage(vectors, categories, pca_numpy_result, sklearn_output,
+                    plot_options=None):
+    """
+    Align scikit-learn PCA to NumPy PCA, then save, plot and score it.
+
+    Args:
+        vectors: Original vectors
+        categories: Category labels
+        pca_numpy_result: Result of pca_numpy_stage
+        sklearn_output: (result, projection) from pca_sklearn_stage
+        plot_options: Extra plot_3d_scatter keyword arguments
+    """
+    pca_sklearn_result, sklearn_projection = sklearn_output
+    print("Aligning sklearn PCA components to match numpy PCA...")
+    signs = compute_alignment_signs(pca_numpy_result, pca_sklearn_result)
+    pca_sklearn_result = pca_sklearn_result * signs
+    sklearn_projection["signs"] = signs
+    save_projection(
+        sklearn_projection, config.OUTPUT_PCA_SKLEARN_PROJECTION_PATH, store_identity()
+    )
+
+    save_vectors(pca_sklearn_result, categories, config.OUTPUT_PCA_SKLEARN_VECTORS_PATH)
+    print(f"Sklearn PCA vectors saved to: {config.OUTPUT_PCA_SKLEARN_VECTORS_PATH}")
+    submit_plot(
+        pca_sklearn_result, categories, "PCA (Scikit-learn Implementation) - Aligned",
+        config.OUTPUT_PCA_SKLEARN_PATH, **(plot_options or {})
+    )
+    report_quality(vectors, pca_sklearn_result, "PCA (Scikit-learn)")
@@ -1,17 +1,38 @@
 """
 PCA workflow.
 """
-from src.data.vector_io import load_vectors, save_vectors
-from src.reduction.pca_numpy import run_pca_numpy
-from src.reduction.pca_sklearn import run_pca_sklearn
-from src.visualization.plotter import plot_3d_scatter
+from src.data.vector_io import load_vectors
+from src.data.vector_store import labels_path_for
+from src.workflows.pca_stages import pca_numpy_stage, pca_sklearn_stage, align_pca_stage
+from src.workflows.stage_cache import cached_stage, vector_store_inputs, PLOT_CONFIG
 from src.utils import config
-from src.utils.alignment import align_pca_signs
-from src.utils.timing import Timer, save_runtime
 
 
-def run_pca():
-    """Run both PCA implementations and visualize."""
+@cached_stage(
+    "pca", inputs=vector_store_inputs,
+    outputs=lambda args: [
+        config.OUTPUT_PCA_NUMPY_VECTORS_PATH, config.OUTPUT_PCA_SKLEARN_VECTORS_PATH,
+        config.OUTPUT_PCA_NUMPY_PATH, config.OUTPUT_PCA_SKLEARN_PATH,
+        config.OUTPUT_PCA_NUMPY_PROJECTION_PATH, config.OUTPUT_PCA_SKLEARN_PROJECTION_PATH,
+    ] + ([config.OUTPUT_PCA_NUMPY_STORE_PATH, labels_path_for(config.OUTPUT_PCA_NUMPY_STORE_PATH)]
+         if args["numpy_mode"] == "streaming" else []),
+    config_prefixes=("N_COMPONENTS", "PCA_", "KNN_", "QUALITY_") + PLOT_CONFIG
+)
+def run_pca(numpy_mode=config.PCA_NUMPY_MODE, sklearn_mode=config.PCA_SKLEARN_MODE,
+            batch_size=config.PCA_BATCH_SIZE, plot_budget=config.PLOT_POINT_BUDGET,
+            density_bins=config.PLOT_DENSITY_BINS):
+    """
+    Run both PCA implementations and visualize.
+
+    Args:
+        numpy_mode: "memory" for in-memory NumPy PCA, "streaming" for the
+            out-of-core variant that writes its result to a binary store
+        sklearn_mode: "auto" or "randomized" solver, or "incremental"
+        batch_size: Rows per batch for incremental scikit-learn PCA
+        plot_budget: Maximum points drawn per plot (None draws all); the
+            saved vector files always keep every row
+        density_bins: Voxels per axis summarizing points beyond the budget
+    """
     print("=" * 50)
     print("RUNNING PCA")
     print("=" * 50)
@@ -21,37 +42,9 @@ def run_pca():
     vectors, categories = load_vectors(config.OUTPUT_VECTORS_PATH)
     print(f"Loaded {len(vectors)} vectors")
 
-    # NumPy PCA
-    print("\nRunning PCA with NumPy...")
-    with Timer() as numpy_timer:
-        pca_numpy_result = run_pca_numpy(vectors, categories)
-    save_runtime(numpy_timer.elapsed(), "PCA (NumPy)", config.OUTPUT_RUNTIME_PATH)
-    save_vectors(pca_numpy_result, categories, config.OUTPUT_PCA_NUMPY_VECTORS_PATH)
-    print(f"NumPy PCA vectors saved to: {config.OUTPUT_PCA_NUMPY_VECTORS_PATH}")
-    plot_3d_scatter(
-        pca_numpy_result,
-        categories,
-        "PCA (NumPy Implementation)",
-        config.OUTPUT_PCA_NUMPY_PATH
-    )
-
-    # Sklearn PCA
-    print("\nRunning PCA with scikit-learn...")
-    with Timer() as sklearn_timer:
-        pca_sklearn_result = run_pca_sklearn(vectors, categories)
-    save_runtime(sklearn_timer.elapsed(), "PCA (Scikit-learn)", config.OUTPUT_RUNTIME_PATH)
-
-    # Align sklearn result to numpy result
-    print("Aligning sklearn PCA components to match numpy PCA...")
-    pca_sklearn_result = align_pca_signs(pca_numpy_result, pca_sklearn_result)
-
-    save_vectors(pca_sklearn_result, categories, config.OUTPUT_PCA_SKLEARN_VECTORS_PATH)
-    print(f"Sklearn PCA vectors saved to: {config.OUTPUT_PCA_SKLEARN_VECTORS_PATH}")
-    plot_3d_scatter(
-        pca_sklearn_result,
-        categories,
-        "PCA (Scikit-learn Implementation) - Aligned",
-        config.OUTPUT_PCA_SKLEARN_PATH
-    )
+    plot_options = {"plot_budget": plot_budget, "density_bins": density_bins}
+    pca_numpy_result = pca_numpy_stage(vectors, categories, numpy_mode, plot_options)
+    sklearn_output = pca_sklearn_stage(vectors, categories, sklearn_mode, batch_size)
+    align_pca_stage(vectors, categories, pca_numpy_result, sklearn_output, plot_options)
 
     print("PCA complete!\n")
@@ -0,0 +1,89 @@
+"""
+In-memory pipeline runner for --all with concurrent PCA and t-SNE branches.
+"""
+from functools import partial
+from src.data.vector_io import load_vectors
+from src.workflows.dag import DagNode, run_dag
+from src.workflows.prepare import prepare_data
+from src.workflows.pca_stages import pca_numpy_stage, pca_sklearn_stage, align_pca_stage
+from src.workflows.pca_workflow import run_pca
+from src.workflows.tsne_stage import tsne_stage
+from src.workflows.tsne_workflow import run_tsne_visualization
+from src.utils import config
+from src.utils.memory import peak_rss_mb
+from src.utils.timing import Timer, save_runtime, log_runtime_note
+
+
+def _prepare(prepare_options):
+    """Prepare vectors, loading them from the store on a stage cache hit."""
+    prepared = prepare_data(**prepare_options)
+    return prepared if prepared is not None else load_vectors(config.OUTPUT_VECTORS_PATH)
+
+
+def _branch_nodes(vectors, categories, pca_options, tsne_options):
+    """Build the DAG nodes for branches whose stage cache misses."""
+    nodes, records = [], []
+    pca_hit, record_pca = run_pca.lookup(**pca_options)
+    if not pca_hit:
+        plot_options = {key: pca_options[key] for key in ("plot_budget", "density_bins")
+                        if key in pca_options}
+        nodes += [
+            DagNode("pca_numpy", partial(
+                pca_numpy_stage, vectors, categories, pca_options["numpy_mode"],
+                plot_options=plot_options), ()),
+            DagNode("pca_sklearn", partial(
+                pca_sklearn_stage, vectors, categories,
+                pca_options["sklearn_mode"], pca_options["batch_size"]), ()),
+            DagNode("pca_align", partial(
+                align_pca_stage, vectors, categories, plot_options=plot_options),
+                    ("pca_numpy", "pca_sklearn")),
+        ]
+        records.append(record_pca)
+    tsne_hit, record_tsne = run_tsne_visualization.lookup(**tsne_options)
+    if not tsne_hit:
+        tsne_args = {key: value for key, value in tsne_options.items() if key != "force"}
+        nodes.append(DagNode("tsne", partial(tsne_stage, vectors, categories, **tsne_args), ()))
+        records.append(record_tsne)
+    return nodes, records
+
+
+def run_pipeline(prepare_options, pca_options, tsne_options,
+                 workers=config.PIPELINE_WORKERS):
+    """
+    Prepare data once, then run NumPy PCA, scikit-learn PCA and t-SNE concurrently.
+
+    Vectors stay in memory between stages. Per-stage wall time and peak
+    process RSS are written to the runtime log.
+
+    Args:
+        prepare_options: Keyword arguments for prepare_data
+        pca_options: Keyword arguments for run_pca
+        tsne_options: Keyword arguments for run_tsne_visualization
+        workers: Maximum number of concurrently running branches
+    """
+    with Timer() as pipeline_timer:
+        prepared, stats = run_dag([DagNode("prepare", partial(_prepare, prepare_options), ())], 1)
+        vectors, categories = prepared["prepare"]
+
+        print("=" * 50)
+        print(f"RUNNING PCA AND t-SNE CONCURRENTLY ({workers} workers)")
+        print("=" * 50)
+        nodes, records = _branch_nodes(vectors, categories, pca_options, tsne_options)
+        _, branch_stats = run_dag(nodes, workers)
+        for record in records:
+            record()
+    stats.update(branch_stats)
+
+    for name, node_stats in stats.items():
+        save_runtime(node_stats.elapsed, f"Pipeline stage: {name}", config.OUTPUT_RUNTIME_PATH)
+        log_runtime_note(
+            f"Pipeline stage {name}: peak RSS {node_stats.peak_rss_mb:.1f} MB",
+            config.OUTPUT_RUNTIME_PATH
+        )
+    save_runtime(pipeline_timer.elapsed(), "Pipeline (--all) wall time", config.OUTPUT_RUNTIME_PATH)
+    log_runtime_note(
+        f"Pipeline sum of stage times: {sum(s.elapsed for s in stats.values()):.4f} seconds, "
+        f"process peak RSS: {peak_rss_mb():.1f} MB",
+        config.OUTPUT_RUNTIME_PATH
+    )
+    print("Pipeline complete!\n")
@@ -2,14 +2,42 @@
 Data preparation workflow.
 """
 from src.data.csv_reader import read_csv_data
-from src.data.vector_io import save_vectors
+from src.data.vector_io import save_vectors, load_vectors, export_vectors_text
+from src.data.row_index import sentence_fingerprints
+from src.data.vector_store import labels_path_for
+from src.preprocessing.backends import get_vectorizer
+from src.preprocessing.store_params import record_row_index
 from src.preprocessing.vectorizer import vectorize_sentences
 from src.utils import config
-from src.utils.timing import Timer, save_runtime, initialize_runtime_file
+from src.utils.spans import Span
+from src.utils.timing import initialize_runtime_file
+from src.workflows.prepare_incremental import prepare_incremental
+from src.workflows.prepare_streaming import prepare_streaming
+from src.workflows.stage_cache import cached_stage
 
 
-def prepare_data():
-    """Prepare data: read CSV and vectorize sentences."""
+@cached_stage(
+    "prepare", inputs=lambda args: [config.INPUT_CSV_PATH],
+    outputs=lambda args: [config.OUTPUT_VECTORS_PATH, labels_path_for(config.OUTPUT_VECTORS_PATH)]
+    + ([config.OUTPUT_VECTORS_TEXT_PATH] if args["export_text"] else []),
+    config_prefixes=("WORD2VEC_", "VECTORIZER", "HASHING_", "CSV_")
+)
+def prepare_data(export_text=False, chunk_size=None, train_mode=None,
+                 vectorizer=config.VECTORIZER, incremental=False):
+    """
+    Prepare data: read CSV and vectorize sentences.
+
+    Args:
+        export_text: If True, also write the vectors in text format
+        chunk_size: If set, stream the CSV in chunks of this many rows
+        train_mode: Word2Vec training mode ("memory" or "corpus_file")
+        vectorizer: Vectorizer backend name ("word2vec" or "hashing")
+        incremental: If True, vectorize only sentences missing from the
+            store, falling back to a full build when parameters changed
+
+    Returns:
+        tuple: (vectors, categories) when prepared in memory, else None
+    """
     print("=" * 50)
     print("PREPARING DATA")
     print("=" * 50)
@@ -18,21 +46,36 @@ def prepare_data():
     initialize_runtime_file(config.OUTPUT_RUNTIME_PATH)
     print(f"Runtime log: {config.OUTPUT_RUNTIME_PATH}\n")
 
-    # Read CSV
+    backend = get_vectorizer(vectorizer)
     print(f"Reading CSV from: {config.INPUT_CSV_PATH}")
+    with Span(f"{backend.label} Vectorization") as vectorization:
+        prepared = prepare_incremental(vectorizer) if incremental else None
+        if prepared is not None:
+            vectorization.rows = len(prepared[1])
+        elif chunk_size:
+            vectorization.rows = prepare_streaming(chunk_size, train_mode, vectorizer)
+        else:
+            prepared = _prepare_in_memory(train_mode, vectorizer)
+            vectorization.rows = len(prepared[1])
+    print(f"Vectors saved to: {config.OUTPUT_VECTORS_PATH}")
+
+    if export_text:
+        vectors, categories = load_vectors(config.OUTPUT_VECTORS_PATH)
+        export_vectors_text(vectors, categories, config.OUTPUT_VECTORS_TEXT_PATH)
+        print(f"Text vectors exported to: {config.OUTPUT_VECTORS_TEXT_PATH}")
+    print("Data preparation complete!\n")
+    return prepared
+
+
+def _prepare_in_memory(train_mode, vectorizer):
+    """Read the whole CSV, vectorize it, save the vector store and return it."""
     sentences, categories = read_csv_data(config.INPUT_CSV_PATH)
     print(f"Loaded {len(sentences)} sentences from {len(set(categories))} categories")
 
-    # Vectorize
-    print("Vectorizing sentences using Word2Vec...")
-    with Timer() as timer:
-        vectors = vectorize_sentences(sentences)
+    print(f"Vectorizing sentences using {get_vectorizer(vectorizer).label}...")
+    vectors = vectorize_sentences(sentences, train_mode, vectorizer)
     print(f"Generated vectors of shape: {vectors.shape}")
 
-    # Save runtime
-    save_runtime(timer.elapsed(), "Word2Vec Vectorization", config.OUTPUT_RUNTIME_PATH)
-
-    # Save vectors
     save_vectors(vectors, categories, config.OUTPUT_VECTORS_PATH)
-    print(f"Vectors saved to: {config.OUTPUT_VECTORS_PATH}")
-    print("Data preparation complete!\n")
+    record_row_index(sentence_fingerprints(sentences), vectorizer)
+    return vectors, categories
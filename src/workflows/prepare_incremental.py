@@ -0,0 +1,98 @@
+"""
+Incremental data preparation: vectorize only sentences the store hasn't seen.
+"""
+import numpy as np
+from src.data.csv_reader import read_csv_data
+from src.data.row_index import load_row_index, save_row_index, sentence_fingerprints, match_rows
+from src.data.vector_io import load_vectors, save_vectors
+from src.data.vector_store import VectorStoreWriter, STORE_DTYPE
+from src.preprocessing.corpus import tokenize_sentences
+from src.preprocessing.store_params import vectorizer_params
+from src.utils import config
+from src.utils.spans import Span
+from src.utils.timing import log_runtime_note
+
+
+def _rebuild_reason(stored, params, vectorizer):
+    """Return why the store must be rebuilt from scratch, or None."""
+    if stored is None or params is None:
+        return "no row index"
+    if vectorizer != "word2vec":
+        return f"the {vectorizer} backend is refit on every build"
+    if params["vectorizer"] != vectorizer or \
+            params["params"] != vectorizer_params(vectorizer)["params"]:
+        return "vectorizer parameters changed"
+    return None
+
+
+def _vectors_for(rows, matches, stored_vectors, sentences, model):
+    """Copy stored vectors for known sentences and vectorize the unseen ones."""
+    from src.preprocessing.sparse_average import average_word_vectors
+
+    vectors = np.empty((len(rows), stored_vectors.shape[1]), dtype=STORE_DTYPE)
+    found = matches[rows] >= 0
+    vectors[found] = stored_vectors[matches[rows][found]]
+    unseen = rows[~found]
+    if len(unseen):
+        tokenized = tokenize_sentences([sentences[row] for row in unseen])
+        vectors[~found] = average_word_vectors(tokenized, model)
+    return vectors, len(unseen)
+
+
+def prepare_incremental(vectorizer):
+    """
+    Update the vector store for the current CSV without re-vectorizing it.
+
+    Rows appended to the CSV are vectorized with the store's Word2Vec
+    model and appended to the store. If earlier rows changed, the store is
+    rewritten, still copying the vectors of every known sentence. New words
+    are out of vocabulary until the next full rebuild.
+
+    Args:
+        vectorizer: Vectorizer backend name
+
+    Returns:
+        tuple: (vectors, categories), or None when a full rebuild is needed
+    """
+    path = config.OUTPUT_VECTORS_PATH
+    stored, params = load_row_index(path)
+    reason = _rebuild_reason(stored, params, vectorizer)
+    if reason is None:
+        from src.preprocessing.model_cache import load_latest_word2vec
+        try:
+            model = load_latest_word2vec(params["model"])
+        except FileNotFoundError:
+            reason = "the store's Word2Vec model is no longer cached"
+    if reason:
+        log_runtime_note(
+            f"Incremental prepare: full rebuild ({reason})", config.OUTPUT_RUNTIME_PATH
+        )
+        return None
+
+    sentences, categories = read_csv_data(config.INPUT_CSV_PATH)
+    with Span("fingerprint", rows=len(sentences)):
+        fingerprints = sentence_fingerprints(sentences)
+        matches = match_rows(stored, fingerprints)
+    stored_vectors, stored_categories = load_vectors(path)
+    n_stored = len(stored)
+    # The store keeps labels as text, so numeric CSV categories compare as strings
+    if np.array_equal(fingerprints[:n_stored], stored) and \
+            list(map(str, categories[:n_stored])) == list(map(str, stored_categories)):
+        vectors, n_new = _vectors_for(
+            np.arange(n_stored, len(sentences)), matches, stored_vectors, sentences, model)
+        del stored_vectors
+        with VectorStoreWriter(path, append=True) as writer:
+            writer.append(vectors, categories[n_stored:])
+        mode = "appended to store"
+    else:
+        vectors, n_new = _vectors_for(
+            np.arange(len(sentences)), matches, stored_vectors, sentences, model)
+        del stored_vectors  # release the memory map before rewriting the file
+        save_vectors(vectors, categories, path)
+        mode = "store rewritten"
+    save_row_index(path, fingerprints, params)
+    log_runtime_note(
+        f"Incremental prepare: vectorized {n_new} of {len(sentences)} rows, "
+        f"reused {len(sentences) - n_new} ({mode})", config.OUTPUT_RUNTIME_PATH
+    )
+    return load_vectors(path)
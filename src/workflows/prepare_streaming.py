@@ -0,0 +1,52 @@
+"""
+Streaming data preparation: fit on a chunked corpus, then vectorize chunk by chunk.
+"""
+import numpy as np
+from src.data.csv_reader import iter_csv_chunks
+from src.data.row_index import sentence_fingerprints
+from src.data.vector_store import VectorStoreWriter
+from src.preprocessing.backends import get_vectorizer
+from src.preprocessing.corpus import CsvTokenCorpus
+from src.preprocessing.dedup import report_dedup
+from src.preprocessing.store_params import record_row_index
+from src.preprocessing.vectorizer import transform_distinct
+from src.utils import config
+from src.utils.spans import Span
+
+
+def prepare_streaming(chunk_size, train_mode, vectorizer):
+    """
+    Fit on a streamed corpus, then vectorize and store chunk by chunk.
+
+    Args:
+        chunk_size: Number of CSV rows held in memory at a time
+        train_mode: Word2Vec training mode ("memory" or "corpus_file")
+        vectorizer: Vectorizer backend name
+
+    Returns:
+        int: Number of rows written
+    """
+    backend = get_vectorizer(vectorizer)
+    print(f"Streaming CSV in chunks of {chunk_size} rows")
+    print(f"Fitting {backend.label} on streamed corpus...")
+    with Span("fit"):
+        model = backend.fit(CsvTokenCorpus(config.INPUT_CSV_PATH, chunk_size), train_mode)
+
+    print("Vectorizing sentences chunk by chunk...")
+    seen_categories, fingerprints, n_unique = set(), [], 0
+    with Span("transform") as transform, VectorStoreWriter(config.OUTPUT_VECTORS_PATH) as writer:
+        for sentences, categories in iter_csv_chunks(config.INPUT_CSV_PATH, chunk_size):
+            # Duplicates are found within each chunk, keeping memory bounded
+            vectors, n_distinct = transform_distinct(backend, sentences, model)
+            n_unique += n_distinct
+            writer.append(vectors, categories)
+            seen_categories.update(categories)
+            fingerprints.append(sentence_fingerprints(sentences))
+        n_rows, n_features = writer.n_rows, writer.n_features
+        transform.rows = n_rows
+    if config.VECTORIZER_DEDUP:
+        report_dedup("vectorization, per chunk", n_rows, n_unique)
+    record_row_index(np.concatenate(fingerprints or [[]]).astype(np.uint64), vectorizer)
+    print(f"Vectorized {n_rows} sentences from {len(seen_categories)} categories")
+    print(f"Generated vectors of shape: ({n_rows}, {n_features})")
+    return n_rows
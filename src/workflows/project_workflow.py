@@ -0,0 +1,76 @@
+"""
+Projection workflow: place new sentences with saved PCA projections.
+"""
+from src.data.csv_reader import read_csv_data
+from src.data.row_index import params_path_for
+from src.data.vector_io import save_vectors
+from src.preprocessing.corpus import tokenize_sentences
+from src.preprocessing.sparse_average import average_word_vectors
+from src.preprocessing.store_models import load_store_models
+from src.reduction.projection import load_projection, apply_projection
+from src.utils import config
+from src.utils.timing import Timer, save_runtime
+from src.workflows.stage_cache import cached_stage
+
+
+@cached_stage(
+    "project",
+    inputs=lambda args: [
+        args["csv_path"], params_path_for(config.OUTPUT_VECTORS_PATH),
+        config.OUTPUT_PCA_NUMPY_PROJECTION_PATH, config.OUTPUT_PCA_SKLEARN_PROJECTION_PATH,
+    ],
+    outputs=lambda args: [
+        config.OUTPUT_PROJECTED_NUMPY_VECTORS_PATH, config.OUTPUT_PROJECTED_SKLEARN_VECTORS_PATH,
+    ]
+)
+def run_projection(csv_path):
+    """
+    Project new sentences without refitting Word2Vec or PCA.
+
+    Sentences are vectorized with the Word2Vec model the vector store was
+    built with, and only projections fitted on that store are applied.
+
+    Args:
+        csv_path: CSV file with 'category' and 'sentence' columns
+
+    Raises:
+        FileNotFoundError: If the store's model or a projection is missing
+        ValueError: If the store or a projection comes from another vectorizer
+    """
+    print("=" * 50)
+    print("PROJECTING NEW SENTENCES")
+    print("=" * 50)
+
+    print(f"Reading CSV from: {csv_path}")
+    sentences, categories = read_csv_data(csv_path)
+    print(f"Loaded {len(sentences)} sentences")
+
+    targets = [
+        ("NumPy", config.OUTPUT_PCA_NUMPY_PROJECTION_PATH,
+         config.OUTPUT_PROJECTED_NUMPY_VECTORS_PATH),
+        ("Scikit-learn", config.OUTPUT_PCA_SKLEARN_PROJECTION_PATH,
+         config.OUTPUT_PROJECTED_SKLEARN_VECTORS_PATH),
+    ]
+    print("Vectorizing with the vector store's Word2Vec model...")
+    with Timer() as vectorize_timer:
+        model, projections = load_store_models({
+            name: (load_projection, projection_path, "--pca")
+            for name, projection_path, _ in targets
+        })
+        vectors = average_word_vectors(tokenize_sentences(sentences), model)
+    save_runtime(
+        vectorize_timer.elapsed(), "Projection: Word2Vec Vectorization",
+        config.OUTPUT_RUNTIME_PATH
+    )
+
+    for name, _, output_path in targets:
+        with Timer() as project_timer:
+            projected = apply_projection(projections[name], vectors)
+        save_runtime(
+            project_timer.elapsed(), f"Projection: PCA ({name})",
+            config.OUTPUT_RUNTIME_PATH
+        )
+        save_vectors(projected, categories, output_path)
+        print(f"Projected vectors saved to: {output_path}")
+
+    print("Projection complete!\n")
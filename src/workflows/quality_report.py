@@ -0,0 +1,27 @@
+"""
+Embedding-quality reporting backed by the shared kNN graph.
+"""
+from src.reduction.knn_graph import load_or_compute_knn_graph
+from src.reduction.quality import trustworthiness_continuity
+from src.utils import config
+from src.utils.timing import Timer, save_runtime, log_runtime_note
+
+
+def report_quality(vectors, embedding, label):
+    """
+    Score an embedding against the original vectors and log the result.
+
+    Args:
+        vectors: Original vectors (n_samples, n_features)
+        embedding: Embedded vectors (n_samples, n_components)
+        label: Name of the embedding in the runtime report
+    """
+    with Timer() as timer:
+        _, neighbors = load_or_compute_knn_graph(vectors)
+        trust, continuity = trustworthiness_continuity(vectors, embedding, neighbors)
+    save_runtime(timer.elapsed(), f"Quality metrics ({label})", config.OUTPUT_RUNTIME_PATH)
+    log_runtime_note(
+        f"{label} trustworthiness@{config.QUALITY_K}: {trust:.4f}, "
+        f"continuity@{config.QUALITY_K}: {continuity:.4f}",
+        config.OUTPUT_RUNTIME_PATH
+    )
@@ -0,0 +1,57 @@
+"""
+Serve workflow: a long-running local server placing new sentences in the saved maps.
+"""
+import signal
+import threading
+from src.serving.batcher import MicroBatcher
+from src.serving.http_server import make_handler, make_server
+from src.serving.metrics import ServerMetrics
+from src.serving.models import WarmModels
+from src.utils import config
+from src.utils.spans import Span
+from src.utils.timing import log_runtime_note
+
+
+def run_server(host=config.SERVE_HOST, port=config.SERVE_PORT,
+               max_batch=config.SERVE_MAX_BATCH, max_wait_ms=config.SERVE_MAX_WAIT_MS):
+    """
+    Load the models once and answer embedding requests until interrupted.
+
+    Concurrent requests are coalesced into micro-batches, so one
+    vectorization and one projection per map serve many requests.
+
+    Args:
+        host: Interface to bind (localhost by default)
+        port: TCP port
+        max_batch: Sentences that close a micro-batch early
+        max_wait_ms: Longest time a micro-batch waits for more requests
+    """
+    print("=" * 50)
+    print("STARTING EMBEDDING SERVER")
+    print("=" * 50)
+
+    with Span("Server warm-up"):
+        models = WarmModels()
+    metrics = ServerMetrics()
+    batcher = MicroBatcher(models.embed, metrics, max_batch, max_wait_ms)
+    server = make_server(host, port, make_handler(batcher, metrics, models.maps))
+
+    print(f"Maps available: {', '.join(models.maps) or 'none'}")
+    print(f"Serving on http://{host}:{server.server_address[1]} "
+          "(POST /embed, GET /metrics, GET /health); Ctrl+C to stop")
+    # SIGTERM (e.g. from a service manager) stops the server like Ctrl+C
+    signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=server.shutdown).start())
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nShutting down...")
+    finally:
+        server.server_close()
+        batcher.close()
+    snapshot = metrics.snapshot()
+    latency = snapshot["latency_ms"]
+    log_runtime_note(
+        f"Server: {snapshot['requests']} requests in {snapshot['batches']} batches, "
+        f"p50 {latency.get('p50', 0):.2f} ms, p99 {latency.get('p99', 0):.2f} ms",
+        config.OUTPUT_RUNTIME_PATH
+    )
@@ -0,0 +1,87 @@
+"""
+Content-addressed stage cache: skip workflows whose inputs and parameters are unchanged.
+"""
+import functools
+import inspect
+import os
+from src.data.vector_store import labels_path_for
+from src.utils import config
+from src.utils.fingerprint import fingerprint_inputs
+from src.utils.json_io import read_json, write_json
+from src.utils.timing import log_runtime_note
+
+# Config names shared by every stage that plots
+PLOT_CONFIG = ("FIGURE_SIZE", "POINT_SIZE", "ALPHA", "COLOR_PALETTE", "PLOT_")
+
+
+def vector_store_inputs(arguments):
+    """Return the prepared vector store and its labels as stage inputs."""
+    return [config.OUTPUT_VECTORS_PATH, labels_path_for(config.OUTPUT_VECTORS_PATH)]
+
+
+def _record(name, fingerprint, entries):
+    """Store a stage's fingerprint in the manifest."""
+    manifest = read_json(config.OUTPUT_MANIFEST_PATH, {})
+    manifest[name] = {"fingerprint": fingerprint, "inputs": entries}
+    write_json(config.OUTPUT_MANIFEST_PATH, manifest)
+
+
+def cached_stage(name, inputs, outputs, config_prefixes=()):
+    """
+    Declare a workflow as a cacheable pipeline stage.
+
+    The wrapped workflow accepts an extra ``force`` keyword to bypass the
+    cache. Its fingerprint combines the input file hashes, the call
+    arguments and every config value whose name starts with one of
+    config_prefixes, and is stored in the manifest under output/. The
+    wrapper's ``lookup`` attribute returns (hit, record) without running
+    the workflow, for runners that execute the stage body themselves.
+
+    Args:
+        name: Stage name in the manifest and runtime log
+        inputs: Callable mapping the bound call arguments to input paths
+        outputs: Callable mapping the bound call arguments to output paths
+        config_prefixes: Config name prefixes the stage depends on
+
+    Returns:
+        Callable: Decorator for the workflow function
+    """
+    def decorator(workflow):
+        signature = inspect.signature(workflow)
+
+        def lookup(*args, force=False, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            params = {
+                "arguments": arguments,
+                "config": {
+                    key: getattr(config, key) for key in dir(config)
+                    if key.startswith(tuple(config_prefixes))
+                },
+            }
+            previous = read_json(config.OUTPUT_MANIFEST_PATH, {}).get(name, {})
+            fingerprint, entries = fingerprint_inputs(
+                inputs(arguments), params, previous.get("inputs", {})
+            )
+            outputs_exist = all(os.path.exists(path) for path in outputs(arguments))
+            hit = not force and outputs_exist and previous.get("fingerprint") == fingerprint
+            if hit:
+                log_runtime_note(
+                    f"Stage cache hit: {name} (skipped, reusing cached outputs)",
+                    config.OUTPUT_RUNTIME_PATH
+                )
+            return hit, functools.partial(_record, name, fingerprint, entries)
+
+        @functools.wraps(workflow)
+        def wrapper(*args, force=False, **kwargs):
+            hit, record = lookup(*args, force=force, **kwargs)
+            if hit:
+                return None
+            result = workflow(*args, **kwargs)
+            record()
+            return result
+
+        wrapper.lookup = lookup
+        return wrapper
+    return decorator
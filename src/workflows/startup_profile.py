@@ -0,0 +1,52 @@
+"""
+Startup profiling workflow: per-entry-point import cost.
+"""
+from src.utils import config
+from src.utils.import_profile import profile_import, cost_by_package
+from src.utils.validators import validate_directory_exists
+
+# Modules imported by each CLI path
+STARTUP_TARGETS = {
+    "CLI (--help)": "src.cli",
+    "--prepare": "src.workflows.prepare",
+    "--pca": "src.workflows.pca_workflow",
+    "--tsne": "src.workflows.tsne_workflow",
+    "--tsne-sweep": "src.workflows.sweep_workflow",
+    "--project": "src.workflows.project_workflow",
+    "--serve": "src.workflows.serve_workflow",
+    "--all": "src.workflows.pipeline",
+}
+
+
+def run_startup_profile(top=config.STARTUP_PROFILE_TOP):
+    """
+    Measure import cost of each CLI path in fresh interpreters and report it.
+
+    The report is printed and saved to output/startup_profile.txt; the CLI
+    path is flagged if it exceeds STARTUP_CLI_BUDGET_MS.
+
+    Args:
+        top: Number of most expensive packages listed per path
+    """
+    print("=" * 50)
+    print("PROFILING STARTUP IMPORTS")
+    print("=" * 50)
+
+    lines = []
+    for label, module_name in STARTUP_TARGETS.items():
+        rows = profile_import(module_name, config.BASE_DIR)
+        total_ms = next(cum for name, _, cum in rows if name == module_name) / 1000
+        lines.append(f"{label} ({module_name}): {total_ms:.1f} ms")
+        for package, ms in cost_by_package(rows)[:top]:
+            lines.append(f"    {package:<24} {ms:>9.1f} ms")
+        if module_name == "src.cli" and total_ms > config.STARTUP_CLI_BUDGET_MS:
+            lines.append(
+                f"    WARNING: exceeds CLI budget of {config.STARTUP_CLI_BUDGET_MS} ms"
+            )
+
+    report = "\n".join(lines)
+    print(report)
+    validate_directory_exists(config.OUTPUT_DIR)
+    with open(config.OUTPUT_STARTUP_PROFILE_PATH, "w") as f:
+        f.write(report + "\n")
+    print(f"\nStartup profile saved to: {config.OUTPUT_STARTUP_PROFILE_PATH}\n")
@@ -0,0 +1,67 @@
+"""
+Parallel t-SNE perplexity/seed sweep workflow.
+"""
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+from scipy.sparse import save_npz
+from src.data.vector_io import load_vectors
+from src.reduction.knn_graph import load_or_compute_knn_graph
+from src.reduction.tsne_graph import to_sparse_distances, tsne_graph_neighbors
+from src.reduction.tsne_sweep import run_sweep_config, write_sweep_summary
+from src.utils import config
+from src.utils.timing import Timer, save_runtime, log_runtime_note
+from src.workflows.stage_cache import cached_stage, vector_store_inputs, PLOT_CONFIG
+
+
+@cached_stage(
+    "tsne_sweep", inputs=vector_store_inputs,
+    outputs=lambda args: [os.path.join(config.OUTPUT_SWEEP_DIR, "summary.txt")],
+    config_prefixes=("N_COMPONENTS", "TSNE_ITERATIONS", "KNN_") + PLOT_CONFIG
+)
+def run_tsne_sweep(perplexities=(config.TSNE_PERPLEXITY,), seeds=(42,),
+                   workers=config.TSNE_SWEEP_WORKERS):
+    """
+    Run t-SNE for every perplexity/seed pair on a process pool.
+
+    Args:
+        perplexities: Perplexity values to try
+        seeds: Random seeds to try
+        workers: Maximum number of worker processes
+    """
+    print("=" * 50)
+    print("RUNNING t-SNE SWEEP")
+    print("=" * 50)
+
+    print(f"Loading vectors from: {config.OUTPUT_VECTORS_PATH}")
+    vectors, _ = load_vectors(config.OUTPUT_VECTORS_PATH)
+    print(f"Loaded {len(vectors)} vectors")
+
+    # One graph wide enough for the largest perplexity serves every configuration
+    k = tsne_graph_neighbors(max(perplexities), len(vectors))
+    os.makedirs(config.OUTPUT_SWEEP_DIR, exist_ok=True)
+    graph_path = os.path.join(config.OUTPUT_SWEEP_DIR, "knn_graph.npz")
+    save_npz(graph_path, to_sparse_distances(*load_or_compute_knn_graph(vectors, k)))
+
+    configs = list(product(perplexities, seeds))
+    print(f"\nRunning {len(configs)} configurations on {workers} workers...")
+    context = multiprocessing.get_context("spawn")
+    with Timer() as sweep_timer:
+        with ProcessPoolExecutor(min(workers, len(configs)), mp_context=context) as pool:
+            futures = [
+                pool.submit(run_sweep_config, config.OUTPUT_VECTORS_PATH, graph_path, p, s)
+                for p, s in configs
+            ]
+            results = [future.result() for future in futures]
+    save_runtime(
+        sweep_timer.elapsed(), f"t-SNE sweep ({len(configs)} configurations)",
+        config.OUTPUT_RUNTIME_PATH
+    )
+
+    summary_path = os.path.join(config.OUTPUT_SWEEP_DIR, "summary.txt")
+    write_sweep_summary(results, summary_path)
+    with open(summary_path) as f:
+        print(f.read())
+    log_runtime_note(f"t-SNE sweep summary saved to: {summary_path}", config.OUTPUT_RUNTIME_PATH)
+    print("t-SNE sweep complete!\n")
@@ -0,0 +1,96 @@
+"""
+t-SNE stage shared by the sequential workflow and the pipeline runner.
+"""
+from src.preprocessing.dedup import dedup_rows, report_dedup
+from src.preprocessing.store_params import store_identity
+from src.reduction.tsne import run_tsne
+from src.reduction.knn_graph import load_or_compute_knn_graph
+from src.reduction.landmark_index import save_landmark_index
+from src.reduction.tsne_graph import to_sparse_distances, tsne_graph_neighbors
+from src.visualization.render_service import submit_plot
+from src.workflows.quality_report import report_quality
+from src.utils import config
+from src.utils.spans import Span
+from src.utils.timing import Timer, save_runtime, log_runtime_note
+
+
+def _pre_reduce(vectors, method, n_components):
+    """Pre-reduce vectors, logging runtime and neighbor preservation."""
+    from src.reduction.pre_reduction import pre_reduce as reduce_vectors, neighbor_preservation
+
+    print(f"\nPre-reducing vectors ({method}, {n_components}D)...")
+    with Timer() as timer:
+        reduced = reduce_vectors(vectors, method, n_components)
+    label = f"t-SNE pre-reduction ({method}, {vectors.shape[1]}D -> {reduced.shape[1]}D)"
+    save_runtime(timer.elapsed(), label, config.OUTPUT_RUNTIME_PATH)
+
+    score, saved = neighbor_preservation(vectors, reduced)
+    n_queries = min(config.PRE_REDUCE_EVAL_QUERIES, len(vectors))
+    note = (f"Pre-reduction kNN preservation@{config.PRE_REDUCE_EVAL_K}: {score:.3f}, "
+            f"neighbor-search time saved: ~{saved:.4f} seconds (estimate, extrapolated "
+            f"from {n_queries} sampled queries)")
+    log_runtime_note(note, config.OUTPUT_RUNTIME_PATH)
+    return reduced
+
+
+def tsne_stage(vectors, categories, mode=config.TSNE_MODE, n_landmarks=config.TSNE_LANDMARKS,
+               k=config.TSNE_LANDMARK_K, pre_reduce=config.PRE_REDUCE_METHOD,
+               pre_reduce_dim=config.PRE_REDUCE_DIM, plot_budget=config.PLOT_POINT_BUDGET,
+               density_bins=config.PLOT_DENSITY_BINS, dedup=config.TSNE_DEDUP):
+    """
+    Embed vectors with t-SNE, then plot and score the result.
+
+    Args:
+        vectors: Vectors to embed
+        categories: Category labels
+        mode: "full" to embed every row, "landmark" to embed a stratified
+            subsample and place the remaining rows by kNN interpolation
+        n_landmarks: Number of landmarks in landmark mode
+        k: Nearest landmarks used to place each remaining row
+        pre_reduce: Optional "gaussian", "sparse" or "pca" reduction applied
+            before t-SNE to speed up its neighbor search
+        pre_reduce_dim: Target dimensionality of the pre-reduction
+        plot_budget: Maximum points drawn in the plot (None draws all)
+        density_bins: Voxels per axis summarizing points beyond the budget
+        dedup: If True, embed each distinct vector once and give its
+            duplicates the same coordinates; categories stay per row
+    """
+    original, row_categories = vectors, categories
+    if dedup:
+        rows, inverse = dedup_rows(vectors)
+        report_dedup("t-SNE", len(vectors), len(rows))
+        vectors, categories = vectors[rows], [categories[row] for row in rows]
+    if pre_reduce:
+        vectors = _pre_reduce(vectors, pre_reduce, pre_reduce_dim)
+
+    # t-SNE
+    if mode == "landmark" and len(vectors) > n_landmarks:
+        from src.reduction.tsne_landmark import compute_tsne_landmark
+
+        print(f"\nRunning landmark t-SNE ({n_landmarks} landmarks, k={k})...")
+        with Timer() as tsne_timer:
+            tsne_result, timings = compute_tsne_landmark(
+                vectors, categories, n_landmarks, k
+            )
+        for phase, elapsed in timings.items():
+            save_runtime(elapsed, f"t-SNE landmark: {phase}", config.OUTPUT_RUNTIME_PATH)
+        save_runtime(tsne_timer.elapsed(), "t-SNE (landmark)", config.OUTPUT_RUNTIME_PATH)
+    else:
+        print("\nBuilding kNN graph...")
+        with Span("kNN graph", rows=len(vectors)):
+            graph = load_or_compute_knn_graph(
+                vectors, tsne_graph_neighbors(config.TSNE_PERPLEXITY, len(vectors))
+            )
+        print("\nRunning t-SNE...")
+        with Span("t-SNE", rows=len(vectors)):
+            tsne_result = run_tsne(vectors, categories, to_sparse_distances(*graph))
+    if dedup:
+        tsne_result, categories = tsne_result[inverse], row_categories
+
+    submit_plot(
+        tsne_result, categories, "t-SNE Visualization", config.OUTPUT_TSNE_PATH,
+        plot_budget=plot_budget, density_bins=density_bins
+    )
+    save_landmark_index(original, tsne_result, categories, config.OUTPUT_TSNE_LANDMARKS_PATH,
+                        source=store_identity())
+    report_quality(original, tsne_result, "t-SNE")
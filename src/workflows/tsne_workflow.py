@@ -2,14 +2,36 @@
 t-SNE workflow.
 """
 from src.data.vector_io import load_vectors
-from src.reduction.tsne import run_tsne
-from src.visualization.plotter import plot_3d_scatter
+from src.workflows.stage_cache import cached_stage, vector_store_inputs, PLOT_CONFIG
+from src.workflows.tsne_stage import tsne_stage
 from src.utils import config
-from src.utils.timing import Timer, save_runtime
 
 
-def run_tsne_visualization():
-    """Run t-SNE and visualize."""
+@cached_stage(
+    "tsne", inputs=vector_store_inputs,
+    outputs=lambda args: [config.OUTPUT_TSNE_PATH, config.OUTPUT_TSNE_LANDMARKS_PATH],
+    config_prefixes=("N_COMPONENTS", "TSNE_", "PRE_REDUCE_", "KNN_", "QUALITY_") + PLOT_CONFIG
+)
+def run_tsne_visualization(mode=config.TSNE_MODE, n_landmarks=config.TSNE_LANDMARKS,
+                           k=config.TSNE_LANDMARK_K, pre_reduce=config.PRE_REDUCE_METHOD,
+                           pre_reduce_dim=config.PRE_REDUCE_DIM,
+                           plot_budget=config.PLOT_POINT_BUDGET,
+                           density_bins=config.PLOT_DENSITY_BINS, dedup=config.TSNE_DEDUP):
+    """
+    Run t-SNE and visualize.
+
+    Args:
+        mode: "full" to embed every row, "landmark" to embed a stratified
+            subsample and place the remaining rows by kNN interpolation
+        n_landmarks: Number of landmarks in landmark mode
+        k: Nearest landmarks used to place each remaining row
+        pre_reduce: Optional "gaussian", "sparse" or "pca" reduction applied
+            before t-SNE to speed up its neighbor search
+        pre_reduce_dim: Target dimensionality of the pre-reduction
+        plot_budget: Maximum points drawn in the plot (None draws all)
+        density_bins: Voxels per axis summarizing points beyond the budget
+        dedup: If True, embed each distinct vector once
+    """
     print("=" * 50)
     print("RUNNING t-SNE")
     print("=" * 50)
@@ -18,18 +40,7 @@ def run_tsne_visualization():
     print(f"Loading vectors from: {config.OUTPUT_VECTORS_PATH}")
     vectors, categories = load_vectors(config.OUTPUT_VECTORS_PATH)
     print(f"Loaded {len(vectors)} vectors")
-
-    # t-SNE
-    print("\nRunning t-SNE...")
-    with Timer() as tsne_timer:
-        tsne_result = run_tsne(vectors, categories)
-    save_runtime(tsne_timer.elapsed(), "t-SNE", config.OUTPUT_RUNTIME_PATH)
-
-    plot_3d_scatter(
-        tsne_result,
-        categories,
-        "t-SNE Visualization",
-        config.OUTPUT_TSNE_PATH
-    )
+    tsne_stage(vectors, categories, mode, n_landmarks, k, pre_reduce, pre_reduce_dim,
+               plot_budget, density_bins, dedup)
 
     print("t-SNE complete!\n")
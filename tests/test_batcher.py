@@ -0,0 +1,70 @@
+"""
+Tests for the embedding server's micro-batcher.
+"""
+import threading
+import pytest
+from src.serving.batcher import MicroBatcher
+from src.serving.metrics import ServerMetrics
+
+
+class GatedProcess:
+    """Batch function that records its batches and holds the first until released."""
+
+    def __init__(self):
+        self.batches = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def __call__(self, items):
+        self.batches.append(list(items))
+        self.started.set()
+        self.release.wait(5)
+        if "fail" in items:
+            raise RuntimeError("batch failed")
+        return [len(item) for item in items]
+
+
+@pytest.fixture
+def gated():
+    """A batcher whose worker is busy with a first request, so later ones queue up."""
+    process, metrics = GatedProcess(), ServerMetrics()
+    batcher = MicroBatcher(process, metrics, max_batch=4, max_wait_ms=50)
+    first = batcher.submit(["a"])
+    process.started.wait(5)
+    yield batcher, process, metrics, first
+    process.release.set()
+    batcher.close()
+
+
+def test_queued_requests_share_one_batch(gated):
+    """Requests queued while the worker is busy are processed together and split back."""
+    batcher, process, metrics, first = gated
+    futures = [batcher.submit(["xx"]), batcher.submit(["yyy", "z"])]
+    process.release.set()
+
+    assert first.result(5) == [1]
+    assert [future.result(5) for future in futures] == [[2], [3, 1]]
+    assert process.batches == [["a"], ["xx", "yyy", "z"]]
+    assert metrics.snapshot()["batches"] == 2
+
+
+def test_max_batch_closes_a_batch_early(gated):
+    """A batch stops collecting once it holds max_batch items."""
+    batcher, process, _, _ = gated
+    futures = [batcher.submit(["b", "c"]) for _ in range(3)]
+    process.release.set()
+
+    assert [future.result(5) for future in futures] == [[1, 1]] * 3
+    assert [len(batch) for batch in process.batches] == [1, 4, 2]
+
+
+def test_batch_errors_reach_every_request(gated):
+    """A failing batch fails every request in it, and the worker keeps serving."""
+    batcher, process, _, _ = gated
+    futures = [batcher.submit(["fail"]), batcher.submit(["ok"])]
+    process.release.set()
+
+    for future in futures:
+        with pytest.raises(RuntimeError):
+            future.result(5)
+    assert batcher.submit(["after"]).result(5) == [5]
@@ -0,0 +1,59 @@
+"""
+Tests for the embedding server's HTTP front end.
+"""
+import json
+import threading
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+from src.serving.batcher import MicroBatcher
+from src.serving.http_server import make_handler, make_server
+from src.serving.metrics import ServerMetrics
+
+
+@pytest.fixture
+def server():
+    """The HTTP server on a free localhost port, embedding sentences as their lengths."""
+    metrics = ServerMetrics()
+    batcher = MicroBatcher(lambda items: [{"len": len(item)} for item in items], metrics)
+    http = make_server("127.0.0.1", 0, make_handler(batcher, metrics, ["pca_numpy"]))
+    thread = threading.Thread(target=http.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{http.server_address[1]}"
+    http.shutdown()
+    http.server_close()
+    batcher.close()
+
+
+def _request(url, payload=None):
+    data = None if payload is None else json.dumps(payload).encode()
+    try:
+        with urllib.request.urlopen(url, data, timeout=5) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as error:
+        return error.code, json.loads(error.read())
+
+
+def test_concurrent_embed_requests(server):
+    """Concurrent clients each get the coordinates of their own sentences."""
+    sentences = [["a" * n, "b" * (n + 1)] for n in range(16)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        responses = list(pool.map(
+            lambda batch: _request(f"{server}/embed", {"sentences": batch}), sentences
+        ))
+
+    for batch, (status, body) in zip(sentences, responses):
+        assert status == 200
+        assert body["coordinates"] == [{"len": len(sentence)} for sentence in batch]
+    status, metrics = _request(f"{server}/metrics")
+    assert status == 200 and metrics["requests"] == 16 and metrics["errors"] == 0
+    assert 1 <= metrics["batches"] <= 16 and metrics["batch_sentences"]["max"] >= 2
+
+
+def test_invalid_requests(server):
+    """Malformed bodies and unknown paths are rejected; /health lists the maps."""
+    assert _request(f"{server}/embed", {"sentences": "not a list"})[0] == 400
+    assert _request(f"{server}/embed", {"text": []})[0] == 400
+    assert _request(f"{server}/missing")[0] == 404
+    assert _request(f"{server}/health") == (200, {"status": "ok", "maps": ["pca_numpy"]})
@@ -0,0 +1,63 @@
+"""
+Tests for the content-addressed Word2Vec model cache.
+"""
+import os
+from functools import partial
+import pytest
+from src.preprocessing import model_cache
+from src.preprocessing.model_cache import load_or_train_word2vec
+from src.preprocessing.model_index import model_path, read_index, save_index
+from src.preprocessing.word2vec_trainer import train_word2vec
+from src.utils import config
+from src.utils.json_io import write_json
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Point the model cache and the vector store at a temporary directory."""
+    monkeypatch.setattr(config, "OUTPUT_WORD2VEC_DIR", str(tmp_path / "word2vec"))
+    monkeypatch.setattr(config, "OUTPUT_VECTORS_PATH", str(tmp_path / "vectors.npy"))
+    monkeypatch.setattr(config, "OUTPUT_RUNTIME_PATH", str(tmp_path / "runtime.txt"))
+    monkeypatch.setattr(config, "WORD2VEC_EPOCHS", 1)
+    monkeypatch.setattr(config, "WORD2VEC_WORKERS", 1)
+    return tmp_path
+
+
+def _corpus(n_rows, topic="base"):
+    return [[topic, "sentence", str(row)] for row in range(n_rows)]
+
+
+def _notes(cache_dir):
+    return (cache_dir / "runtime.txt").read_text()
+
+
+def test_hit_and_incremental_update(cache_dir):
+    """An identical corpus is a hit; an extended one updates the cached model."""
+    load_or_train_word2vec(_corpus(10), train_word2vec)
+    assert "miss, trained from scratch" in _notes(cache_dir)
+
+    load_or_train_word2vec(_corpus(10), train_word2vec)
+    assert "Word2Vec cache: hit" in _notes(cache_dir)
+
+    model = load_or_train_word2vec(_corpus(12), train_word2vec)
+    assert "incremental update (+2 sentences)" in _notes(cache_dir)
+    assert "11" in model.wv
+
+
+def test_eviction_keeps_the_store_model(cache_dir, monkeypatch):
+    """The least recently used models are evicted, but never the vector store's."""
+    monkeypatch.setattr(model_cache, "save_index", partial(save_index, max_entries=2))
+    load_or_train_word2vec(_corpus(5, "first"), train_word2vec)
+    store_key = read_index()["latest"]
+    write_json(str(cache_dir / "vectors_params.json"),
+               {"vectorizer": "word2vec", "params": "", "model": store_key})
+
+    for topic in ("second", "third", "fourth"):
+        load_or_train_word2vec(_corpus(5, topic), train_word2vec)
+
+    index = read_index()
+    assert len(index["models"]) == 2
+    assert store_key in index["models"] and index["latest"] != store_key
+    assert os.path.exists(model_path(store_key))
+    cached = {name for name in os.listdir(config.OUTPUT_WORD2VEC_DIR) if name.endswith(".model")}
+    assert cached == {f"{key}.model" for key in index["models"]}
@@ -0,0 +1,43 @@
+"""
+Tests for out-of-core NumPy PCA against the in-memory implementation.
+"""
+import numpy as np
+from src.data.vector_store import load_vector_store, save_vector_store
+from src.reduction.pca_numpy import fit_transform_pca_numpy
+from src.reduction.pca_streaming import fit_pca_streaming, project_pca_streaming
+
+
+def _vectors(n_rows=500, n_features=12):
+    """Rows with distinct per-feature variances, far from the origin."""
+    rng = np.random.default_rng(0)
+    return rng.normal(size=(n_rows, n_features)) * np.linspace(5, 0.5, n_features) + 100
+
+
+def test_chunked_fit_matches_in_memory_pca():
+    """Chunk boundaries don't change the mean, eigenvalues or components."""
+    vectors = _vectors()
+    _, expected = fit_transform_pca_numpy(vectors)
+    mean, components, eigenvalues = fit_pca_streaming(vectors, chunk_size=64)
+
+    np.testing.assert_allclose(mean, expected["mean"])
+    np.testing.assert_allclose(eigenvalues, expected["explained_variance"])
+    # Eigenvectors are defined up to sign
+    signs = np.sign(np.sum(components * expected["components"], axis=0))
+    np.testing.assert_allclose(components * signs, expected["components"], atol=1e-8)
+
+
+def test_streamed_projection_matches_in_memory_pca(tmp_path):
+    """Chunks projected from a memory map into a store equal the in-memory result."""
+    vectors = _vectors()
+    save_vector_store(vectors, ["a"] * len(vectors), str(tmp_path / "vectors.npy"))
+    stored, categories = load_vector_store(str(tmp_path / "vectors.npy"))
+    expected, _ = fit_transform_pca_numpy(np.asarray(stored, dtype=np.float64))
+
+    output_path = str(tmp_path / "pca.npy")
+    mean, components, _ = fit_pca_streaming(stored, chunk_size=64)
+    project_pca_streaming(stored, categories, mean, components, output_path, chunk_size=64)
+    projected, projected_categories = load_vector_store(output_path)
+
+    signs = np.sign(np.sum(projected * expected, axis=0))
+    np.testing.assert_allclose(projected * signs, expected, rtol=1e-4, atol=1e-4)
+    assert projected_categories == categories
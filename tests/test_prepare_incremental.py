@@ -0,0 +1,45 @@
+"""
+Tests for incremental data preparation.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+from src.utils import config
+from src.workflows.prepare import _prepare_in_memory
+from src.workflows.prepare_incremental import prepare_incremental
+
+SENTENCES = [
+    "really great quality", "arrived broken and late", "worth every penny",
+    "would not buy again", "exceeded my expectations", "cheap and flimsy",
+]
+
+
+@pytest.fixture
+def output_dir(tmp_path, monkeypatch):
+    """Point every input and output path at a temporary directory."""
+    monkeypatch.setattr(config, "INPUT_CSV_PATH", str(tmp_path / "sentences.csv"))
+    monkeypatch.setattr(config, "OUTPUT_VECTORS_PATH", str(tmp_path / "vectors.npy"))
+    monkeypatch.setattr(config, "OUTPUT_WORD2VEC_DIR", str(tmp_path / "word2vec"))
+    monkeypatch.setattr(config, "OUTPUT_RUNTIME_PATH", str(tmp_path / "runtime.txt"))
+    monkeypatch.setattr(config, "WORD2VEC_EPOCHS", 2)
+    monkeypatch.setattr(config, "WORD2VEC_WORKERS", 1)
+    return tmp_path
+
+
+def _write_csv(sentences, categories):
+    pd.DataFrame({"category": categories, "sentence": sentences}).to_csv(
+        config.INPUT_CSV_PATH, index=False
+    )
+
+
+def test_numeric_categories_append_to_store(output_dir):
+    """Appended rows keep the stored ones even though the store reads labels back as text."""
+    _write_csv(SENTENCES[:4], [1, 2, 1, 2])
+    stored_vectors, _ = _prepare_in_memory("memory", "word2vec")
+
+    _write_csv(SENTENCES, [1, 2, 1, 2, 3, 3])
+    vectors, categories = prepare_incremental("word2vec")
+
+    assert "appended to store" in (output_dir / "runtime.txt").read_text()
+    assert categories == ["1", "2", "1", "2", "3", "3"]
+    np.testing.assert_array_equal(vectors[:4], stored_vectors)
@@ -0,0 +1,62 @@
+"""
+Tests for the content-addressed stage cache.
+"""
+import pytest
+from src.utils import config
+from src.workflows.stage_cache import cached_stage
+
+
+@pytest.fixture
+def stage(tmp_path, monkeypatch):
+    """A cached stage copying an input file, with a list recording each real run."""
+    monkeypatch.setattr(config, "OUTPUT_MANIFEST_PATH", str(tmp_path / "manifest.json"))
+    monkeypatch.setattr(config, "OUTPUT_RUNTIME_PATH", str(tmp_path / "runtime.txt"))
+    monkeypatch.setattr(config, "N_COMPONENTS", 3)
+    source, target = tmp_path / "input.txt", tmp_path / "output.txt"
+    source.write_text("first")
+    runs = []
+
+    @cached_stage("copy", inputs=lambda args: [str(source)],
+                  outputs=lambda args: [str(target)], config_prefixes=("N_COMPONENTS",))
+    def copy(suffix=""):
+        runs.append(suffix)
+        target.write_text(source.read_text() + suffix)
+
+    return copy, runs, source, target
+
+
+def test_unchanged_stage_is_skipped(stage):
+    """A second call with the same inputs, arguments and config reuses the outputs."""
+    copy, runs, _, _ = stage
+    copy()
+    copy()
+    assert runs == [""]
+
+
+@pytest.mark.parametrize("change", ["input", "argument", "config", "deleted output"])
+def test_changes_rerun_the_stage(stage, monkeypatch, change):
+    """Input content, call arguments, config values and missing outputs all miss."""
+    copy, runs, source, target = stage
+    copy()
+    suffix = ""
+    if change == "input":
+        source.write_text("second, longer")
+    elif change == "argument":
+        suffix = "!"
+    elif change == "config":
+        monkeypatch.setattr(config, "N_COMPONENTS", 2)
+    else:
+        target.unlink()
+    copy(suffix)
+    assert len(runs) == 2
+    copy(suffix)
+    assert len(runs) == 2
+
+
+def test_force_reruns_a_cached_stage(stage):
+    """force (--force on the command line) bypasses a hit without invalidating it."""
+    copy, runs, _, _ = stage
+    copy()
+    copy(force=True)
+    assert runs == ["", ""]
+    assert copy.lookup()[0]
@@ -0,0 +1,48 @@
+"""
+Tests for the binary vector store.
+"""
+import numpy as np
+import pytest
+from src.data.vector_store import VectorStoreWriter, load_vector_store, save_vector_store
+
+
+def test_streamed_batches_match_saved_store(tmp_path):
+    """Batches written one by one load back as one matrix with the final row count."""
+    path = str(tmp_path / "vectors.npy")
+    batches = [np.random.default_rng(seed).random((n, 8)) for seed, n in enumerate((3, 1, 5))]
+    with VectorStoreWriter(path) as writer:
+        for index, batch in enumerate(batches):
+            writer.append(batch, [f"c{index}"] * len(batch))
+
+    vectors, categories = load_vector_store(path)
+    np.testing.assert_array_equal(vectors, np.vstack(batches).astype(np.float32))
+    assert categories == ["c0"] * 3 + ["c1"] + ["c2"] * 5
+
+
+def test_append_rewrites_header_in_place(tmp_path):
+    """Appending to a closed store grows its shape without moving the stored rows."""
+    path = str(tmp_path / "vectors.npy")
+    first = np.arange(12, dtype=np.float32).reshape(3, 4)
+    save_vector_store(first, ["a", "b", "c"], path)
+    size_before = (tmp_path / "vectors.npy").stat().st_size
+
+    # Enough rows that the row count gains several digits in the header
+    second = np.ones((100_000, 4), dtype=np.float32)
+    with VectorStoreWriter(path, append=True) as writer:
+        writer.append(second, ["d"] * len(second))
+
+    vectors, categories = load_vector_store(path)
+    assert vectors.shape == (100_003, 4)
+    np.testing.assert_array_equal(vectors[:3], first)
+    np.testing.assert_array_equal(vectors[3:], second)
+    assert categories[:3] == ["a", "b", "c"] and len(categories) == 100_003
+    assert (tmp_path / "vectors.npy").stat().st_size == size_before + second.nbytes
+
+
+def test_append_rejects_other_widths(tmp_path):
+    """Rows of another width can't be appended to an existing store."""
+    path = str(tmp_path / "vectors.npy")
+    save_vector_store(np.zeros((2, 4)), ["a", "b"], path)
+    with VectorStoreWriter(path, append=True) as writer:
+        with pytest.raises(ValueError):
+            writer.append(np.zeros((1, 5)), ["c"])